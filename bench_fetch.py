@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк загрузки страниц источников: новая ClientSession на каждый запрос
+(как было) против общей сессии HttpFetcher с пулом соединений, а также
+повторное обновление страниц полной загрузкой и условным запросом
+(If-None-Match, ответ 304 без тела).
+
+Вместо Mail.ru и Rambler поднимается локальный HTTP-сервер, поэтому разница
+показывает только стоимость TCP-соединения и создания сессии; для реальных
+HTTPS-источников к ней добавляются TLS-рукопожатие и DNS-запрос.
+"""
+
+import asyncio
+import statistics
+import time
+
+import aiohttp
+from aiohttp import web
+
+from bench_parse import MAIL_RU_PAGE
+from html_extract import extract_mail_ru, run_parser
+from http_fetcher import HttpFetcher
+
+PAGE = "<html><body><div class='article__item'>" + "<p>Текст гороскопа.</p>" * 2000 + "</div></body></html>"
+
+
+SENT = {"bytes": 0}
+
+
+async def _start_server(port: int = 0):
+    async def page(request):
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def article(request):
+        # Страница источника с валидатором, как у Mail.ru/Rambler
+        if request.headers.get("If-None-Match") == '"today"':
+            return web.Response(status=304)
+        SENT["bytes"] += len(MAIL_RU_PAGE.encode("utf-8"))
+        return web.Response(text=MAIL_RU_PAGE, content_type="text/html", headers={"ETag": '"today"'})
+
+    app = web.Application()
+    app.router.add_get("/article/{sign}/", article)
+    app.router.add_get("/{sign}/", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _fetch_new_session(url: str) -> str:
+    """Прежний вариант: сессия создается и закрывается на каждый запрос"""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        async with session.get(url, ssl=False) as resp:
+            return await resp.text()
+
+
+async def _measure(name: str, fetch, base: str, n: int):
+    latencies = []
+    started = time.perf_counter()
+    for i in range(n):
+        # Как в parse_horoscopes: два источника параллельно
+        t = time.perf_counter()
+        await asyncio.gather(fetch(f"{base}/mail{i % 12}/"), fetch(f"{base}/rambler{i % 12}/"))
+        latencies.append((time.perf_counter() - t) * 1000)
+    total = time.perf_counter() - started
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<26} всего {total * 1000:8.1f} мс  медиана {statistics.median(latencies):6.2f} мс  p95 {p95:6.2f} мс")
+    return statistics.median(latencies)
+
+
+async def _bench_refresh(fetcher: HttpFetcher, base: str, rounds: int = 5):
+    """Обновление 12 знаков: полная загрузка и разбор против условного запроса"""
+    async def parse(html):
+        return await run_parser(extract_mail_ru, html)
+
+    async def full(url):
+        return await parse(await fetcher.fetch(url))
+
+    async def conditional(url):
+        return await fetcher.fetch_parsed(url, parse)
+
+    print("\n" + "=" * 80)
+    print(f"ОБНОВЛЕНИЕ 12 ЗНАКОВ x{rounds} (страница {len(MAIL_RU_PAGE) // 1024} КБ)")
+    print("=" * 80)
+    for name, refresh in (("Полная загрузка и разбор", full), ("Условный запрос (304)", conditional)):
+        # Первый проход заполняет валидаторы и не входит в замер
+        await asyncio.gather(*(refresh(f"{base}/article/{i}/") for i in range(12)))
+        SENT["bytes"] = 0
+        latencies = []
+        for _ in range(rounds):
+            t = time.perf_counter()
+            await asyncio.gather(*(refresh(f"{base}/article/{i}/") for i in range(12)))
+            latencies.append((time.perf_counter() - t) * 1000)
+        print(
+            f"{name:<26} {SENT['bytes'] / rounds / 1024:8.0f} КБ на обновление  "
+            f"медиана {statistics.median(latencies):7.1f} мс"
+        )
+
+
+async def bench_fetch(n: int = 300):
+    runner, base = await _start_server()
+    fetcher = HttpFetcher()
+    try:
+        print("=" * 80)
+        print(f"ЗАГРУЗКА ИСТОЧНИКОВ, {n} пар запросов к локальному серверу")
+        print("=" * 80)
+        old = await _measure("Новая сессия на запрос", _fetch_new_session, base, n)
+        await fetcher.start()
+        new = await _measure("Общая сессия (пул)", fetcher.fetch, base, n)
+        print(f"\nМедиана быстрее в x{old / new:.1f}")
+
+        await _bench_refresh(fetcher, base)
+    finally:
+        await fetcher.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(bench_fetch())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк подстраховки медленной модели на локальной имитации Groq.
+
+Основная модель отвечает с медианой 300 мс и тяжелым хвостом (логнормальное
+распределение), запасная — с медианой 80 мс. Задержки уменьшены примерно
+в 10 раз относительно реальных, чтобы прогон занимал секунды; важна форма
+распределения. Сравниваются перцентили времени ответа без подстраховки и с
+дублированием запроса после LLM_HEDGE_AFTER.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+from groq import AsyncGroq
+
+from config import Config
+from fake_groq import FakeGroqServer, lognormal
+from horoscope_render import render_horoscope
+from horoscope_service import JSON_SYSTEM_PROMPT, HoroscopeService
+from llm_scheduler import INTERACTIVE, LLMScheduler
+
+REQUESTS = 200
+CONCURRENCY = 20
+HEDGE_AFTER = 0.6
+MESSAGES = [
+    {"role": "system", "content": JSON_SYSTEM_PROMPT},
+    {"role": "user", "content": "Гороскоп для Льва"},
+]
+
+
+def _percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def _run(hedge_after: float):
+    server = FakeGroqServer({
+        Config.GROQ_MODEL: lognormal(0.3, 0.9, random.Random(1)),
+        Config.LLM_HEDGE_MODEL: lognormal(0.08, 0.3, random.Random(2)),
+    })
+    base_url = await server.start()
+    service = HoroscopeService()
+    service.groq_client = AsyncGroq(api_key="bench", base_url=base_url, max_retries=0)
+    service.llm = LLMScheduler(rpm=0, tpm=0, concurrency=CONCURRENCY * 2)
+    render = lambda data: render_horoscope(data, "Лев", "10.03.2024", 7)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await service._complete_hedged(MESSAGES, None, INTERACTIVE, render)
+            latencies.append(time.perf_counter() - started)
+
+    saved, Config.LLM_HEDGE_AFTER = Config.LLM_HEDGE_AFTER, hedge_after
+    try:
+        await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    finally:
+        Config.LLM_HEDGE_AFTER = saved
+        await service.groq_client.close()
+        await server.close()
+    return latencies, service.stats()["llm_today"]
+
+
+def bench_hedge():
+    print("=" * 80)
+    print(f"ПОДСТРАХОВКА МОДЕЛИ ({REQUESTS} запросов, параллельно {CONCURRENCY})")
+    print("=" * 80)
+    for name, hedge_after in (("Без подстраховки", 0), (f"Дублирование через {HEDGE_AFTER} с", HEDGE_AFTER)):
+        latencies, today = asyncio.run(_run(hedge_after))
+        ms = [latency * 1000 for latency in latencies]
+        print(
+            f"{name:<28} p50 {statistics.median(ms):6.0f} мс   p95 {_percentile(ms, 0.95):6.0f} мс   "
+            f"p99 {_percentile(ms, 0.99):6.0f} мс   max {max(ms):6.0f} мс   "
+            f"дублировано {today['hedged']}"
+        )
+
+
+if __name__ == "__main__":
+    bench_hedge()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк загрузки интерпретаций: время импорта и RSS процесса.
+
+Каждый сценарий запускается в отдельном процессе, чтобы импорт был честным.
+"Словари в коде" — тексты создаются при импорте модуля; хранилище загружает
+те же словари при первом обращении и строит таблицу выбора текста ячейки.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+SCENARIOS = {
+    "Словари в коде (import interpretations_data)": "import interpretations_data",
+    "Хранилище: только import": "import interpretations",
+    "Хранилище: import + открытие": "import interpretations; interpretations.get_store()",
+    "Хранилище: import + все ячейки": (
+        "import interpretations\n"
+        "s = interpretations.get_store()\n"
+        "texts = [s.matrix_text(d, c, g) for d in range(1, 10) for c in range(25) for g in ('women', 'men')]"
+    ),
+}
+
+CHILD = '''
+import json, time
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+import config  # общая зависимость, не входит в замер
+before = rss_kb()
+started = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "rss_kb": rss_kb() - before}}))
+'''
+
+
+def run(code: str, rounds: int = 5) -> dict:
+    # Как в обычном запуске: модули грузятся из .pyc, а не компилируются заново
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    best = None
+    for _ in range(rounds):
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD.format(code=code)],
+            capture_output=True, text=True, check=True, env=env,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        if best is None or result["ms"] < best["ms"]:
+            best = result
+    return best
+
+
+def bench_interpretations():
+    # Прогрев: собрать .pyc, чтобы измерять обычный запуск
+    run(SCENARIOS["Хранилище: import + открытие"], rounds=1)
+    run(SCENARIOS["Словари в коде (import interpretations_data)"], rounds=1)
+
+    print("=" * 70)
+    print("ЗАГРУЗКА ИНТЕРПРЕТАЦИЙ (лучшее из 5 запусков)")
+    print("=" * 70)
+    for name, code in SCENARIOS.items():
+        result = run(code)
+        print(f"{name:<48} {result['ms']:7.2f} мс  RSS +{result['rss_kb']} КБ")
+
+
+if __name__ == "__main__":
+    bench_interpretations()
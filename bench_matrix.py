@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк расчета матрицы: поиск в предрассчитанной таблице против прямого расчета
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from matrix_calculator import MatrixCalculator
+
+
+def _sample_dates(n: int, seed: int = 42):
+    rnd = random.Random(seed)
+    start = date(1900, 1, 1)
+    span = (date(2100, 12, 31) - start).days
+    return [(start + timedelta(days=rnd.randint(0, span))).strftime("%d.%m.%Y") for _ in range(n)]
+
+
+def _bench(name: str, fn, dates, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for d in dates:
+            fn(d)
+        best = min(best, time.perf_counter() - started)
+    per_call = best / len(dates) * 1e6
+    print(f"{name:<28} {best * 1000:8.1f} мс  ({per_call:.2f} мкс/дата)")
+    return best
+
+
+def bench_matrix(n: int = 100_000):
+    dates = _sample_dates(n)
+
+    started = time.perf_counter()
+    table_calc = MatrixCalculator()
+    print(f"Загрузка таблицы: {(time.perf_counter() - started) * 1000:.1f} мс")
+    direct_calc = MatrixCalculator(use_table=False)
+
+    print("=" * 60)
+    print(f"РАСЧЕТ МАТРИЦЫ, {n} дат")
+    print("=" * 60)
+    direct = _bench("Прямой расчет", direct_calc.calculate_matrix, dates)
+    lookup = _bench("Таблица (calculate_matrix)", table_calc.calculate_matrix, dates)
+    parsed = [tuple(int(p) for p in d.split(".")) for d in dates]
+    raw = _bench("Таблица (lookup)", lambda p: table_calc.table.lookup(*p), parsed)
+    started = time.perf_counter()
+    direct_calc.calculate_matrix_batch(dates)
+    batch = time.perf_counter() - started
+    print(f"{'Пакетный расчет (NumPy)':<28} {batch * 1000:8.1f} мс  ({batch / n * 1e6:.2f} мкс/дата)")
+    print(f"\nУскорение calculate_matrix: x{direct / lookup:.1f}, чистый lookup: x{direct / raw:.1f}, "
+          f"пакетный расчет: x{direct / batch:.1f}")
+
+
+if __name__ == "__main__":
+    bench_matrix()
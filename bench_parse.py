@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк разбора страниц источников: BeautifulSoup по всей странице на
+event loop (как было) против потокового извлечения в пуле потоков.
+
+Страницы собираются по образцу Mail.ru и Rambler: большой <head> со
+скриптами и стилями, навигация, статья и длинный подвал со ссылками.
+Это синтетические фикстуры (из песочницы нет доступа к источникам), но
+размер и расположение статьи близки к реальным страницам.
+
+Время простоя event loop — максимальная задержка тикера, который
+просыпается каждую миллисекунду, пока идет разбор 24 страниц (12 знаков,
+2 источника).
+"""
+
+import asyncio
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+
+from html_extract import extract_mail_ru, extract_rambler, run_parser
+
+TEXT = "Сегодня звезды благоприятны для новых начинаний, &laquo;удача&raquo; на вашей стороне. "
+
+
+def _page(article: str) -> str:
+    head = "".join(
+        f"<script>window.__data{i} = {{\"items\": [{', '.join(str(j) for j in range(200))}]}};</script>"
+        f"<style>.c{i} {{ color: #{i:06x}; margin: 0 auto; }}</style>"
+        for i in range(120)
+    )
+    nav = "".join(f"<li><a href='/n/{i}/'>Раздел {i}</a></li>" for i in range(300))
+    footer = "".join(
+        f"<div class='card'><a href='/news/{i}/'><img src='/i/{i}.jpg'><span>{TEXT}</span></a></div>"
+        for i in range(600)
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>Гороскоп</title>{head}</head><body>"
+        f"<header><ul>{nav}</ul></header><main>{article}</main><footer>{footer}</footer></body></html>"
+    )
+
+
+MAIL_RU_PAGE = _page(
+    "<div class='article__item article__item_alignment_left article__item_html'>"
+    + "".join(f"<p>{TEXT * 3}<b>{TEXT}</b></p>" for _ in range(4))
+    + "</div>"
+)
+RAMBLER_PAGE = _page(
+    "<div data-mt-part='article'><div class='_1'><p>" + TEXT * 4 + "</p>"
+    + "".join(f"<p>{TEXT}</p>" for _ in range(5))
+    + "</div></div>"
+)
+PAGES = [(MAIL_RU_PAGE, extract_mail_ru), (RAMBLER_PAGE, extract_rambler)] * 12
+
+
+def _soup_mail_ru(html):
+    soup = BeautifulSoup(html, "html.parser")
+    article = soup.find("div", class_="article__item")
+    return " ".join(p.get_text(strip=True) for p in article.find_all("p"))
+
+
+def _soup_rambler(html):
+    soup = BeautifulSoup(html, "html.parser")
+    return soup.find("div", {"data-mt-part": "article"}).find("p").get_text(strip=True)
+
+
+SOUP = {extract_mail_ru: _soup_mail_ru, extract_rambler: _soup_rambler}
+
+
+def _per_page(func, html, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        func(html)
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+async def _stall(parse_all):
+    """Максимальная задержка тикера event loop и общее время разбора"""
+    stop = False
+    worst = 0.0
+
+    async def ticker():
+        nonlocal worst
+        while not stop:
+            t = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, (time.perf_counter() - t) * 1000 - 1)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    await parse_all()
+    total = (time.perf_counter() - started) * 1000
+    stop = True
+    await tick
+    return worst, total
+
+
+async def _on_loop():
+    for html, extract in PAGES:
+        SOUP[extract](html)
+        await asyncio.sleep(0)
+
+
+async def _in_pool():
+    await asyncio.gather(*(run_parser(extract, html) for html, extract in PAGES))
+
+
+def bench_parse():
+    for html, extract in PAGES[:2]:
+        assert extract(html) == SOUP[extract](html)
+
+    print("=" * 80)
+    print(f"РАЗБОР СТРАНИЦ (Mail.ru {len(MAIL_RU_PAGE) // 1024} КБ, Rambler {len(RAMBLER_PAGE) // 1024} КБ)")
+    print("=" * 80)
+    for name, html, extract in (("Mail.ru", MAIL_RU_PAGE, extract_mail_ru), ("Rambler", RAMBLER_PAGE, extract_rambler)):
+        old = _per_page(SOUP[extract], html)
+        new = _per_page(extract, html)
+        print(f"{name:<8} BeautifulSoup {old:7.1f} мс   потоковое извлечение {new:6.1f} мс   x{old / new:.1f}")
+
+    print(f"\nРазбор {len(PAGES)} страниц: максимальный простой event loop / общее время")
+    for name, parse_all in (("BeautifulSoup на event loop", _on_loop), ("Извлечение в пуле потоков", _in_pool)):
+        worst, total = asyncio.run(_stall(parse_all))
+        print(f"  {name:<30} {worst:7.1f} мс / {total:7.1f} мс")
+
+
+if __name__ == "__main__":
+    bench_parse()
@@ -0,0 +1,204 @@
+"""
+Кеши общего назначения для бота
+"""
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from config import Config
+
+_horoscope_cache: Optional["DailyCache"] = None
+_source_cache: Optional["DailyCache"] = None
+
+
+class LRUCache:
+    """Ограниченный по размеру LRU-кеш со счетчиками попаданий и промахов"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Возвращает значение и отмечает его как недавно использованное"""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение, вытесняя самые давно использованные записи"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def incr(self, key: Hashable, amount: int = 1) -> int:
+        """Увеличивает счетчик под ключом (не влияет на hits/misses)"""
+        value = self._data.get(key, 0) + amount
+        self.set(key, value)
+        return value
+
+    def items(self):
+        return list(self._data.items())
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Метрики кеша"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+
+class DailyCache(LRUCache):
+    """
+    LRU-кеш, записи которого живут до конца текущих суток (и не дольше ttl).
+
+    При смене дня все устаревшие записи удаляются разом, поэтому в
+    долгоживущем процессе память не растет: в кеше только сегодняшние ключи,
+    и их число ограничено maxsize.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], datetime] = datetime.now):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._clock = clock
+        self._day = clock().date()
+        self.expired = 0
+
+    def _expires_at(self, now: datetime) -> float:
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        expires = midnight.timestamp()
+        if self.ttl is not None:
+            expires = min(expires, now.timestamp() + self.ttl)
+        return expires
+
+    def _rollover(self, now: datetime) -> None:
+        """При смене дня удаляет все устаревшие записи"""
+        if now.date() == self._day:
+            return
+        self._day = now.date()
+        stamp = now.timestamp()
+        for key in [k for k, (_, expires) in self._data.items() if expires <= stamp]:
+            del self._data[key]
+            self.expired += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = self._clock()
+        self._rollover(now)
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires = entry
+        if expires <= now.timestamp():
+            del self._data[key]
+            self.expired += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = self._clock()
+        self._rollover(now)
+        super().set(key, (value, self._expires_at(now)))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[1] > self._clock().timestamp()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        stats = super().stats()
+        stats["expired"] = self.expired
+        return stats
+
+
+class SingleFlight:
+    """
+    Объединение одновременных запросов по ключу.
+
+    Пока по ключу выполняется вычисление, остальные вызовы с тем же ключом
+    не запускают свое, а ждут общий результат (или исключение). Отмена
+    одного ожидающего не отменяет вычисление для остальных.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Future"] = {}
+        self.flights = 0
+        self.coalesced = 0
+
+    def start(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> "asyncio.Future":
+        """Запускает вычисление по ключу (или присоединяется к идущему), не дожидаясь его"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.flights += 1
+        else:
+            self.coalesced += 1
+        return task
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.start(key, factory))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+        }
+
+
+def get_horoscope_cache() -> DailyCache:
+    """Общий для всех сервисов гороскопов кеш готовых прогнозов"""
+    global _horoscope_cache
+    if _horoscope_cache is None:
+        _horoscope_cache = DailyCache(Config.HOROSCOPE_CACHE_SIZE, Config.HOROSCOPE_CACHE_TTL or None)
+    return _horoscope_cache
+
+
+def get_source_cache() -> DailyCache:
+    """Общий кеш опоздавших к дедлайну текстов источников: (источник, знак) -> текст"""
+    global _source_cache
+    if _source_cache is None:
+        _source_cache = DailyCache(Config.HOROSCOPE_CACHE_SIZE, Config.PARSE_LATE_TTL or None)
+    return _source_cache
@@ -0,0 +1,120 @@
+"""
+Учет здоровья источников гороскопов.
+
+Для каждого источника (хоста) ведется CircuitBreaker: после нескольких
+неудачных запросов подряд источник пропускается на время охлаждения, затем
+пробуется одним запросом. Таймаут запроса подбирается по p95 времени
+ответа последних успешных запросов, поэтому медленный или мертвый источник
+не добавляет по 10 секунд к каждому холодному гороскопу.
+"""
+import logging
+import math
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from config import Config
+
+log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Минимум замеров, после которого таймаут считается по p95
+MIN_SAMPLES = 5
+
+_breakers: Dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = Config.SOURCE_FAILURE_THRESHOLD,
+        cooldown: float = Config.SOURCE_COOLDOWN,
+        window: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._latencies: "deque[float]" = deque(maxlen=window)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.skipped = 0
+        self._probe = False
+
+    def allow(self) -> bool:
+        """Можно ли сейчас обращаться к источнику"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and self._clock() - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            self._probe = False
+        if self.state == HALF_OPEN and not self._probe:
+            # После охлаждения пропускаем один пробный запрос
+            self._probe = True
+            return True
+        self.skipped += 1
+        return False
+
+    def record_success(self, latency: float) -> None:
+        self._latencies.append(latency)
+        if self.state != CLOSED:
+            log.info(f"💚 Источник {self.name} снова доступен")
+        self.state = CLOSED
+        self.failures = 0
+        self._probe = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                log.warning(
+                    f"🔌 Источник {self.name} отключен на {self.cooldown:.0f} с "
+                    f"после {self.failures} ошибок подряд"
+                )
+            self.state = OPEN
+            self.opened_at = self._clock()
+            self._probe = False
+
+    def record_cancel(self) -> None:
+        """Запрос отменен: пробный запрос можно повторить"""
+        self._probe = False
+
+    def p95(self) -> Optional[float]:
+        if len(self._latencies) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(len(ordered) * 0.95) - 1]
+
+    def timeout(self, limit: float) -> float:
+        """Таймаут запроса: p95 с запасом, но не больше limit"""
+        p95 = self.p95()
+        if p95 is None:
+            return limit
+        return min(limit, max(Config.SOURCE_TIMEOUT_MIN, p95 * Config.SOURCE_TIMEOUT_FACTOR))
+
+    def stats(self) -> Dict[str, object]:
+        p95 = self.p95()
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "p95": round(p95, 3) if p95 is not None else None,
+        }
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Общий для процесса CircuitBreaker источника"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, object]]:
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
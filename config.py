@@ -7,3 +7,91 @@ class Config:
     BOT_TOKEN      = os.getenv("BOT_TOKEN")
     GROQ_API_KEY   = os.getenv("GROQ_API_KEY")
     GROQ_MODEL     = os.getenv("GROQ_MODEL", "mixtral-8x7b-32768")
+
+    # Бинарная таблица предрассчитанных матриц (пересобирается автоматически)
+    MATRIX_TABLE_PATH = os.getenv(
+        "MATRIX_TABLE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "matrix_table.bin"),
+    )
+
+    # Кеш отрендеренных интерпретаций (количество сигнатур матриц)
+    INTERPRETATION_CACHE_SIZE = int(os.getenv("INTERPRETATION_CACHE_SIZE", "2048"))
+
+    # Пул HTTP-соединений к источникам гороскопов
+    HTTP_POOL_LIMIT        = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+    HTTP_LIMIT_PER_HOST    = int(os.getenv("HTTP_LIMIT_PER_HOST", "4"))
+    HTTP_DNS_CACHE_TTL     = int(os.getenv("HTTP_DNS_CACHE_TTL", "600"))
+    HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))
+
+    # Кеш готовых гороскопов (общий для сервисов); записи живут до конца дня,
+    # HOROSCOPE_CACHE_TTL дополнительно ограничивает срок жизни в секундах (0 — без ограничения)
+    HOROSCOPE_CACHE_SIZE = int(os.getenv("HOROSCOPE_CACHE_SIZE", "256"))
+    HOROSCOPE_CACHE_TTL  = int(os.getenv("HOROSCOPE_CACHE_TTL", "0"))
+
+    # Прогрев гороскопов всех знаков после полуночи
+    PREWARM_ENABLED     = os.getenv("PREWARM_ENABLED", "1") == "1"
+    PREWARM_CONCURRENCY = int(os.getenv("PREWARM_CONCURRENCY", "3"))
+    PREWARM_DELAY       = int(os.getenv("PREWARM_DELAY", "30"))
+    # Прогревать AI-гороскопы для всех чисел души (12 знаков × 12 чисел)
+    PREWARM_SOUL_NUMBERS = os.getenv("PREWARM_SOUL_NUMBERS", "1") == "1"
+
+    # Кеш готовых гороскопов на диске (SQLite); пустое значение отключает его.
+    # Переживает перезапуск, только если путь указывает на постоянный том
+    # (на Render — подключенный disk, см. RENDER_DEPLOY.md)
+    HOROSCOPE_DB_PATH = os.getenv(
+        "HOROSCOPE_DB_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "horoscopes.sqlite3"),
+    )
+
+    # Потоки для разбора HTML-страниц источников вне event loop
+    PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+
+    # Лимит тела ответа источника и число страниц с сохраненными ETag/Last-Modified
+    HTTP_MAX_BODY              = int(os.getenv("HTTP_MAX_BODY", str(768 * 1024)))
+    HTTP_VALIDATOR_CACHE_SIZE  = int(os.getenv("HTTP_VALIDATOR_CACHE_SIZE", "128"))
+
+    # Отключение неотвечающих источников и таймауты по p95 времени ответа
+    SOURCE_FAILURE_THRESHOLD = int(os.getenv("SOURCE_FAILURE_THRESHOLD", "3"))
+    SOURCE_COOLDOWN          = float(os.getenv("SOURCE_COOLDOWN", "300"))
+    SOURCE_TIMEOUT_MIN       = float(os.getenv("SOURCE_TIMEOUT_MIN", "2"))
+    SOURCE_TIMEOUT_FACTOR    = float(os.getenv("SOURCE_TIMEOUT_FACTOR", "3"))
+
+    # Общий дедлайн парсинга источников; опоздавшие результаты сохраняются в фоне
+    # и используются следующим парсингом знака в течение PARSE_LATE_TTL секунд
+    PARSE_DEADLINE   = float(os.getenv("PARSE_DEADLINE", "4"))
+    PARSE_MERGE_LATE = os.getenv("PARSE_MERGE_LATE", "1") == "1"
+    PARSE_LATE_TTL   = int(os.getenv("PARSE_LATE_TTL", "600"))
+
+    # Общий лимит одновременных запросов ко всем источникам гороскопов
+    SOURCE_CONCURRENCY = int(os.getenv("SOURCE_CONCURRENCY", "8"))
+
+    # Пакетная генерация AI-гороскопов: вариантов в одном запросе и лимит токенов ответа
+    LLM_BATCH_SIZE       = int(os.getenv("LLM_BATCH_SIZE", "4"))
+    LLM_BATCH_MAX_TOKENS = int(os.getenv("LLM_BATCH_MAX_TOKENS", "6000"))
+
+    # Потоковый вывод AI-гороскопа: статусное сообщение правится не чаще раза в интервал (с)
+    HOROSCOPE_STREAMING  = os.getenv("HOROSCOPE_STREAMING", "1") == "1"
+    STREAM_EDIT_INTERVAL = float(os.getenv("STREAM_EDIT_INTERVAL", "1"))
+
+    # Лимиты Groq: запросы и токены в минуту (0 — без ограничения), параллельность,
+    # повторы после ответа 429 и пауза, если Retry-After не указан (с)
+    LLM_RPM         = float(os.getenv("LLM_RPM", "30"))
+    LLM_TPM         = float(os.getenv("LLM_TPM", "20000"))
+    LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+    LLM_RETRIES     = int(os.getenv("LLM_RETRIES", "1"))
+    LLM_RETRY_DELAY = float(os.getenv("LLM_RETRY_DELAY", "2"))
+
+    # Структурированный AI-гороскоп: модель отвечает JSON, рамки и бары рисует бот.
+    # Кириллица дорога в токенах: JSON из семи разделов бывает длиннее 1000 токенов,
+    # а обрезанный ответ не разбирается и заменяется базовым гороскопом
+    LLM_STRUCTURED            = os.getenv("LLM_STRUCTURED", "1") == "1"
+    LLM_STRUCTURED_MAX_TOKENS = int(os.getenv("LLM_STRUCTURED_MAX_TOKENS", "1500"))
+
+    # Подстраховка медленной модели: через LLM_HEDGE_AFTER секунд без ответа (0 — выключено)
+    # тот же запрос отправляется быстрой модели, используется первый корректный ответ
+    LLM_HEDGE_AFTER = float(os.getenv("LLM_HEDGE_AFTER", "4"))
+    LLM_HEDGE_MODEL = os.getenv("LLM_HEDGE_MODEL", "llama-3.1-8b-instant")
+
+    # AI-гороскоп для тех же текстов источников используется повторно без запроса к модели;
+    # сколько дней хранить такие ответы (0 — выключено)
+    LLM_REUSE_DAYS = int(os.getenv("LLM_REUSE_DAYS", "3"))
@@ -0,0 +1,144 @@
+"""
+Общие заготовки тестов: подменные часы, клиент Groq и сервис гороскопов.
+
+Под pytest каждый тест получает свои общие кеши, планировщик запросов к Groq
+и реестр источников, кеш на диске отключается, а значения Config после теста
+восстанавливаются. Тестовые файлы по-прежнему запускаются и как скрипты:
+заготовки импортируются из conftest напрямую.
+"""
+import asyncio
+import json
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import pytest
+
+import cache
+import disk_cache
+import llm_scheduler
+import sources
+from cache import get_horoscope_cache
+from config import Config
+from fake_groq import HOROSCOPE
+from horoscope_service import HoroscopeService
+from llm_scheduler import LLMScheduler
+
+# Текст источника по умолчанию для сервиса с подменным парсингом
+SOURCE_TEXT = "Сегодня удачный день для новых начинаний и смелых решений."
+
+# Ответ модели: текст, фрагменты потока или исключение
+Reply = Union[str, List[str], Exception]
+
+
+class FakeClock:
+    """Часы, которые тест переводит вручную (datetime или секунды)"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeStream:
+    """Потоковый ответ Groq из заранее заданных фрагментов"""
+
+    def __init__(self, parts: List[str]):
+        self.parts = parts
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for part in self.parts:
+            await asyncio.sleep(0)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+
+
+class FakeGroq:
+    """
+    Клиент Groq в памяти. reply(params) возвращает текст ответа, список
+    фрагментов потока или исключение; по умолчанию — корректный
+    структурированный гороскоп. Все запросы сохраняются в requests.
+    """
+
+    def __init__(self, reply: Optional[Callable[[Dict], Reply]] = None, delay: float = 0.0):
+        self.reply = reply or (lambda params: json.dumps(HOROSCOPE, ensure_ascii=False))
+        self.delay = delay
+        self.requests: List[Dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **params):
+        self.requests.append(params)
+        if params.get("stream"):
+            # Groq отклоняет режим JSON вместе с потоковой передачей
+            assert "response_format" not in params, "response_format несовместим со stream"
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        reply = self.reply(params)
+        if isinstance(reply, Exception):
+            raise reply
+        parts = reply if isinstance(reply, list) else [reply]
+        if params.get("stream"):
+            return FakeStream(parts)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="".join(parts)))],
+            usage=SimpleNamespace(prompt_tokens=1000, total_tokens=1200),
+        )
+
+
+def make_service(
+    groq,
+    texts: Optional[Dict[str, str]] = None,
+    disk=None,
+    llm: Optional[LLMScheduler] = None,
+) -> HoroscopeService:
+    """
+    Сервис гороскопов с подменным клиентом Groq и текстами источников (по
+    умолчанию — один текст Mail.ru) и без лимитов планировщика. Общий кеш
+    гороскопов очищается.
+    """
+    service = HoroscopeService()
+    service.groq_client = groq
+    service._disk = disk
+    service.llm = llm or LLMScheduler(rpm=0, tpm=0, concurrency=4)
+    get_horoscope_cache().clear()
+    texts = {"Mail.ru": SOURCE_TEXT} if texts is None else dict(texts)
+
+    async def parse_horoscopes(zodiac_sign, deadline=None):
+        return dict(texts)
+
+    service.parse_horoscopes = parse_horoscopes
+    return service
+
+
+@contextmanager
+def config_override(**values) -> Iterator[None]:
+    """Временные значения Config (восстанавливаются и при ошибке)"""
+    saved = {name: getattr(Config, name) for name in values}
+    for name, value in values.items():
+        setattr(Config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(Config, name, value)
+
+
+@pytest.fixture(autouse=True)
+def isolated_globals(monkeypatch):
+    """Свои общие кеши, планировщик и реестр источников на тест; Config восстанавливается"""
+    config = {name: value for name, value in vars(Config).items() if not name.startswith("__")}
+    monkeypatch.setattr(Config, "HOROSCOPE_DB_PATH", "")
+    for module, name in (
+        (cache, "_horoscope_cache"),
+        (cache, "_source_cache"),
+        (disk_cache, "_disk_cache"),
+        (llm_scheduler, "_scheduler"),
+        (sources, "_registry"),
+    ):
+        monkeypatch.setattr(module, name, None)
+    yield
+    for name, value in config.items():
+        setattr(Config, name, value)
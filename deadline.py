@@ -0,0 +1,78 @@
+"""
+Ожидание нескольких задач с общим дедлайном.
+
+gather_with_deadline() возвращает результаты, готовые к дедлайну, не дожидаясь
+самого медленного источника. Опоздавшие задачи либо отменяются, либо
+(если передан on_late) дорабатывают в фоне и отдают результат в колбэк.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Set, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Ссылки на фоновые задачи, чтобы их не собрал сборщик мусора
+_background: Set[asyncio.Task] = set()
+
+
+def _deliver_late(name: str, on_late: Callable[[str, T], None], task: asyncio.Task) -> None:
+    _background.discard(task)
+    if task.cancelled() or task.exception() is not None or not task.result():
+        return
+    log.info(f"📨 {name}: результат пришел после дедлайна")
+    try:
+        on_late(name, task.result())
+    except Exception as e:
+        log.error(f"❌ Ошибка обработки опоздавшего результата {name}: {e}")
+
+
+async def gather_with_deadline(
+    coros: Dict[str, Awaitable[T]],
+    deadline: float,
+    on_late: Optional[Callable[[str, T], None]] = None,
+) -> Dict[str, T]:
+    """
+    Запускает задачи параллельно и ждет не дольше deadline секунд.
+
+    Returns:
+        Непустые результаты задач, завершившихся к дедлайну, в порядке coros.
+        Ошибки и пустые результаты пропускаются.
+    """
+    tasks = {name: asyncio.ensure_future(coro) for name, coro in coros.items()}
+    if not tasks:
+        return {}
+
+    try:
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    except asyncio.CancelledError:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    results: Dict[str, T] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            continue
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            log.error(f"❌ {name}: {type(task.exception()).__name__}: {task.exception()}")
+            continue
+        if task.result():
+            results[name] = task.result()
+
+    if pending:
+        late = [name for name, task in tasks.items() if task in pending]
+        log.warning(f"⏱️ Дедлайн {deadline:.1f} с: не успели {', '.join(late)}")
+        if on_late is None:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        else:
+            for name in late:
+                task = tasks[name]
+                _background.add(task)
+                task.add_done_callback(lambda t, name=name: _deliver_late(name, on_late, t))
+    return results
@@ -0,0 +1,207 @@
+"""
+Постоянный кеш готовых гороскопов на диске (SQLite в режиме WAL).
+
+Записи хранятся по ключу (тариф, знак, дата, ключ персонализации) и
+переживают перезапуск, если база лежит на постоянном томе (на Render —
+подключенный disk; файловая система бесплатного плана очищается при каждом
+деплое): после рестарта гороскопы на сегодня читаются с диска, а не
+генерируются заново. Все обращения к базе идут через
+один фоновый поток, поэтому event loop не блокируется, а запись не требует
+ожидания. При смене дня записи за прошлые дни удаляются.
+
+Во второй таблице хранятся AI-гороскопы по хешу текстов источников: если
+источники не изменились, ответ модели используется повторно (в том числе на
+следующий день), пока ему не больше reuse_days дней.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from config import Config
+
+log = logging.getLogger(__name__)
+
+_disk_cache: Optional["DiskCache"] = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS horoscopes (
+    tier            TEXT NOT NULL,
+    sign            TEXT NOT NULL,
+    date            TEXT NOT NULL,
+    personalization TEXT NOT NULL,
+    text            TEXT NOT NULL,
+    created         REAL NOT NULL,
+    PRIMARY KEY (tier, sign, date, personalization)
+) WITHOUT ROWID
+"""
+
+GENERATIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    content_key TEXT PRIMARY KEY,
+    date        TEXT NOT NULL,
+    text        TEXT NOT NULL,
+    created     REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class DiskCache:
+    def __init__(self, path: str, clock: Callable[[], datetime] = datetime.now, reuse_days: int = 3):
+        self.path = path
+        self._clock = clock
+        self.reuse_days = reuse_days
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._compacted_for: Optional[str] = None
+        self._pending: "set[Future]" = set()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    # Методы с подчеркиванием выполняются только в потоке кеша
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(SCHEMA)
+            conn.execute(GENERATIONS_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _compact_if_needed(self, today: str) -> None:
+        if self._compacted_for == today:
+            return
+        conn = self._connect()
+        deleted = conn.execute("DELETE FROM horoscopes WHERE date < ?", (today,)).rowcount
+        oldest = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=self.reuse_days)).strftime("%Y-%m-%d")
+        deleted += conn.execute("DELETE FROM generations WHERE date < ?", (oldest,)).rowcount
+        conn.commit()
+        if deleted:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            log.info(f"🧹 Кеш гороскопов на диске: удалено {deleted} устаревших записей")
+        self._compacted_for = today
+
+    def _get(self, tier: str, sign: str, date: str, personalization: str) -> Optional[str]:
+        try:
+            self._compact_if_needed(self._clock().strftime("%Y-%m-%d"))
+            row = self._connect().execute(
+                "SELECT text FROM horoscopes WHERE tier = ? AND sign = ? AND date = ? AND personalization = ?",
+                (tier, sign, date, personalization),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.error(f"❌ Ошибка чтения кеша гороскопов: {e}")
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def _put(self, tier: str, sign: str, date: str, personalization: str, text: str) -> None:
+        try:
+            self._compact_if_needed(self._clock().strftime("%Y-%m-%d"))
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO horoscopes VALUES (?, ?, ?, ?, ?, ?)",
+                (tier, sign, date, personalization, text, time.time()),
+            )
+            conn.commit()
+            self.writes += 1
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.error(f"❌ Ошибка записи кеша гороскопов: {e}")
+
+    def _get_generation(self, content_key: str) -> Optional[Tuple[str, str]]:
+        try:
+            self._compact_if_needed(self._clock().strftime("%Y-%m-%d"))
+            row = self._connect().execute(
+                "SELECT date, text FROM generations WHERE content_key = ?", (content_key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.error(f"❌ Ошибка чтения кеша гороскопов: {e}")
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], row[1]
+
+    def _put_generation(self, content_key: str, date: str, text: str) -> None:
+        try:
+            self._compact_if_needed(self._clock().strftime("%Y-%m-%d"))
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?)",
+                (content_key, date, text, time.time()),
+            )
+            conn.commit()
+            self.writes += 1
+        except sqlite3.Error as e:
+            self.errors += 1
+            log.error(f"❌ Ошибка записи кеша гороскопов: {e}")
+
+    async def get(self, tier: str, sign: str, date: str, personalization: str = "") -> Optional[str]:
+        """Читает гороскоп с диска (в фоновом потоке)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._get, tier, sign, date, personalization)
+
+    def put(self, tier: str, sign: str, date: str, text: str, personalization: str = "") -> None:
+        """Ставит запись в очередь на сохранение и сразу возвращает управление"""
+        future = self._executor.submit(self._put, tier, sign, date, personalization, text)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    async def get_generation(self, content_key: str) -> Optional[Tuple[str, str]]:
+        """Дата и текст AI-гороскопа, сгенерированного по тем же текстам источников"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._get_generation, content_key)
+
+    def put_generation(self, content_key: str, date: str, text: str) -> None:
+        """Ставит в очередь сохранение AI-гороскопа по хешу текстов источников"""
+        future = self._executor.submit(self._put_generation, content_key, date, text)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Дожидается сохранения всех поставленных в очередь записей"""
+        pending = list(self._pending)
+        if pending:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending))
+
+    def close(self) -> None:
+        """Сохраняет очередь записей и закрывает базу"""
+        self._executor.shutdown(wait=True)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "pending": len(self._pending),
+        }
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """Общий для процесса кеш на диске (None, если HOROSCOPE_DB_PATH пуст)"""
+    global _disk_cache
+    if _disk_cache is None and Config.HOROSCOPE_DB_PATH:
+        _disk_cache = DiskCache(Config.HOROSCOPE_DB_PATH, reuse_days=Config.LLM_REUSE_DAYS)
+    return _disk_cache
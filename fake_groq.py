@@ -0,0 +1,144 @@
+"""
+Локальная имитация Groq Chat Completions API для тестов и бенчмарков.
+
+Сервер отвечает на POST /openai/v1/chat/completions обычным JSON или
+потоком SSE, как настоящий API, поэтому с ним работает штатный клиент groq
+(base_url или переменная окружения GROQ_BASE_URL). Задержка ответа задается
+для каждой модели функцией-распределением, что позволяет воспроизвести
+медленную основную модель с тяжелым хвостом и быструю запасную.
+"""
+import asyncio
+import json
+import math
+import random
+from typing import Callable, Dict, Optional
+
+from aiohttp import web
+
+# Корректный структурированный гороскоп (см. horoscope_render)
+HOROSCOPE = {
+    "rating": 8,
+    "energy": {"love": 85, "career": 70, "money": 60, "health": 90, "luck": 75},
+    "astrologers": "Звезды советуют не откладывать важные разговоры.",
+    "love": "День для искренности и теплых слов.",
+    "career": "Смелые решения окупятся уже к вечеру.",
+    "health": "Больше движения и свежего воздуха.",
+    "advice": "Доверьтесь интуиции.",
+    "warning": "Не спешите с крупными тратами.",
+    "soul": "Число души усиливает внутреннее чутье.",
+}
+
+
+def horoscope_reply(model: str) -> str:
+    return json.dumps(HOROSCOPE, ensure_ascii=False)
+
+
+def fixed(seconds: float) -> Callable[[], float]:
+    return lambda: seconds
+
+
+def lognormal(median: float, sigma: float, rng: Optional[random.Random] = None) -> Callable[[], float]:
+    """Задержка с медианой median и хвостом, растущим с sigma"""
+    rng = rng or random.Random(0)
+    return lambda: rng.lognormvariate(math.log(median), sigma)
+
+
+class FakeGroqServer:
+    def __init__(
+        self,
+        latencies: Dict[str, Callable[[], float]],
+        reply: Callable[[str], str] = horoscope_reply,
+        chunks: int = 8,
+        chunk_interval: float = 0.005,
+    ) -> None:
+        """
+        Args:
+            latencies: модель -> задержка до ответа (до первого фрагмента потока)
+            reply: модель -> текст ответа
+            chunks: на сколько фрагментов делится потоковый ответ
+            chunk_interval: пауза между фрагментами потока
+        """
+        self.latencies = latencies
+        self.reply = reply
+        self.chunks = chunks
+        self.chunk_interval = chunk_interval
+        self.started: Dict[str, int] = {}
+        self.completed: Dict[str, int] = {}
+        self.cancelled: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        """Запускает сервер на свободном порту и возвращает base_url"""
+        app = web.Application()
+        app.router.add_post("/openai/v1/chat/completions", self._completions)
+        # Обработчик отменяется, когда клиент закрывает соединение
+        self._runner = web.AppRunner(app, handler_cancellation=True)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _count(self, counter: Dict[str, int], model: str) -> None:
+        counter[model] = counter.get(model, 0) + 1
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        model = body["model"]
+        if body.get("stream") and body.get("response_format"):
+            # Как настоящий API: режим JSON не поддерживает потоковую передачу
+            self._count(self.rejected, model)
+            return web.json_response({"error": {
+                "message": "response_format` does not support streaming",
+                "type": "invalid_request_error",
+            }}, status=400)
+        self._count(self.started, model)
+        try:
+            await asyncio.sleep(self.latencies[model]())
+            content = self.reply(model)
+            if body.get("stream"):
+                response = await self._stream(request, model, content)
+            else:
+                response = web.json_response({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                        "logprobs": None,
+                    }],
+                    "usage": {"prompt_tokens": 1000, "completion_tokens": len(content) // 3,
+                              "total_tokens": 1000 + len(content) // 3},
+                })
+        except asyncio.CancelledError:
+            self._count(self.cancelled, model)
+            raise
+        self._count(self.completed, model)
+        return response
+
+    async def _stream(self, request: web.Request, model: str, content: str) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        size = max(1, math.ceil(len(content) / self.chunks))
+        for start in range(0, len(content), size):
+            chunk = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": content[start:start + size]}, "finish_reason": None}],
+            }
+            await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode())
+            await asyncio.sleep(self.chunk_interval)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
@@ -0,0 +1,280 @@
+"""
+Гороскопы без AI: резервный (без источников) и базовый (по текстам источников).
+
+Характеристики знаков и шаблоны прогнозов подставляются один раз при загрузке
+модуля. Случайные значения берутся из random.Random, засеянного знаком и
+датой, поэтому в течение дня гороскоп знака не меняется между вызовами и
+перезапусками, а глобальный генератор random не затрагивается. Резервные
+гороскопы всех 12 знаков строятся разом при прогреве после полуночи (или при
+первом обращении в новые сутки), дальше это поиск в словаре.
+"""
+import random
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from horoscope_render import LINE, make_bar
+
+ZODIAC_TRAITS: Dict[str, Dict] = {
+    "Овен": {
+        "element": "огонь",
+        "planet": "Марс",
+        "qualities": ["энергичность", "решительность", "лидерство"],
+        "lucky_numbers": [1, 9, 19],
+        "colors": ["красный", "оранжевый"],
+        "advice": "Направьте свою энергию в нужное русло"
+    },
+    "Телец": {
+        "element": "земля",
+        "planet": "Венера",
+        "qualities": ["упорство", "надежность", "практичность"],
+        "lucky_numbers": [6, 15, 24],
+        "colors": ["зеленый", "розовый"],
+        "advice": "Терпение и труд приведут к успеху"
+    },
+    "Близнецы": {
+        "element": "воздух",
+        "planet": "Меркурий",
+        "qualities": ["общительность", "любознательность", "гибкость"],
+        "lucky_numbers": [5, 14, 23],
+        "colors": ["желтый", "голубой"],
+        "advice": "Используйте свою коммуникабельность"
+    },
+    "Рак": {
+        "element": "вода",
+        "planet": "Луна",
+        "qualities": ["чувствительность", "заботливость", "интуиция"],
+        "lucky_numbers": [2, 11, 20],
+        "colors": ["серебристый", "белый"],
+        "advice": "Доверяйте своей интуиции"
+    },
+    "Лев": {
+        "element": "огонь",
+        "planet": "Солнце",
+        "qualities": ["щедрость", "творчество", "уверенность"],
+        "lucky_numbers": [1, 10, 19],
+        "colors": ["золотой", "оранжевый"],
+        "advice": "Сияйте и вдохновляйте других"
+    },
+    "Дева": {
+        "element": "земля",
+        "planet": "Меркурий",
+        "qualities": ["аналитичность", "перфекционизм", "практичность"],
+        "lucky_numbers": [5, 14, 23],
+        "colors": ["бежевый", "коричневый"],
+        "advice": "Внимание к деталям откроет новые возможности"
+    },
+    "Весы": {
+        "element": "воздух",
+        "planet": "Венера",
+        "qualities": ["гармония", "справедливость", "дипломатичность"],
+        "lucky_numbers": [6, 15, 24],
+        "colors": ["голубой", "розовый"],
+        "advice": "Ищите баланс во всем"
+    },
+    "Скорпион": {
+        "element": "вода",
+        "planet": "Плутон",
+        "qualities": ["страстность", "интенсивность", "трансформация"],
+        "lucky_numbers": [8, 17, 26],
+        "colors": ["бордовый", "черный"],
+        "advice": "Преобразуйте энергию в действие"
+    },
+    "Стрелец": {
+        "element": "огонь",
+        "planet": "Юпитер",
+        "qualities": ["оптимизм", "свободолюбие", "философичность"],
+        "lucky_numbers": [3, 12, 21],
+        "colors": ["фиолетовый", "синий"],
+        "advice": "Расширяйте свои горизонты"
+    },
+    "Козерог": {
+        "element": "земля",
+        "planet": "Сатурн",
+        "qualities": ["дисциплина", "амбициозность", "ответственность"],
+        "lucky_numbers": [8, 17, 26],
+        "colors": ["черный", "темно-синий"],
+        "advice": "Планомерное движение к цели"
+    },
+    "Водолей": {
+        "element": "воздух",
+        "planet": "Уран",
+        "qualities": ["оригинальность", "независимость", "гуманность"],
+        "lucky_numbers": [4, 13, 22],
+        "colors": ["бирюзовый", "электрик"],
+        "advice": "Будьте открыты новым идеям"
+    },
+    "Рыбы": {
+        "element": "вода",
+        "planet": "Нептун",
+        "qualities": ["мечтательность", "сострадание", "креативность"],
+        "lucky_numbers": [7, 16, 25],
+        "colors": ["морская волна", "лавандовый"],
+        "advice": "Следуйте за своими мечтами"
+    }
+}
+
+# Шаблоны прогнозов для разных сфер (поля — из характеристик знака)
+SPHERE_TEMPLATES = {
+    "love": [
+        "Влияние {planet} создает благоприятную атмосферу для личных отношений. Проявите свои качества - {q0}, {q1}, и это укрепит ваши связи.",
+        "День благоприятен для сердечных дел. Энергия {element}а подчеркивает вашу {q0}, что привлечет к вам нужных людей.",
+        "В отношениях важно проявить {q1}. Звезды благоволят искренним разговорам и новым знакомствам.",
+    ],
+    "career": [
+        "Планета {planet} усиливает вашу {q0}. Это отличный день для реализации амбициозных планов и важных решений.",
+        "Ваша {q2} поможет справиться со сложными задачами. Коллеги оценят ваш профессионализм.",
+        "День благоприятен для карьерного роста. {advice} - и успех не заставит себя ждать.",
+    ],
+    "health": [
+        "Энергия {element}а поддерживает ваше физическое состояние. Прислушайтесь к телу и не забывайте про отдых.",
+        "Влияние {planet} укрепляет ваш организм. Хороший день для начала новых полезных привычек.",
+        "Ваша природная {q0} поможет поддержать тонус. Уделите внимание балансу работы и отдыха.",
+    ],
+}
+
+
+def _sphere_texts(traits: Dict) -> Dict[str, List[str]]:
+    fields = dict(traits, q0=traits["qualities"][0], q1=traits["qualities"][1], q2=traits["qualities"][2])
+    return {sphere: [t.format(**fields) for t in templates] for sphere, templates in SPHERE_TEMPLATES.items()}
+
+
+# Готовые тексты сфер для каждого знака
+SPHERE_TEXTS: Dict[str, Dict[str, List[str]]] = {
+    sign: _sphere_texts(traits) for sign, traits in ZODIAC_TRAITS.items()
+}
+
+
+def zodiac_traits(zodiac_clean: str) -> Dict:
+    """Характеристики знака (для неизвестного знака — Овна)"""
+    return ZODIAC_TRAITS.get(zodiac_clean, ZODIAC_TRAITS["Овен"])
+
+
+def day_random(zodiac_clean: str, day: date) -> random.Random:
+    """Генератор, одинаковый для знака в течение дня"""
+    return random.Random(f"{zodiac_clean}|{day.isoformat()}")
+
+
+def day_energies(rng: random.Random) -> Tuple[int, int, int, int, int]:
+    """Энергетика сфер: любовь, карьера, финансы, здоровье, удача"""
+    return (
+        rng.randint(65, 90),
+        rng.randint(60, 88),
+        rng.randint(55, 85),
+        rng.randint(70, 92),
+        rng.randint(60, 87),
+    )
+
+
+def _header(zodiac_clean: str, day: date, rating: int, stars: str, energies: Tuple[int, ...]) -> List[str]:
+    love, career, money, health, luck = energies
+    return [
+        LINE,
+        f"🔮 *ГОРОСКОП НА {day.strftime('%d.%m.%Y')}*",
+        f"*{zodiac_clean}*",
+        f"{LINE}\n",
+        f"⭐ *РЕЙТИНГ ДНЯ: {rating}/10* {stars}",
+        "",
+        "📊 *ЭНЕРГЕТИКА СФЕР:*\n",
+        f"❤️ Любовь:     {make_bar(love)} {love}%",
+        f"💼 Карьера:    {make_bar(career)} {career}%",
+        f"💰 Финансы:    {make_bar(money)} {money}%",
+        f"💚 Здоровье:   {make_bar(health)} {health}%",
+        f"🎯 Удача:      {make_bar(luck)} {luck}%\n",
+    ]
+
+
+def render_fallback(zodiac_clean: str, day: date) -> str:
+    """Полноценный гороскоп без внешних источников"""
+    traits = zodiac_traits(zodiac_clean)
+    texts = SPHERE_TEXTS.get(zodiac_clean, SPHERE_TEXTS["Овен"])
+    rng = day_random(zodiac_clean, day)
+    energies = day_energies(rng)
+    love, career, _, health, _ = energies
+    rating = rng.randint(6, 9)
+
+    result = _header(zodiac_clean, day, rating, "⭐" * min(5, rating), energies)
+    result.append(LINE)
+    result.append("💫 *ДЕТАЛЬНЫЙ ПРОГНОЗ*")
+    result.append(f"{LINE}\n")
+
+    result.append(f"❤️ *Любовь и отношения:* {love}%")
+    result.append(rng.choice(texts["love"]) + "\n")
+
+    result.append(f"💼 *Карьера и финансы:* {career}%")
+    result.append(rng.choice(texts["career"]) + "\n")
+
+    result.append(f"💚 *Здоровье:* {health}%")
+    result.append(rng.choice(texts["health"]) + "\n")
+
+    result.append(f"{LINE}\n")
+
+    result.append("🎯 *Совет дня:*")
+    result.append(f"{traits['advice']}. Элемент {traits['element']}а дает вам силу для преодоления любых препятствий!\n")
+
+    result.append("⚠️ *На что обратить внимание:*")
+    result.append("Избегайте импульсивных решений в важных вопросах. Взвесьте все 'за' и 'против'.\n")
+
+    result.append(f"🔢 *Счастливое число:* {rng.choice(traits['lucky_numbers'])}")
+    result.append(f"🎨 *Цвет дня:* {rng.choice(traits['colors'])}")
+    result.append(f"🪐 *Планета-покровитель:* {traits['planet']}")
+
+    return "\n".join(result)
+
+
+@lru_cache(maxsize=2)
+def daily_fallbacks(day: date) -> Dict[str, str]:
+    """Резервные гороскопы всех 12 знаков на день (строятся один раз за сутки)"""
+    return {sign: render_fallback(sign, day) for sign in ZODIAC_TRAITS}
+
+
+def fallback_horoscope(zodiac_clean: str, day: date) -> str:
+    """Резервный гороскоп знака на день"""
+    text = daily_fallbacks(day).get(zodiac_clean)
+    return text if text is not None else render_fallback(zodiac_clean, day)
+
+
+def render_basic(zodiac_clean: str, day: date, horoscopes: Dict[str, str]) -> str:
+    """Гороскоп с разделами по текстам источников"""
+    # Рейтинг дня зависит от количества источников
+    rating = min(10, 6 + len(horoscopes) * 2)
+    energies = day_energies(day_random(zodiac_clean, day))
+    love, career, _, health, _ = energies
+
+    result = _header(zodiac_clean, day, rating, ("⭐" * rating)[:5], energies)
+    result.append(f"{LINE}\n")
+
+    # Показываем источники
+    result.append("📰 *Прогноз от астрологов:*\n")
+
+    for source, text in horoscopes.items():
+        result.append(f"✨ *{source}:*")
+        result.append(f"{text}\n")
+
+    # Добавляем разделы с советами
+    result.append(LINE)
+    result.append("💫 *Основные сферы дня:*\n")
+
+    result.append(f"❤️ *Любовь и отношения:* {love}%")
+    result.append("Прислушайтесь к своему сердцу. Звезды благоволят искренности и открытости. "
+                  "Не бойтесь проявлять чувства — это укрепит ваши связи.\n")
+
+    result.append(f"💼 *Карьера и финансы:* {career}%")
+    result.append("Сегодня благоприятный день для важных решений. Доверяйте своей интуиции, "
+                  "но не забывайте про практичность. Возможны неожиданные возможности!\n")
+
+    result.append(f"💚 *Здоровье и энергия:* {health}%")
+    result.append("Прислушивайтесь к сигналам своего тела. Найдите время для отдыха и восстановления. "
+                  "Даже 15 минут медитации или прогулки принесут пользу.\n")
+
+    result.append(f"{LINE}\n")
+
+    result.append("🎯 *Совет дня от звезд:*")
+    result.append("Будьте открыты переменам и новым возможностям. Ваша энергия сегодня особенно сильна — "
+                  "используйте её для достижения целей!\n")
+
+    result.append("⚠️ *На что обратить внимание:*")
+    result.append("Избегайте импульсивных решений в важных вопросах. Дайте себе время обдумать ситуацию. "
+                  "Терпение — ваш союзник сегодня.")
+
+    return "\n".join(result)
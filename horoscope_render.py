@@ -0,0 +1,187 @@
+"""
+Структурированный AI-гороскоп: схема ответа модели и локальная отрисовка.
+
+Вместо полного Markdown-шаблона с рамками и прогресс-барами модель
+возвращает компактный JSON — рейтинг, пять процентов энергетики и короткие
+тексты разделов. Ответ проверяется по схеме, а шаблон (рамки, бары,
+заголовки) отрисовывает бот. Так ответ модели в несколько раз короче, а
+структура всегда соблюдена.
+"""
+import json
+from typing import Dict, Optional, Tuple
+
+# Разделитель блоков гороскопа
+LINE = "━━━━━━━━━━━━━━━━━━━━━"
+
+# Сферы энергетики: ключ JSON, эмодзи и подпись (выровнена как в шаблоне)
+SPHERES: Tuple[Tuple[str, str, str], ...] = (
+    ("love", "❤️", "Любовь:    "),
+    ("career", "💼", "Карьера:   "),
+    ("money", "💰", "Финансы:   "),
+    ("health", "💚", "Здоровье:  "),
+    ("luck", "🎯", "Удача:     "),
+)
+
+# Текстовые поля ответа и их максимальная длина
+TEXT_FIELDS = {
+    "astrologers": 600,
+    "love": 500,
+    "career": 500,
+    "health": 400,
+    "advice": 400,
+    "warning": 300,
+    "soul": 400,
+}
+
+# Схема для промпта; порядок полей — порядок генерации, поэтому рейтинг
+# и энергетика появляются в потоковом выводе первыми
+SCHEMA_PROMPT = """{
+  "rating": целое 1-10 — рейтинг дня (реалистично оценивай день),
+  "energy": {"love": %, "career": %, "money": %, "health": %, "luck": %} — целые от 50 до 95,
+  "astrologers": "краткое упоминание ключевых моментов из источников",
+  "love": "2-3 предложения с конкретикой о любви и отношениях",
+  "career": "2-3 предложения с конкретикой о карьере и финансах",
+  "health": "1-2 предложения о здоровье",
+  "advice": "1-2 предложения — вдохновляющий совет дня",
+  "warning": "1 предложение — мягкое предупреждение",
+  "soul": "1-2 предложения о влиянии числа души на этот день"
+}"""
+
+
+def make_bar(percent: int) -> str:
+    """Прогресс-бар из 10 делений"""
+    filled = int(percent / 10)
+    return "█" * filled + "░" * (10 - filled)
+
+
+def _number(value, low: int, high: int) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    value = round(value)
+    return value if low <= value <= high else None
+
+
+def validate_horoscope(data) -> Optional[Dict]:
+    """
+    Проверяет ответ модели по схеме.
+
+    Returns:
+        Нормализованные данные (числа — целые, тексты без пробелов по краям)
+        или None, если хотя бы одно поле отсутствует или не проходит проверку.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("energy"), dict):
+        return None
+    rating = _number(data.get("rating"), 1, 10)
+    if rating is None:
+        return None
+    result: Dict = {"rating": rating, "energy": {}}
+    for key, _, _ in SPHERES:
+        percent = _number(data["energy"].get(key), 0, 100)
+        if percent is None:
+            return None
+        result["energy"][key] = percent
+    for key, limit in TEXT_FIELDS.items():
+        text = data.get(key)
+        if not isinstance(text, str) or not text.strip() or len(text) > limit:
+            return None
+        result[key] = text.strip()
+    return result
+
+
+def parse_horoscope(content: str) -> Optional[Dict]:
+    """JSON-ответ модели -> проверенные данные гороскопа или None"""
+    try:
+        return validate_horoscope(json.loads(content))
+    except ValueError:
+        return None
+
+
+def parse_partial(content: str) -> Optional[Dict]:
+    """
+    Разбирает незаконченный JSON из потокового ответа: открытые строки и
+    скобки закрываются. Возвращает None, если обрыв пришелся на ключ или
+    число и разобрать начало не удалось — следующий фрагмент это исправит.
+    """
+    closers = []
+    in_string = escaped = False
+    for ch in content:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            closers.append("}" if ch == "{" else "]")
+        elif ch in "}]" and closers:
+            closers.pop()
+    if escaped:
+        content = content[:-1]
+    if in_string:
+        content += '"'
+    try:
+        data = json.loads(content + "".join(reversed(closers)))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def render_horoscope(data: Dict, zodiac_clean: str, today: str, soul) -> str:
+    """
+    Гороскоп по шаблону промпта. Отсутствующие разделы (частичный потоковый
+    ответ) пропускаются.
+    """
+    result = [LINE, f"🔮 *ГОРОСКОП на {today}*", f"*{zodiac_clean}*", LINE + "\n"]
+
+    rating = _number(data.get("rating"), 1, 10)
+    if rating is not None:
+        result.append(f"⭐ *РЕЙТИНГ ДНЯ: {rating}/10* {'⭐' * min(5, rating)}\n")
+
+    energy = data.get("energy") if isinstance(data.get("energy"), dict) else {}
+    percents = {key: _number(energy.get(key), 0, 100) for key, _, _ in SPHERES}
+    if any(percent is not None for percent in percents.values()):
+        result.append("📊 *ЭНЕРГЕТИКА СФЕР:*\n")
+        for key, emoji, label in SPHERES:
+            if percents[key] is not None:
+                result.append(f"{emoji} {label} {make_bar(percents[key])} {percents[key]}%")
+        result.append("\n" + LINE + "\n")
+
+    def text(key: str) -> Optional[str]:
+        value = data.get(key)
+        return value.strip() if isinstance(value, str) and value.strip() else None
+
+    if text("astrologers"):
+        result.append("📰 *Что говорят астрологи:*\n")
+        result.append(text("astrologers") + "\n")
+
+    sections = (
+        ("love", "❤️ *Любовь и отношения:*"),
+        ("career", "💼 *Карьера и финансы:*"),
+        ("health", "💚 *Здоровье:*"),
+    )
+    if any(text(key) for key, _ in sections):
+        result.append(LINE)
+        result.append("💫 *ДЕТАЛЬНЫЙ ПРОГНОЗ*")
+        result.append(LINE + "\n")
+        for key, title in sections:
+            if text(key):
+                percent = percents.get(key)
+                result.append(f"{title} {percent}%" if percent is not None else title)
+                result.append(text(key) + "\n")
+
+    closing = (
+        ("advice", "🎯 *Совет дня:*"),
+        ("warning", "⚠️ *Предостережение:*"),
+        ("soul", f"🔢 *Влияние числа души ({soul}):*"),
+    )
+    if any(text(key) for key, _ in closing):
+        result.append(LINE + "\n")
+        for key, title in closing:
+            if text(key):
+                result.append(title)
+                result.append(text(key) + "\n")
+
+    return "\n".join(result).rstrip()
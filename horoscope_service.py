@@ -1,20 +1,137 @@
 import asyncio
+import hashlib
+import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple
 import re
-import random
 
-import aiohttp
-from bs4 import BeautifulSoup
+from cache import LRUCache, SingleFlight, get_horoscope_cache
 from config import Config
+from disk_cache import get_disk_cache
+from horoscope_fallback import fallback_horoscope, render_basic, zodiac_traits
+from horoscope_render import SCHEMA_PROMPT, parse_horoscope, parse_partial, render_horoscope, validate_horoscope
+from llm_scheduler import BACKGROUND, CHARS_PER_TOKEN, INTERACTIVE, estimate_tokens, get_llm_scheduler, rate_limit_delay
+from sources import get_source_registry
 
 log = logging.getLogger(__name__)
 
+# Тариф в ключе кеша гороскопов на диске
+TIER = "basic"
+
+# Версия промпта AI-гороскопа: после ее изменения прежние результаты не используются
+PROMPT_VERSION = 1
+
+# Возможные числа души (второе дополнительное число) для дат 1900-2100
+SOUL_NUMBERS = range(1, 13)
+
+# Колбэк потоковой генерации: получает накопленный текст ответа
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+# Системное сообщение для генерации AI-гороскопа
+SYSTEM_PROMPT = (
+    "Ты — вдохновляющий астролог-мистик. Твои прогнозы эмоциональны, точны и основаны "
+    "на реальных данных. Ты ВСЕГДА включаешь рейтинг дня и энергетику сфер в процентах."
+)
+
+# Системное сообщение для ответов в JSON (режим JSON требует упоминания JSON)
+JSON_SYSTEM_PROMPT = SYSTEM_PROMPT + " Ты отвечаешь только JSON-объектом."
+
+# Ответ короче этого в пакетной генерации считается неудачным
+MIN_BATCH_TEXT = 300
+
+
+def soul_number(user_data: Dict) -> Optional[int]:
+    """Число души пользователя или None, если матрица не рассчитана"""
+    matrix = user_data.get("matrix") or {}
+    additional = matrix.get("additional", [])
+    return additional[1] if len(additional) > 1 else None
+
+
+def content_key(zodiac: str, personalization: str, horoscopes: Dict[str, str]) -> str:
+    """
+    Хеш нормализованных текстов источников вместе со знаком и ключом
+    персонализации (число души, модель, версия промпта). Пробелы и порядок
+    источников не влияют на результат.
+    """
+    normalized = sorted((source, " ".join(text.split())) for source, text in horoscopes.items())
+    payload = json.dumps([zodiac, personalization, normalized], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def parse_batch(
+    content: str,
+    expected: Dict[int, str],
+    render: Optional[Callable[[int, Dict], str]] = None,
+) -> Dict[int, str]:
+    """
+    Разбирает JSON-ответ пакетной генерации.
+
+    Args:
+        content: ответ модели {"horoscopes": [{"id": 1, "text": "..."}, ...]}
+        expected: номер варианта -> название знака без эмодзи
+        render: для структурированных ответ ({"id": 1, "horoscope": {...}})
+            отрисовывает проверенные по схеме данные варианта
+
+    Returns:
+        Гороскопы прошедших проверку элементов по номерам вариантов.
+        Элемент отбрасывается, если номер неизвестен или повторяется, текст
+        слишком короткий, без рейтинга дня или не для того знака, а данные
+        структурированного ответа не соответствуют схеме.
+    """
+    try:
+        items = json.loads(content).get("horoscopes")
+    except (ValueError, AttributeError):
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    valid: Dict[int, str] = {}
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id, text = item.get("id"), item.get("text")
+        if not isinstance(item_id, int):
+            continue
+        if item_id in seen:
+            # Два ответа на один вариант — не доверяем ни одному
+            valid.pop(item_id, None)
+            continue
+        seen.add(item_id)
+        if item_id not in expected:
+            continue
+        if render is not None:
+            data = validate_horoscope(item.get("horoscope"))
+            if data is not None:
+                valid[item_id] = render(item_id, data)
+            continue
+        if not isinstance(text, str):
+            continue
+        text = text.strip()
+        if len(text) < MIN_BATCH_TEXT or "РЕЙТИНГ ДНЯ" not in text or expected[item_id] not in text:
+            continue
+        valid[item_id] = text
+    return valid
+
+
 class HoroscopeService:
     def __init__(self) -> None:
-        self._cache = {}
+        self._cache = get_horoscope_cache()
+        # Одновременные запросы одного знака ждут одну генерацию
+        self._flights = SingleFlight()
+        # Гороскопы на сегодня переживают перезапуск бота
+        self._disk = get_disk_cache()
+        self.llm_calls = LRUCache(Config.HOROSCOPE_CACHE_SIZE)
+        # AI-гороскопы по хешу текстов источников: (дата генерации, текст)
+        self._generations = LRUCache(Config.HOROSCOPE_CACHE_SIZE)
+        # Лимиты Groq и очередь запросов к модели (общие для процесса)
+        self.llm = get_llm_scheduler()
+        # Вызовы AI за сутки и экономия от пакетной генерации
+        self.llm_today: Dict[str, object] = {}
+        # Источники гороскопов: общая HTTP-сессия, лимиты и дедлайн
+        self.sources = get_source_registry()
         self.api_key = Config.GROQ_API_KEY
         self.groq_client = None
         
@@ -53,115 +170,17 @@ class HoroscopeService:
         cleaned = re.sub(r'^[^\w\s]+\s*', '', zodiac)
         return cleaned.strip()
 
-    async def _fetch(self, url: str, timeout: int = 10) -> Optional[str]:
-        """Выполняет HTTP-запрос с таймаутом и обработкой ошибок"""
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-        
-        try:
-            timeout_obj = aiohttp.ClientTimeout(total=timeout)
-            async with aiohttp.ClientSession(headers=headers, timeout=timeout_obj) as session:
-                async with session.get(url, ssl=False) as resp:
-                    if resp.status == 200:
-                        html = await resp.text()
-                        log.info(f"✅ Успешно получен контент с {url} ({len(html)} символов)")
-                        return html
-                    else:
-                        log.warning(f"⚠️ Статус {resp.status} для {url}")
-        except asyncio.TimeoutError:
-            log.error(f"⏱️ Таймаут при запросе к {url}")
-        except Exception as exc:
-            log.error(f"❌ Ошибка при запросе к {url}: {type(exc).__name__}: {exc}")
-        return None
-
-    async def _parse_mail_ru(self, zodiac_en: str) -> Optional[str]:
-        """Парсит гороскоп с Horo.mail.ru"""
-        url = f"https://horo.mail.ru/prediction/{zodiac_en}/today/"
-        log.info(f"🔍 Парсинг Mail.ru: {url}")
-        
-        html = await self._fetch(url)
-        if not html:
-            return None
+    async def start(self) -> None:
+        """Открывает общую HTTP-сессию (вызывается при старте бота)"""
+        await self.sources.start()
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            content = None
-            article = soup.find("div", class_="article__item")
-            if article:
-                paragraphs = article.find_all("p")
-                if paragraphs:
-                    content = " ".join([p.get_text(strip=True) for p in paragraphs])
-            
-            if not content:
-                article = soup.find("article")
-                if article:
-                    paragraphs = article.find_all("p")
-                    if paragraphs:
-                        content = " ".join([p.get_text(strip=True) for p in paragraphs])
-            
-            if not content:
-                article = soup.find("div", {"data-qa": "Article"})
-                if article:
-                    paragraphs = article.find_all("p")
-                    if paragraphs:
-                        content = " ".join([p.get_text(strip=True) for p in paragraphs])
-            
-            if content and len(content) > 50:
-                log.info(f"✅ Mail.ru: получено {len(content)} символов")
-                return content[:800]
-            else:
-                log.warning("⚠️ Mail.ru: контент не найден или слишком короткий")
-                
-        except Exception as e:
-            log.error(f"❌ Ошибка парсинга Mail.ru: {e}")
-        
-        return None
-
-    async def _parse_rambler(self, zodiac_en: str) -> Optional[str]:
-        """Парсит гороскоп с Rambler"""
-        url = f"https://horoscopes.rambler.ru/{zodiac_en}/"
-        log.info(f"🔍 Парсинг Rambler: {url}")
-        
-        html = await self._fetch(url)
-        if not html:
-            return None
+    async def close(self) -> None:
+        """Закрывает HTTP-сессию (вызывается при остановке бота)"""
+        await self.sources.close()
+        if self._disk is not None:
+            await self._disk.flush()
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            main_div = soup.find("div", {"data-mt-part": "article"})
-            if main_div:
-                paragraph = main_div.find("p")
-                if paragraph:
-                    content = paragraph.get_text(strip=True)
-                    if len(content) > 50:
-                        log.info(f"✅ Rambler: получено {len(content)} символов")
-                        return content[:800]
-            
-            article = soup.find("article")
-            if article:
-                paragraph = article.find("p")
-                if paragraph:
-                    content = paragraph.get_text(strip=True)
-                    if len(content) > 50:
-                        log.info(f"✅ Rambler: получено {len(content)} символов")
-                        return content[:800]
-            
-            log.warning("⚠️ Rambler: контент не найден")
-                
-        except Exception as e:
-            log.error(f"❌ Ошибка парсинга Rambler: {e}")
-        
-        return None
-
-    async def parse_horoscopes(self, zodiac_sign: str) -> Dict[str, str]:
+    async def parse_horoscopes(self, zodiac_sign: str, deadline: float = Config.PARSE_DEADLINE) -> Dict[str, str]:
         """Парсит гороскопы из нескольких источников параллельно"""
         zodiac_clean = self._clean_zodiac_name(zodiac_sign)
         zodiac_map = self._get_zodiac_mapping()
@@ -169,207 +188,18 @@ class HoroscopeService:
         
         log.info(f"🔮 Начинаем парсинг для {zodiac_sign} ({zodiac_en})")
         
-        tasks = [
-            self._parse_mail_ru(zodiac_en),
-            self._parse_rambler(zodiac_en),
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        horoscopes = await self.sources.fetch_all(zodiac_en, deadline)
         
-        horoscopes = {}
-        if results[0] and not isinstance(results[0], Exception):
-            horoscopes["Mail.ru"] = results[0]
-        if results[1] and not isinstance(results[1], Exception):
-            horoscopes["Rambler"] = results[1]
-        
-        log.info(f"✅ Получено гороскопов: {len(horoscopes)} из 2")
+        log.info(f"✅ Получено гороскопов: {len(horoscopes)} из {len(self.sources.sources)}")
         return horoscopes
 
     def _get_zodiac_traits(self, zodiac_clean: str) -> Dict[str, any]:
         """Возвращает характеристики знака зодиака для генерации"""
-        traits = {
-            "Овен": {
-                "element": "огонь",
-                "planet": "Марс",
-                "qualities": ["энергичность", "решительность", "лидерство"],
-                "lucky_numbers": [1, 9, 19],
-                "colors": ["красный", "оранжевый"],
-                "advice": "Направьте свою энергию в нужное русло"
-            },
-            "Телец": {
-                "element": "земля",
-                "planet": "Венера",
-                "qualities": ["упорство", "надежность", "практичность"],
-                "lucky_numbers": [6, 15, 24],
-                "colors": ["зеленый", "розовый"],
-                "advice": "Терпение и труд приведут к успеху"
-            },
-            "Близнецы": {
-                "element": "воздух",
-                "planet": "Меркурий",
-                "qualities": ["общительность", "любознательность", "гибкость"],
-                "lucky_numbers": [5, 14, 23],
-                "colors": ["желтый", "голубой"],
-                "advice": "Используйте свою коммуникабельность"
-            },
-            "Рак": {
-                "element": "вода",
-                "planet": "Луна",
-                "qualities": ["чувствительность", "заботливость", "интуиция"],
-                "lucky_numbers": [2, 11, 20],
-                "colors": ["серебристый", "белый"],
-                "advice": "Доверяйте своей интуиции"
-            },
-            "Лев": {
-                "element": "огонь",
-                "planet": "Солнце",
-                "qualities": ["щедрость", "творчество", "уверенность"],
-                "lucky_numbers": [1, 10, 19],
-                "colors": ["золотой", "оранжевый"],
-                "advice": "Сияйте и вдохновляйте других"
-            },
-            "Дева": {
-                "element": "земля",
-                "planet": "Меркурий",
-                "qualities": ["аналитичность", "перфекционизм", "практичность"],
-                "lucky_numbers": [5, 14, 23],
-                "colors": ["бежевый", "коричневый"],
-                "advice": "Внимание к деталям откроет новые возможности"
-            },
-            "Весы": {
-                "element": "воздух",
-                "planet": "Венера",
-                "qualities": ["гармония", "справедливость", "дипломатичность"],
-                "lucky_numbers": [6, 15, 24],
-                "colors": ["голубой", "розовый"],
-                "advice": "Ищите баланс во всем"
-            },
-            "Скорпион": {
-                "element": "вода",
-                "planet": "Плутон",
-                "qualities": ["страстность", "интенсивность", "трансформация"],
-                "lucky_numbers": [8, 17, 26],
-                "colors": ["бордовый", "черный"],
-                "advice": "Преобразуйте энергию в действие"
-            },
-            "Стрелец": {
-                "element": "огонь",
-                "planet": "Юпитер",
-                "qualities": ["оптимизм", "свободолюбие", "философичность"],
-                "lucky_numbers": [3, 12, 21],
-                "colors": ["фиолетовый", "синий"],
-                "advice": "Расширяйте свои горизонты"
-            },
-            "Козерог": {
-                "element": "земля",
-                "planet": "Сатурн",
-                "qualities": ["дисциплина", "амбициозность", "ответственность"],
-                "lucky_numbers": [8, 17, 26],
-                "colors": ["черный", "темно-синий"],
-                "advice": "Планомерное движение к цели"
-            },
-            "Водолей": {
-                "element": "воздух",
-                "planet": "Уран",
-                "qualities": ["оригинальность", "независимость", "гуманность"],
-                "lucky_numbers": [4, 13, 22],
-                "colors": ["бирюзовый", "электрик"],
-                "advice": "Будьте открыты новым идеям"
-            },
-            "Рыбы": {
-                "element": "вода",
-                "planet": "Нептун",
-                "qualities": ["мечтательность", "сострадание", "креативность"],
-                "lucky_numbers": [7, 16, 25],
-                "colors": ["морская волна", "лавандовый"],
-                "advice": "Следуйте за своими мечтами"
-            }
-        }
-        return traits.get(zodiac_clean, traits["Овен"])
+        return zodiac_traits(zodiac_clean)
 
     def _generate_fallback_horoscope(self, zodiac: str) -> str:
         """Генерирует ПОЛНОЦЕННЫЙ гороскоп без внешних источников"""
-        today = datetime.now().strftime("%d.%m.%Y")
-        zodiac_clean = self._clean_zodiac_name(zodiac)
-        traits = self._get_zodiac_traits(zodiac_clean)
-        
-        # Генерируем случайные, но реалистичные значения
-        rating = random.randint(6, 9)
-        love_energy = random.randint(65, 90)
-        career_energy = random.randint(60, 88)
-        money_energy = random.randint(55, 85)
-        health_energy = random.randint(70, 92)
-        luck_energy = random.randint(60, 87)
-        
-        def make_bar(percent):
-            filled = int(percent / 10)
-            return "█" * filled + "░" * (10 - filled)
-        
-        # Шаблоны прогнозов для разных сфер
-        love_templates = [
-            f"Влияние {traits['planet']} создает благоприятную атмосферу для личных отношений. Проявите свои качества - {', '.join(traits['qualities'][:2])}, и это укрепит ваши связи.",
-            f"День благоприятен для сердечных дел. Энергия {traits['element']}а подчеркивает вашу {traits['qualities'][0]}, что привлечет к вам нужных людей.",
-            f"В отношениях важно проявить {traits['qualities'][1]}. Звезды благоволят искренним разговорам и новым знакомствам."
-        ]
-        
-        career_templates = [
-            f"Планета {traits['planet']} усиливает вашу {traits['qualities'][0]}. Это отличный день для реализации амбициозных планов и важных решений.",
-            f"Ваша {traits['qualities'][2]} поможет справиться со сложными задачами. Коллеги оценят ваш профессионализм.",
-            f"День благоприятен для карьерного роста. {traits['advice']} - и успех не заставит себя ждать."
-        ]
-        
-        health_templates = [
-            f"Энергия {traits['element']}а поддерживает ваше физическое состояние. Прислушайтесь к телу и не забывайте про отдых.",
-            f"Влияние {traits['planet']} укрепляет ваш организм. Хороший день для начала новых полезных привычек.",
-            f"Ваша природная {traits['qualities'][0]} поможет поддержать тонус. Уделите внимание балансу работы и отдыха."
-        ]
-        
-        stars = "⭐" * min(5, rating)
-        lucky_num = random.choice(traits['lucky_numbers'])
-        lucky_color = random.choice(traits['colors'])
-        
-        result = []
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━")
-        result.append(f"🔮 *ГОРОСКОП НА {today}*")
-        result.append(f"*{zodiac_clean}*")
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        result.append(f"⭐ *РЕЙТИНГ ДНЯ: {rating}/10* {stars}")
-        result.append("")
-        
-        result.append(f"📊 *ЭНЕРГЕТИКА СФЕР:*\n")
-        result.append(f"❤️ Любовь:     {make_bar(love_energy)} {love_energy}%")
-        result.append(f"💼 Карьера:    {make_bar(career_energy)} {career_energy}%")
-        result.append(f"💰 Финансы:    {make_bar(money_energy)} {money_energy}%")
-        result.append(f"💚 Здоровье:   {make_bar(health_energy)} {health_energy}%")
-        result.append(f"🎯 Удача:      {make_bar(luck_energy)} {luck_energy}%\n")
-        
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━")
-        result.append("💫 *ДЕТАЛЬНЫЙ ПРОГНОЗ*")
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        result.append(f"❤️ *Любовь и отношения:* {love_energy}%")
-        result.append(random.choice(love_templates) + "\n")
-        
-        result.append(f"💼 *Карьера и финансы:* {career_energy}%")
-        result.append(random.choice(career_templates) + "\n")
-        
-        result.append(f"💚 *Здоровье:* {health_energy}%")
-        result.append(random.choice(health_templates) + "\n")
-        
-        result.append("━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        result.append("🎯 *Совет дня:*")
-        result.append(f"{traits['advice']}. Элемент {traits['element']}а дает вам силу для преодоления любых препятствий!\n")
-        
-        result.append("⚠️ *На что обратить внимание:*")
-        result.append("Избегайте импульсивных решений в важных вопросах. Взвесьте все 'за' и 'против'.\n")
-        
-        result.append(f"🔢 *Счастливое число:* {lucky_num}")
-        result.append(f"🎨 *Цвет дня:* {lucky_color}")
-        result.append(f"🪐 *Планета-покровитель:* {traits['planet']}")
-        
-        return "\n".join(result)
+        return fallback_horoscope(self._clean_zodiac_name(zodiac), datetime.now().date())
 
     def _generate_basic_horoscope(self, zodiac: str, horoscopes: Dict[str, str]) -> str:
         """Генерирует эмоциональный гороскоп с разделами БЕЗ AI"""
@@ -378,110 +208,22 @@ class HoroscopeService:
         if not horoscopes:
             log.info("📝 Нет данных из источников, используем резервный генератор")
             return self._generate_fallback_horoscope(zodiac)
-        
-        today = datetime.now().strftime("%d.%m.%Y")
-        zodiac_clean = self._clean_zodiac_name(zodiac)
-        
-        # Генерируем рейтинг дня (на основе количества источников и длины текста)
-        rating = min(10, 6 + len(horoscopes) * 2)
-        stars = "⭐" * rating
-        
-        # Генерируем энергетику сфер (случайно, но реалистично)
-        import random
-        random.seed(datetime.now().day)
-        love_energy = random.randint(65, 90)
-        career_energy = random.randint(60, 88)
-        money_energy = random.randint(55, 85)
-        health_energy = random.randint(70, 92)
-        luck_energy = random.randint(60, 87)
-        
-        def make_bar(percent):
-            filled = int(percent / 10)
-            return "█" * filled + "░" * (10 - filled)
-        
-        result = []
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━")
-        result.append(f"🔮 *ГОРОСКОП НА {today}*")
-        result.append(f"*{zodiac_clean}*")
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        result.append(f"⭐ *РЕЙТИНГ ДНЯ: {rating}/10* {stars[:5]}")
-        result.append("")
-        
-        result.append(f"📊 *ЭНЕРГЕТИКА СФЕР:*\n")
-        result.append(f"❤️ Любовь:     {make_bar(love_energy)} {love_energy}%")
-        result.append(f"💼 Карьера:    {make_bar(career_energy)} {career_energy}%")
-        result.append(f"💰 Финансы:    {make_bar(money_energy)} {money_energy}%")
-        result.append(f"💚 Здоровье:   {make_bar(health_energy)} {health_energy}%")
-        result.append(f"🎯 Удача:      {make_bar(luck_energy)} {luck_energy}%\n")
-        
-        result.append(f"━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        # Показываем источники
-        result.append("📰 *Прогноз от астрологов:*\n")
-        
-        for i, (source, text) in enumerate(horoscopes.items(), 1):
-            result.append(f"✨ *{source}:*")
-            result.append(f"{text}\n")
-        
-        # Добавляем разделы с советами
-        result.append("━━━━━━━━━━━━━━━━━━━━━")
-        result.append("💫 *Основные сферы дня:*\n")
-        
-        result.append(f"❤️ *Любовь и отношения:* {love_energy}%")
-        result.append("Прислушайтесь к своему сердцу. Звезды благоволят искренности и открытости. "
-                     "Не бойтесь проявлять чувства — это укрепит ваши связи.\n")
-        
-        result.append(f"💼 *Карьера и финансы:* {career_energy}%")
-        result.append("Сегодня благоприятный день для важных решений. Доверяйте своей интуиции, "
-                     "но не забывайте про практичность. Возможны неожиданные возможности!\n")
-        
-        result.append(f"💚 *Здоровье и энергия:* {health_energy}%")
-        result.append("Прислушивайтесь к сигналам своего тела. Найдите время для отдыха и восстановления. "
-                     "Даже 15 минут медитации или прогулки принесут пользу.\n")
-        
-        result.append("━━━━━━━━━━━━━━━━━━━━━\n")
-        
-        result.append("🎯 *Совет дня от звезд:*")
-        result.append("Будьте открыты переменам и новым возможностям. Ваша энергия сегодня особенно сильна — "
-                     "используйте её для достижения целей!\n")
-        
-        result.append("⚠️ *На что обратить внимание:*")
-        result.append("Избегайте импульсивных решений в важных вопросах. Дайте себе время обдумать ситуацию. "
-                     "Терпение — ваш союзник сегодня.")
-        
-        return "\n".join(result)
 
-    async def _generate_ai_aggregated(
-        self, 
-        user_data: Dict, 
-        zodiac: str, 
-        horoscopes: Dict[str, str]
-    ) -> str:
-        """Генерирует эмоциональный персонализированный гороскоп с AI"""
-        
-        if not self.groq_client:
-            log.warning("⚠️ Groq client недоступен, используем базовую генерацию")
-            return self._generate_basic_horoscope(zodiac, horoscopes)
-        
-        # ИСПРАВЛЕНИЕ: если нет данных, используем резервный генератор
-        if not horoscopes:
-            log.info("📝 Нет данных для AI, используем резервный генератор")
-            return self._generate_fallback_horoscope(zodiac)
+        return render_basic(self._clean_zodiac_name(zodiac), datetime.now().date(), horoscopes)
 
-        today = datetime.now().strftime("%d.%m.%Y")
-        zodiac_clean = self._clean_zodiac_name(zodiac)
-        
-        # Подготавливаем контекст из источников
+    def _prompt_context(self, horoscopes: Dict[str, str]) -> str:
+        """Контекст из источников для промпта"""
         context_parts = []
         for source, text in horoscopes.items():
             context_parts.append(f"📰 {source}:\n{text}")
-        context = "\n\n".join(context_parts)
+        return "\n\n".join(context_parts)
+
+    def _build_prompt(self, zodiac: str, horoscopes: Dict[str, str], soul) -> str:
+        """Промпт AI-гороскопа по текстам источников и числу души"""
+        today = datetime.now().strftime("%d.%m.%Y")
+        zodiac_clean = self._clean_zodiac_name(zodiac)
         
-        # Извлекаем данные матрицы
-        matrix = user_data.get("matrix", {})
-        additional = matrix.get("additional", [])
-        soul_number = additional[1] if len(additional) > 1 else "не указано"
+        context = self._prompt_context(horoscopes)
         
         prompt = f"""Ты — вдохновляющий астролог с мистическим даром. Создай ЭМОЦИОНАЛЬНЫЙ гороскоп на {today} для знака {zodiac_clean}.
 
@@ -489,9 +231,16 @@ class HoroscopeService:
 {context}
 
 🔮 ПЕРСОНАЛЬНЫЕ ДАННЫЕ:
-• Число души: {soul_number}
+• Число души: {soul}
+
+"""
+        return prompt + self._prompt_task(today, zodiac_clean, soul)
 
-📝 ТВОЯ ЗАДАЧА:
+    def _prompt_task(self, today: str, zodiac_clean: str, soul) -> str:
+        """Задача, структура и требования к гороскопу (общая часть промптов)"""
+        if Config.LLM_STRUCTURED:
+            return self._prompt_task_json(soul)
+        return f"""📝 ТВОЯ ЗАДАЧА:
 1. Прочитай прогнозы и объедини их в СВЯЗНЫЙ эмоциональный рассказ
 2. Оцени день по 10-бальной шкале (рейтинг дня)
 3. Дай энергетику для каждой сферы (в процентах 0-100%)
@@ -543,7 +292,7 @@ class HoroscopeService:
 ⚠️ *Предостережение:*
 [1 предложение - мягкое предупреждение]
 
-🔢 *Влияние числа души ({soul_number}):*
+🔢 *Влияние числа души ({soul}):*
 [1-2 предложения о влиянии числа на этот день]
 
 ТРЕБОВАНИЯ:
@@ -556,26 +305,92 @@ class HoroscopeService:
 • Длина: 700-900 символов
 • Только на русском языке"""
 
+    def _prompt_task_json(self, soul) -> str:
+        """Задача для структурированного ответа: только данные, оформление добавит бот"""
+        return f"""📝 ТВОЯ ЗАДАЧА:
+1. Прочитай прогнозы и объедини их в СВЯЗНЫЙ эмоциональный рассказ
+2. Оцени день по 10-бальной шкале (рейтинг дня)
+3. Дай энергетику для каждой сферы (в процентах)
+4. Используй конкретную информацию из источников!
+5. Добавь мистику и вдохновение
+6. Учти влияние числа души ({soul})
+
+🎯 ОТВЕТ — JSON-объект строго по схеме (рамки, прогресс-бары и заголовки добавит бот):
+{SCHEMA_PROMPT}
+
+ТРЕБОВАНИЯ:
+• Используй факты из источников!
+• Будь эмоциональным и вдохновляющим
+• Говори от лица звезд напрямую
+• Только на русском языке"""
+
+    def _completion_params(self, items: int = 1, stream: bool = False) -> Dict:
+        """
+        Параметры генерации; структурированный ответ — в режиме JSON.
+        Режим JSON в Groq несовместим с потоковой передачей, поэтому потоковый
+        запрос идет без response_format: формат задает промпт, а ответ все
+        равно проверяется по схеме.
+        """
+        if Config.LLM_STRUCTURED:
+            max_tokens = Config.LLM_STRUCTURED_MAX_TOKENS * items
+        else:
+            max_tokens = 1500 * items
+        params = {"temperature": 0.8, "max_tokens": max_tokens, "top_p": 0.9}
+        if (Config.LLM_STRUCTURED or items > 1) and not stream:
+            params["response_format"] = {"type": "json_object"}
+        return params
+
+    async def _generate_ai_aggregated(
+        self, 
+        user_data: Dict, 
+        zodiac: str, 
+        horoscopes: Dict[str, str],
+        on_progress: Optional[ProgressCallback] = None,
+        priority: int = INTERACTIVE,
+        cache_key: Optional[str] = None,
+    ) -> str:
+        """
+        Генерирует эмоциональный персонализированный гороскоп с AI. Ответ модели
+        учитывается в llm_calls под cache_key (повторно использованный ответ и
+        запасная генерация без AI — нет).
+        """
+        
+        if not self.groq_client:
+            log.warning("⚠️ Groq client недоступен, используем базовую генерацию")
+            return self._generate_basic_horoscope(zodiac, horoscopes)
+        
+        # ИСПРАВЛЕНИЕ: если нет данных, используем резервный генератор
+        if not horoscopes:
+            log.info("📝 Нет данных для AI, используем резервный генератор")
+            return self._generate_fallback_horoscope(zodiac)
+
+        soul = soul_number(user_data)
+        soul = soul if soul is not None else "не указано"
+        key = content_key(zodiac, self.personalization_key(user_data), horoscopes)
+        reused = await self._reused_generation(key)
+        if reused is not None:
+            log.info(f"♻️ Тексты источников для {zodiac} не изменились, используем прежний AI-гороскоп")
+            return reused
+
+        prompt = self._build_prompt(zodiac, horoscopes, soul)
+        render = None
+        if Config.LLM_STRUCTURED:
+            today = datetime.now().strftime("%d.%m.%Y")
+            zodiac_clean = self._clean_zodiac_name(zodiac)
+            render = lambda data: render_horoscope(data, zodiac_clean, today, soul)
+
         try:
-            model = Config.GROQ_MODEL or "llama-3.1-8b-instant"
-            log.info(f"🤖 Генерация AI-гороскопа с моделью {model}")
-            
-            completion = await self.groq_client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "Ты — вдохновляющий астролог-мистик. Твои прогнозы эмоциональны, точны и основаны на реальных данных. Ты ВСЕГДА включаешь рейтинг дня и энергетику сфер в процентах."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,
-                max_tokens=1500,
-                top_p=0.9,
-            )
+            log.info(f"🤖 Генерация AI-гороскопа с моделью {self.model}")
             
-            ai_response = completion.choices[0].message.content.strip()
+            messages = [
+                {"role": "system", "content": JSON_SYSTEM_PROMPT if render else SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
+            ai_response = await self._complete_hedged(messages, on_progress, priority, render)
             log.info(f"✅ AI-гороскоп сгенерирован ({len(ai_response)} символов)")
+            self._remember_generation(key, ai_response)
+            if cache_key is not None:
+                self.llm_calls.incr(cache_key)
             
             return ai_response
             
@@ -583,21 +398,304 @@ class HoroscopeService:
             log.error(f"❌ Ошибка генерации AI: {type(e).__name__}: {e}")
             return self._generate_basic_horoscope(zodiac, horoscopes)
 
-    async def get_daily_horoscope(self, user_data: Dict) -> str:
-        """Главный метод для получения дневного гороскопа"""
+    async def _reused_generation(self, key: str) -> Optional[str]:
+        """
+        AI-гороскоп, уже сгенерированный по тем же текстам источников (из памяти
+        или с диска), с датой генерации, замененной на сегодняшнюю.
+        """
+        if Config.LLM_REUSE_DAYS <= 0:
+            return None
+        stored = self._generations.get(key)
+        if stored is None and self._disk is not None:
+            stored = await self._disk.get_generation(key)
+            if stored is not None:
+                self._generations.set(key, stored)
+        if stored is None:
+            return None
+        date, text = stored
+        generated = datetime.strptime(date, "%Y-%m-%d")
+        now = datetime.now()
+        if (now - generated).days > Config.LLM_REUSE_DAYS:
+            return None
+        self._count_llm(reused=1)
+        return text.replace(generated.strftime("%d.%m.%Y"), now.strftime("%d.%m.%Y"))
+
+    def _remember_generation(self, key: str, text: str) -> None:
+        """Сохраняет AI-гороскоп по хешу текстов источников"""
+        if Config.LLM_REUSE_DAYS <= 0:
+            return
+        today = datetime.now().strftime("%Y-%m-%d")
+        self._generations.set(key, (today, text))
+        if self._disk is not None:
+            self._disk.put_generation(key, today, text)
+
+    async def _complete(
+        self,
+        model: str,
+        messages: List[Dict],
+        on_progress: Optional[ProgressCallback],
+        priority: int,
+        render: Optional[Callable[[Dict], str]],
+        granted: Optional[asyncio.Event] = None,
+        first_token: Optional[asyncio.Event] = None,
+    ) -> str:
+        """
+        Ответ одной модели (потоком или целиком); пустой или не прошедший схему — ошибка.
+        granted выставляется, когда планировщик выдал место, first_token — на первом
+        фрагменте потока.
+        """
+        if on_progress is not None:
+            text = await self._stream_completion(model, messages, on_progress, priority, render, granted, first_token)
+        else:
+            completion = await self._llm_request(
+                priority, granted=granted, model=model, messages=messages, **self._completion_params()
+            )
+            choice = completion.choices[0]
+            text = choice.message.content
+            if getattr(choice, "finish_reason", None) == "length":
+                log.warning(f"⚠️ {model}: ответ обрезан по max_tokens")
+        text = (text or "").strip()
+        if render is None:
+            if not text:
+                raise ValueError(f"{model}: пустой ответ")
+            return text
+        data = parse_horoscope(text)
+        if data is None:
+            raise ValueError(f"{model}: ответ не прошел проверку схемы")
+        return render(data)
+
+    async def _complete_hedged(
+        self,
+        messages: List[Dict],
+        on_progress: Optional[ProgressCallback],
+        priority: int,
+        render: Optional[Callable[[Dict], str]],
+    ) -> str:
+        """
+        Ответ основной модели с подстраховкой: если за LLM_HEDGE_AFTER секунд
+        ответа нет (или основная модель уже ошиблась), тот же запрос уходит
+        быстрой LLM_HEDGE_MODEL. Побеждает первый прошедший проверку ответ,
+        второй запрос отменяется. Частичный текст показывается от модели,
+        которая первой начала отвечать.
+
+        Отсчет идет с момента, когда основной запрос получил место в
+        планировщике: ожидание в очереди и пауза после 429 не в счет. Потоковый
+        запрос не дублируется, если первый фрагмент пришел вовремя, и никакой
+        запрос не дублируется, пока планировщик приостановлен.
+        """
+        hedge_model = Config.LLM_HEDGE_MODEL
+        if Config.LLM_HEDGE_AFTER <= 0 or not hedge_model or hedge_model == self.model:
+            return await self._complete(self.model, messages, on_progress, priority, render)
+
+        leader: List[str] = []
+
+        def progress_of(model: str) -> Optional[ProgressCallback]:
+            if on_progress is None:
+                return None
+
+            async def forward(text: str) -> None:
+                if not leader:
+                    leader.append(model)
+                if leader[0] == model:
+                    await on_progress(text)
+            return forward
+
+        granted, first_token = asyncio.Event(), asyncio.Event()
+        primary = asyncio.ensure_future(
+            self._complete(self.model, messages, progress_of(self.model), priority, render, granted, first_token)
+        )
+        tasks = [primary]
+        try:
+            slot_wait = asyncio.ensure_future(granted.wait())
+            tasks.append(slot_wait)
+            await asyncio.wait([primary, slot_wait], return_when=asyncio.FIRST_COMPLETED)
+            if not primary.done():
+                token_wait = asyncio.ensure_future(first_token.wait())
+                tasks.append(token_wait)
+                await asyncio.wait([primary, token_wait], timeout=Config.LLM_HEDGE_AFTER,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            if not primary.done() and (first_token.is_set() or self.llm.paused):
+                # Поток уже идет или Groq ограничил частоту — второй запрос только добавит нагрузки
+                await asyncio.wait([primary])
+            done = primary.done()
+            if done and primary.exception() is None:
+                return primary.result()
+
+            reason = "ошибки" if done else f"{Config.LLM_HEDGE_AFTER:.1f} с без ответа"
+            log.warning(f"⏱️ {self.model}: после {reason} запрос дублируется в {hedge_model}")
+            self._count_llm(hedged=1)
+            hedge = asyncio.ensure_future(
+                self._complete(hedge_model, messages, progress_of(hedge_model), priority, render)
+            )
+            tasks.append(hedge)
+            error = primary.exception() if done else None
+            pending = {task for task in (primary, hedge) if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count_llm(hedge_wins=1)
+                        return task.result()
+                    error = task.exception()
+                    log.warning(f"⚠️ {type(error).__name__}: {error}")
+            raise error
+        finally:
+            # Проигравший (или все при отмене) запрос отменяется
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    async def _llm_request(
+        self,
+        priority: int,
+        consume: Optional[Callable] = None,
+        granted: Optional[asyncio.Event] = None,
+        **params,
+    ):
+        """
+        Запрос к модели через планировщик: лимиты RPM/TPM, параллельность и
+        очередь по приоритету. После ответа 429 выдача мест приостанавливается,
+        а запрос повторяется (LLM_RETRIES раз). consume читает потоковый ответ,
+        пока место в планировщике занято, и возвращает его текст. granted
+        выставляется, когда место получено.
+        """
+        estimate = estimate_tokens(params["messages"], params["max_tokens"])
+        attempt = 0
+        while True:
+            async with self.llm.slot(estimate, priority):
+                if granted is not None:
+                    granted.set()
+                self._count_llm(calls=1)
+                try:
+                    response = await self.groq_client.chat.completions.create(**params)
+                except Exception as e:
+                    delay = rate_limit_delay(e)
+                    if delay is None or attempt >= Config.LLM_RETRIES:
+                        raise
+                    self.llm.backoff(delay)
+                else:
+                    if consume is None:
+                        usage = getattr(response, "usage", None)
+                        self.llm.settle(estimate, getattr(usage, "total_tokens", None))
+                        return response
+                    text = await consume(response)
+                    self.llm.settle(estimate, estimate_tokens(params["messages"], 0) + len(text) // CHARS_PER_TOKEN)
+                    return text
+            attempt += 1
+
+    async def _stream_completion(
+        self,
+        model: str,
+        messages: List[Dict],
+        on_progress: ProgressCallback,
+        priority: int = INTERACTIVE,
+        render: Optional[Callable[[Dict], str]] = None,
+        granted: Optional[asyncio.Event] = None,
+        first_token: Optional[asyncio.Event] = None,
+    ) -> str:
+        """
+        Потоковая генерация: on_progress получает накопленный текст после
+        каждого фрагмента. Для структурированного ответа (render) незаконченный
+        JSON разбирается и показывается уже отрисованным.
+        """
+        async def consume(stream) -> str:
+            parts = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                if first_token is not None:
+                    first_token.set()
+                parts.append(delta)
+                text = "".join(parts)
+                if render is not None:
+                    data = parse_partial(text)
+                    if data is None:
+                        continue
+                    text = render(data)
+                try:
+                    await on_progress(text)
+                except Exception as e:
+                    # Ошибка показа не должна прерывать генерацию для кеша
+                    log.warning(f"⚠️ Ошибка обработки частичного ответа: {type(e).__name__}: {e}")
+            return "".join(parts)
+
+        return await self._llm_request(
+            priority, consume, granted, model=model, messages=messages, stream=True, **self._completion_params(stream=True)
+        )
+
+    @property
+    def model(self) -> str:
+        return Config.GROQ_MODEL or "llama-3.1-8b-instant"
+
+    def personalization_key(self, user_data: Dict) -> str:
+        """
+        Часть ключа кеша, от которой зависит текст: число души из промпта,
+        модель, версия промпта и формат ответа (JSON или Markdown). Число
+        души принимает всего 12 значений, поэтому вариантов на день немного
+        и их можно прогреть заранее. Без Groq гороскоп собирается из текстов
+        источников и одинаков для всех пользователей знака.
+        """
+        if not self.groq_client:
+            return "basic"
+        soul = soul_number(user_data)
+        mode = "json" if Config.LLM_STRUCTURED else "md"
+        return f"soul{soul if soul is not None else '-'}|{self.model}|p{PROMPT_VERSION}{mode}"
+
+    async def get_daily_horoscope(self, user_data: Dict, on_progress: Optional[ProgressCallback] = None) -> str:
+        """
+        Главный метод для получения дневного гороскопа.
+
+        Если передан on_progress и гороскоп генерирует AI, ответ модели читается
+        потоком и колбэк получает накопленный текст по мере генерации. Гороскоп
+        из кеша (и ожидание чужой генерации) возвращается без колбэка.
+        """
         zodiac = user_data.get("zodiac", "Овен")
         today = datetime.now().strftime("%Y-%m-%d")
-        cache_key = f"{zodiac}_{today}"
+        personalization = self.personalization_key(user_data)
+        cache_key = f"{zodiac}_{today}_{personalization}"
 
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             log.info(f"📦 Используем кешированный гороскоп для {zodiac}")
-            return self._cache[cache_key]
+            return cached
+
+        if cache_key in self._flights:
+            log.info(f"⏳ Ждем уже начатую генерацию гороскопа для {zodiac}")
+        return await self._flights.run(
+            cache_key, lambda: self._generate_daily(user_data, zodiac, today, personalization, cache_key, on_progress)
+        )
+
+    async def _generate_daily(
+        self,
+        user_data: Dict,
+        zodiac: str,
+        today: str,
+        personalization: str,
+        cache_key: str,
+        on_progress: Optional[ProgressCallback] = None,
+        priority: int = INTERACTIVE,
+        parse: Optional[Callable[[str], Awaitable[Dict[str, str]]]] = None,
+    ) -> str:
+        """
+        Генерирует гороскоп и сохраняет его в кеш (один раз на ключ). parse
+        заменяет parse_horoscopes, когда тексты источников общие для
+        нескольких вариантов знака.
+        """
+        if self._disk is not None:
+            stored = await self._disk.get(TIER, zodiac, today, personalization)
+            if stored is not None:
+                log.info(f"💾 Гороскоп для {zodiac} загружен из кеша на диске")
+                self._cache.set(cache_key, stored)
+                return stored
 
         log.info(f"🚀 Начинаем генерацию гороскопа для {zodiac}")
         
         # 1. Пытаемся собрать данные из интернета
         try:
-            horoscopes = await self.parse_horoscopes(zodiac)
+            horoscopes = await (parse or self.parse_horoscopes)(zodiac)
         except Exception as e:
             log.error(f"❌ Ошибка парсинга: {e}")
             horoscopes = {}
@@ -605,7 +703,9 @@ class HoroscopeService:
         # 2. Генерируем финальный прогноз
         if self.groq_client and horoscopes:
             log.info("🤖 Используем AI для генерации")
-            final_forecast = await self._generate_ai_aggregated(user_data, zodiac, horoscopes)
+            final_forecast = await self._generate_ai_aggregated(
+                user_data, zodiac, horoscopes, on_progress, priority, cache_key
+            )
         elif horoscopes:
             log.info("📝 Используем базовую генерацию с данными")
             final_forecast = self._generate_basic_horoscope(zodiac, horoscopes)
@@ -614,7 +714,257 @@ class HoroscopeService:
             final_forecast = self._generate_fallback_horoscope(zodiac)
         
         # Сохраняем в кеш
-        self._cache[cache_key] = final_forecast
+        self._cache.set(cache_key, final_forecast)
+        if self._disk is not None:
+            self._disk.put(TIER, zodiac, today, final_forecast, personalization)
         log.info(f"✅ Гороскоп готов и сохранен в кеш")
         
         return final_forecast
+
+    def _count_llm(self, **deltas: int) -> None:
+        """Счетчики вызовов AI за текущие сутки (сбрасываются при смене даты)"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self.llm_today.get("date") != today:
+            self.llm_today = {
+                "date": today,
+                "calls": 0,           # запросов к модели, включая пакетные
+                "batch_calls": 0,
+                "batched_items": 0,   # гороскопов, полученных пакетами
+                "fallback_items": 0,  # вариантов, не прошедших проверку в пакете
+                "calls_saved": 0,
+                "tokens_saved": 0,    # оценка по токенам промпта
+                "hedged": 0,          # запросов, продублированных в быструю модель
+                "hedge_wins": 0,
+                "reused": 0,          # гороскопов по неизменившимся текстам источников
+            }
+        for name, value in deltas.items():
+            self.llm_today[name] += value
+
+    async def get_daily_horoscopes(self, users: List[Dict], priority: int = BACKGROUND) -> List[str]:
+        """
+        Гороскопы для нескольких вариантов (знаков и чисел души) сразу.
+
+        Варианты, которых нет в кеше, генерируются пачками по LLM_BATCH_SIZE:
+        один запрос к модели возвращает JSON-массив гороскопов. Отдельный
+        запрос делается только для вариантов, ответ на которые не прошел
+        проверку. Одновременные get_daily_horoscope тех же вариантов ждут
+        пачку, а не запускают свою генерацию. Источники каждого знака
+        парсятся один раз на вызов, сколько бы вариантов у знака ни было.
+        По умолчанию запросы к модели идут в фоновой очереди планировщика,
+        после запросов пользователей.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        variants: Dict[str, Tuple[Dict, str, str]] = {}
+        keys = []
+        for user_data in users:
+            zodiac = user_data.get("zodiac", "Овен")
+            personalization = self.personalization_key(user_data)
+            cache_key = f"{zodiac}_{today}_{personalization}"
+            keys.append(cache_key)
+            variants[cache_key] = (user_data, zodiac, personalization)
+
+        parsed: Dict[str, asyncio.Future] = {}
+
+        def parse(zodiac: str) -> Awaitable[Dict[str, str]]:
+            if zodiac not in parsed:
+                parsed[zodiac] = asyncio.ensure_future(self.parse_horoscopes(zodiac))
+            return asyncio.shield(parsed[zodiac])
+
+        batches: Dict[str, asyncio.Future] = {}
+        size = Config.LLM_BATCH_SIZE
+        if self.groq_client and size > 1:
+            missing = [key for key in variants if self._cache.get(key) is None and key not in self._flights]
+            for start in range(0, len(missing), size):
+                chunk = {key: variants[key] for key in missing[start:start + size]}
+                if len(chunk) > 1:
+                    batch = asyncio.ensure_future(self._generate_batch(chunk, today, priority, parse))
+                    batches.update(dict.fromkeys(chunk, batch))
+
+        async def generate(cache_key: str) -> str:
+            user_data, zodiac, personalization = variants[cache_key]
+            batch = batches.get(cache_key)
+            if batch is not None:
+                try:
+                    await batch
+                except Exception as e:
+                    log.error(f"❌ Ошибка пакетной генерации: {type(e).__name__}: {e}")
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            return await self._generate_daily(
+                user_data, zodiac, today, personalization, cache_key, priority=priority, parse=parse
+            )
+
+        # Генерации регистрируются сразу, до первого await, чтобы параллельные
+        # запросы тех же вариантов присоединились к пачке
+        texts: Dict[str, str] = {}
+        futures: Dict[str, asyncio.Future] = {}
+        for cache_key in variants:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                texts[cache_key] = cached
+            else:
+                futures[cache_key] = self._flights.start(cache_key, lambda key=cache_key: generate(key))
+
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        texts.update(zip(futures, results))
+        return [texts[key] for key in keys]
+
+    async def _generate_batch(
+        self,
+        chunk: Dict[str, Tuple[Dict, str, str]],
+        today: str,
+        priority: int = BACKGROUND,
+        parse: Optional[Callable[[str], Awaitable[Dict[str, str]]]] = None,
+    ) -> None:
+        """Генерирует пачку вариантов одним запросом; готовые гороскопы попадают в кеш"""
+        pending = dict(chunk)
+        if self._disk is not None:
+            for cache_key, (user_data, zodiac, personalization) in chunk.items():
+                stored = await self._disk.get(TIER, zodiac, today, personalization)
+                if stored is not None:
+                    self._cache.set(cache_key, stored)
+                    del pending[cache_key]
+
+        zodiacs = list(dict.fromkeys(zodiac for _, zodiac, _ in pending.values()))
+        parse = parse or self.parse_horoscopes
+        parsed = await asyncio.gather(*(parse(z) for z in zodiacs), return_exceptions=True)
+        horoscopes = {z: h for z, h in zip(zodiacs, parsed) if isinstance(h, dict) and h}
+        # Без текстов источников AI не используется — такие варианты идут обычным путем
+        pending = {key: v for key, v in pending.items() if v[1] in horoscopes}
+        keys = {
+            cache_key: content_key(zodiac, personalization, horoscopes[zodiac])
+            for cache_key, (_, zodiac, personalization) in pending.items()
+        }
+        for cache_key, (user_data, zodiac, personalization) in list(pending.items()):
+            reused = await self._reused_generation(keys[cache_key])
+            if reused is not None:
+                self._cache.set(cache_key, reused)
+                if self._disk is not None:
+                    self._disk.put(TIER, zodiac, today, reused, personalization)
+                del pending[cache_key]
+        if len(pending) < 2:
+            return
+
+        for cache_key, text in (await self._generate_ai_batch(pending, horoscopes, priority)).items():
+            user_data, zodiac, personalization = pending[cache_key]
+            self._remember_generation(keys[cache_key], text)
+            self._cache.set(cache_key, text)
+            if self._disk is not None:
+                self._disk.put(TIER, zodiac, today, text, personalization)
+
+    def _build_batch_prompt(self, variants: List[Tuple[str, object]], horoscopes: Dict[str, Dict[str, str]]) -> str:
+        """Промпт пачки: тексты источников по знакам, список вариантов и общая задача"""
+        today = datetime.now().strftime("%d.%m.%Y")
+        context = "\n\n".join(
+            f"### {self._clean_zodiac_name(zodiac)}\n{self._prompt_context(texts)}"
+            for zodiac, texts in horoscopes.items()
+        )
+        lines = "\n".join(
+            f"{i}. Знак: {self._clean_zodiac_name(zodiac)}, число души: {soul}"
+            for i, (zodiac, soul) in enumerate(variants, 1)
+        )
+        task = self._prompt_task(today, "[знак]", "[число души]")
+        if Config.LLM_STRUCTURED:
+            answer = (
+                'JSON-объект {"horoscopes": [{"id": номер варианта, "horoscope": объект по схеме выше}]} '
+                "— по одному элементу на каждый вариант."
+            )
+        else:
+            answer = (
+                'JSON-объект {"horoscopes": [{"id": номер варианта, "text": "гороскоп"}]} '
+                "— по одному элементу на каждый вариант.\n"
+                "text — гороскоп варианта строго по структуре выше, вместо [знак] и [число души] — данные варианта."
+            )
+        return f"""Ты — вдохновляющий астролог с мистическим даром. Создай ЭМОЦИОНАЛЬНЫЕ гороскопы на {today} для каждого варианта ниже — отдельно, по данным его знака.
+
+📊 ДАННЫЕ ИЗ ИСТОЧНИКОВ (используй ОБЯЗАТЕЛЬНО!):
+{context}
+
+🔮 ВАРИАНТЫ:
+{lines}
+
+{task}
+
+📦 ФОРМАТ ОТВЕТА:
+{answer}"""
+
+    async def _generate_ai_batch(
+        self,
+        pending: Dict[str, Tuple[Dict, str, str]],
+        horoscopes: Dict[str, Dict[str, str]],
+        priority: int = BACKGROUND,
+    ) -> Dict[str, str]:
+        """Один запрос к модели на несколько вариантов; возвращает прошедшие проверку"""
+        ids: Dict[int, str] = {}
+        expected: Dict[int, str] = {}
+        souls: Dict[int, object] = {}
+        variants = []
+        # Размер промптов, которые ушли бы при генерации по одному
+        single_chars: Dict[int, int] = {}
+        for i, (cache_key, (user_data, zodiac, _)) in enumerate(pending.items(), 1):
+            soul = soul_number(user_data)
+            soul = soul if soul is not None else "не указано"
+            ids[i] = cache_key
+            expected[i] = self._clean_zodiac_name(zodiac)
+            souls[i] = soul
+            variants.append((zodiac, soul))
+            system = JSON_SYSTEM_PROMPT if Config.LLM_STRUCTURED else SYSTEM_PROMPT
+            single_chars[i] = len(system) + len(self._build_prompt(zodiac, horoscopes[zodiac], soul))
+
+        prompt = self._build_batch_prompt(variants, horoscopes)
+        render = None
+        if Config.LLM_STRUCTURED:
+            today = datetime.now().strftime("%d.%m.%Y")
+            render = lambda i, data: render_horoscope(data, expected[i], today, souls[i])
+        params = self._completion_params(len(pending))
+        params["max_tokens"] = min(params["max_tokens"], Config.LLM_BATCH_MAX_TOKENS)
+        try:
+            log.info(f"🤖 Пакетная генерация {len(pending)} гороскопов с моделью {self.model}")
+            self._count_llm(batch_calls=1)
+            completion = await self._llm_request(
+                priority,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": JSON_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                **params,
+            )
+            # Пачка — один запрос к модели: учитывается один раз под ключами всех
+            # ее вариантов, число готовых гороскопов — в llm_today
+            self.llm_calls.incr(" + ".join(pending))
+            valid = parse_batch(completion.choices[0].message.content or "", expected, render)
+        except Exception as e:
+            log.error(f"❌ Ошибка пакетной генерации AI: {type(e).__name__}: {e}")
+            self._count_llm(fallback_items=len(pending), calls_saved=-1)
+            return {}
+
+        # Токены промпта оцениваем пропорционально символам по фактическому расходу пачки
+        tokens_saved = 0
+        prompt_tokens = getattr(getattr(completion, "usage", None), "prompt_tokens", None)
+        if valid and prompt_tokens:
+            batch_chars = len(JSON_SYSTEM_PROMPT) + len(prompt)
+            saved_chars = sum(single_chars[i] for i in valid) - batch_chars
+            tokens_saved = round(prompt_tokens * saved_chars / batch_chars)
+        self._count_llm(
+            batched_items=len(valid),
+            fallback_items=len(pending) - len(valid),
+            calls_saved=len(valid) - 1,
+            tokens_saved=tokens_saved,
+        )
+        log.info(f"✅ Пакет: {len(valid)} из {len(pending)} гороскопов прошли проверку")
+        return {ids[i]: text for i, text in valid.items()}
+
+    def stats(self) -> Dict[str, object]:
+        """Метрики кеша, объединения запросов и вызовов LLM по ключам"""
+        self._count_llm()
+        return {
+            "cache": self._cache.stats(),
+            "single_flight": self._flights.stats(),
+            "http": self.sources.http.stats(),
+            "disk_cache": self._disk.stats() if self._disk is not None else None,
+            "llm_calls": dict(self.llm_calls.items()),
+            "llm_today": dict(self.llm_today),
+            "llm_scheduler": self.llm.stats(),
+        }
@@ -3,24 +3,33 @@ PREMIUM HOROSCOPE SERVICE
 Улучшенная версия с детальной энергетикой, благоприятными часами,
 прогнозом по времени суток и глубокой интеграцией с матрицей Пифагора
 """
-import asyncio
 import logging
-import os
-from datetime import datetime, time
-from typing import Dict, Optional, List, Tuple
+from datetime import datetime
+from typing import Dict
 import re
 import random
 
-import aiohttp
-from bs4 import BeautifulSoup
+from cache import SingleFlight, get_horoscope_cache
 from config import Config
+from disk_cache import get_disk_cache
+from horoscope_service import soul_number
+from sources import get_source_registry
 
 log = logging.getLogger(__name__)
 
+# Тариф в ключе кеша гороскопов на диске
+TIER = "premium"
+
 
 class PremiumHoroscopeService:
     def __init__(self) -> None:
-        self._cache = {}
+        self._cache = get_horoscope_cache()
+        # Одновременные запросы одного знака ждут одну генерацию
+        self._flights = SingleFlight()
+        # Гороскопы на сегодня переживают перезапуск бота
+        self._disk = get_disk_cache()
+        # Источники гороскопов: общая HTTP-сессия, лимиты и дедлайн
+        self.sources = get_source_registry()
         self.api_key = Config.GROQ_API_KEY
         self.groq_client = None
         
@@ -61,69 +70,17 @@ class PremiumHoroscopeService:
         cleaned = re.sub(r'^[^\w\s]+\s*', '', zodiac)
         return cleaned.strip()
 
-    async def _fetch(self, url: str, timeout: int = 10) -> Optional[str]:
-        """HTTP-запрос с таймаутом"""
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-        
-        try:
-            timeout_obj = aiohttp.ClientTimeout(total=timeout)
-            async with aiohttp.ClientSession(headers=headers, timeout=timeout_obj) as session:
-                async with session.get(url, ssl=False) as resp:
-                    if resp.status == 200:
-                        html = await resp.text()
-                        log.info(f"✅ Получен контент с {url}")
-                        return html
-                    else:
-                        log.warning(f"⚠️ Статус {resp.status} для {url}")
-        except Exception as exc:
-            log.error(f"❌ Ошибка запроса к {url}: {exc}")
-        return None
-
-    async def _parse_mail_ru(self, zodiac_en: str) -> Optional[str]:
-        """Парсит Mail.ru"""
-        url = f"https://horo.mail.ru/prediction/{zodiac_en}/today/"
-        html = await self._fetch(url)
-        if not html:
-            return None
+    async def start(self) -> None:
+        """Открывает общую HTTP-сессию"""
+        await self.sources.start()
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            article = soup.find("div", class_="article__item")
-            if article:
-                paragraphs = article.find_all("p")
-                if paragraphs:
-                    content = " ".join([p.get_text(strip=True) for p in paragraphs])
-                    if len(content) > 50:
-                        return content[:800]
-        except Exception as e:
-            log.error(f"❌ Ошибка парсинга Mail.ru: {e}")
-        return None
-
-    async def _parse_rambler(self, zodiac_en: str) -> Optional[str]:
-        """Парсит Rambler"""
-        url = f"https://horoscopes.rambler.ru/{zodiac_en}/"
-        html = await self._fetch(url)
-        if not html:
-            return None
-
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            main_div = soup.find("div", {"data-mt-part": "article"})
-            if main_div:
-                paragraph = main_div.find("p")
-                if paragraph:
-                    content = paragraph.get_text(strip=True)
-                    if len(content) > 50:
-                        return content[:800]
-        except Exception as e:
-            log.error(f"❌ Ошибка парсинга Rambler: {e}")
-        return None
+    async def close(self) -> None:
+        """Закрывает HTTP-сессию"""
+        await self.sources.close()
+        if self._disk is not None:
+            await self._disk.flush()
 
-    async def parse_horoscopes(self, zodiac_sign: str) -> Dict[str, str]:
+    async def parse_horoscopes(self, zodiac_sign: str, deadline: float = Config.PARSE_DEADLINE) -> Dict[str, str]:
         """Парсит гороскопы параллельно"""
         zodiac_clean = self._clean_zodiac_name(zodiac_sign)
         zodiac_map = self._get_zodiac_mapping()
@@ -131,18 +88,7 @@ class PremiumHoroscopeService:
         
         log.info(f"🔮 Парсинг для {zodiac_sign} ({zodiac_en})")
         
-        tasks = [
-            self._parse_mail_ru(zodiac_en),
-            self._parse_rambler(zodiac_en),
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        horoscopes = {}
-        if results[0] and not isinstance(results[0], Exception):
-            horoscopes["Mail.ru"] = results[0]
-        if results[1] and not isinstance(results[1], Exception):
-            horoscopes["Rambler"] = results[1]
+        horoscopes = await self.sources.fetch_all(zodiac_en, deadline)
         
         log.info(f"✅ Получено гороскопов: {len(horoscopes)}")
         return horoscopes
@@ -511,15 +457,42 @@ class PremiumHoroscopeService:
         
         return "\n".join(result)
 
+    def personalization_key(self, user_data: Dict) -> str:
+        """
+        Часть ключа кеша, от которой зависит текст: число души (персональный
+        анализ и счастливые числа) и цифры, которых в матрице три и больше
+        """
+        soul = soul_number(user_data)
+        cells = (user_data.get("matrix") or {}).get("cells") or {}
+        strong = "".join(sorted(str(num) for num, count in cells.items() if count >= 3))
+        return f"soul{soul if soul is not None else '-'}|strong{strong}"
+
     async def get_daily_horoscope(self, user_data: Dict) -> str:
         """Главный метод получения премиум гороскопа"""
         zodiac = user_data.get("zodiac", "Овен")
         today = datetime.now().strftime("%Y-%m-%d")
-        cache_key = f"premium_{zodiac}_{today}"
+        personalization = self.personalization_key(user_data)
+        cache_key = f"premium_{zodiac}_{today}_{personalization}"
 
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             log.info(f"📦 Кешированный гороскоп для {zodiac}")
-            return self._cache[cache_key]
+            return cached
+
+        return await self._flights.run(
+            cache_key, lambda: self._generate_daily(user_data, zodiac, today, personalization, cache_key)
+        )
+
+    async def _generate_daily(
+        self, user_data: Dict, zodiac: str, today: str, personalization: str, cache_key: str
+    ) -> str:
+        """Генерирует премиум гороскоп и сохраняет его в кеш (один раз на ключ)"""
+        if self._disk is not None:
+            stored = await self._disk.get(TIER, zodiac, today, personalization)
+            if stored is not None:
+                log.info(f"💾 Гороскоп для {zodiac} загружен из кеша на диске")
+                self._cache.set(cache_key, stored)
+                return stored
 
         log.info(f"🚀 Генерация PREMIUM гороскопа для {zodiac}")
         
@@ -536,7 +509,18 @@ class PremiumHoroscopeService:
         )
         
         # Кешируем
-        self._cache[cache_key] = final_forecast
+        self._cache.set(cache_key, final_forecast)
+        if self._disk is not None:
+            self._disk.put(TIER, zodiac, today, final_forecast, personalization)
         log.info(f"✅ Premium гороскоп готов")
         
         return final_forecast
+
+    def stats(self) -> Dict[str, object]:
+        """Метрики кеша и объединения запросов"""
+        return {
+            "cache": self._cache.stats(),
+            "single_flight": self._flights.stats(),
+            "http": self.sources.http.stats(),
+            "disk_cache": self._disk.stats() if self._disk is not None else None,
+        }
@@ -0,0 +1,224 @@
+"""
+Извлечение текста гороскопа из HTML-страниц источников.
+
+Вместо построения дерева всей страницы (BeautifulSoup) страница потоково
+разбирается токенизатором html.parser: запоминаются только абзацы внутри
+нужных блоков, а разбор прекращается, как только найден блок с наивысшим
+приоритетом. Разбор выполняется в отдельном пуле потоков, чтобы большие
+страницы не останавливали обработку остальных апдейтов Telegram.
+
+Результат совпадает с прежним кодом на BeautifulSoup: для каждого селектора
+берется первый подходящий блок, текст абзаца — как get_text(strip=True).
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Callable, List, NamedTuple, Optional
+
+from config import Config
+
+# Размер порции, которой страница подается токенизатору
+FEED_SIZE = 16 * 1024
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+class Target(NamedTuple):
+    """Селектор блока: тег и, при необходимости, атрибут со значением"""
+    tag: str
+    attr: Optional[str] = None
+    value: Optional[str] = None
+
+    def matches(self, tag: str, attrs) -> bool:
+        if tag != self.tag:
+            return False
+        if self.attr is None:
+            return True
+        for name, value in attrs:
+            if name != self.attr or value is None:
+                continue
+            if name == "class":
+                if self.value in value.split():
+                    return True
+            elif value == self.value:
+                return True
+        return False
+
+
+# Селекторы в порядке приоритета, как в прежних парсерах
+MAIL_RU_TARGETS = (
+    Target("div", "class", "article__item"),
+    Target("article"),
+    Target("div", "data-qa", "Article"),
+)
+RAMBLER_TARGETS = (
+    Target("div", "data-mt-part", "article"),
+    Target("article"),
+)
+
+
+class _Block:
+    """Первый найденный блок для селектора и его абзацы"""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.open = False
+        self.closed = False
+        self.paragraphs: List[str] = []
+        self.current: Optional[List[str]] = None
+        self.p_depth = 0
+
+
+class _Extractor(HTMLParser):
+    def __init__(self, targets, first_paragraph: bool, min_length: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.targets = targets
+        self.first_paragraph = first_paragraph
+        self.min_length = min_length
+        self.blocks = [None] * len(targets)
+        self.result: Optional[str] = None
+        self.done = False
+        self._text: List[str] = []
+        self._skip = 0
+
+    # Текст между тегами может прийти несколькими кусками — склеиваем
+    # его до ближайшего тега и только потом обрезаем пробелы
+    def _flush(self) -> None:
+        if not self._text:
+            return
+        text = "".join(self._text).strip()
+        self._text = []
+        if not text or self._skip:
+            return
+        for block in self.blocks:
+            if block is not None and block.open and block.current is not None:
+                block.current.append(text)
+
+    def handle_data(self, data: str) -> None:
+        self._text.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_starttag(self, tag, attrs) -> None:
+        self._flush()
+        if tag in ("script", "style"):
+            self._skip += 1
+        for i, target in enumerate(self.targets):
+            block = self.blocks[i]
+            if block is None:
+                if target.matches(tag, attrs):
+                    block = self.blocks[i] = _Block()
+                    block.open = True
+                    block.depth = 1
+                continue
+            if not block.open:
+                continue
+            if tag == target.tag:
+                block.depth += 1
+            if tag == "p":
+                if block.p_depth == 0:
+                    block.current = []
+                block.p_depth += 1
+
+    def handle_startendtag(self, tag, attrs) -> None:
+        self._flush()
+
+    def handle_endtag(self, tag) -> None:
+        self._flush()
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        for i, target in enumerate(self.targets):
+            block = self.blocks[i]
+            if block is None or not block.open:
+                continue
+            if tag == "p" and block.p_depth:
+                block.p_depth -= 1
+                if block.p_depth == 0:
+                    self._end_paragraph(block)
+            if tag == target.tag:
+                block.depth -= 1
+                if block.depth == 0:
+                    self._close(block)
+        self._decide()
+
+    def _end_paragraph(self, block: _Block) -> None:
+        block.paragraphs.append("".join(block.current))
+        block.current = None
+        if self.first_paragraph:
+            self._close(block)
+
+    def _close(self, block: _Block) -> None:
+        # Незакрытый абзац заканчивается вместе с блоком
+        if block.current is not None:
+            block.paragraphs.append("".join(block.current))
+            block.current = None
+        block.open = False
+        block.closed = True
+
+    def _text_of(self, block: _Block) -> Optional[str]:
+        if not block.paragraphs:
+            return None
+        text = block.paragraphs[0] if self.first_paragraph else " ".join(block.paragraphs)
+        return text if len(text) >= self.min_length else None
+
+    def _decide(self, final: bool = False) -> None:
+        """Результат известен, когда все более приоритетные блоки отвергнуты"""
+        for block in self.blocks:
+            if block is None or not block.closed:
+                if not final:
+                    return
+                if block is None:
+                    continue
+            text = self._text_of(block)
+            if text is not None:
+                self.result = text
+                self.done = True
+                return
+        if final:
+            self.done = True
+
+    def finish(self) -> Optional[str]:
+        self._flush()
+        for block in self.blocks:
+            if block is not None and block.open:
+                self._close(block)
+        self._decide(final=True)
+        return self.result
+
+
+def extract_text(html: str, targets, first_paragraph: bool = False, min_length: int = 1) -> Optional[str]:
+    """
+    Текст первого подходящего блока по списку селекторов.
+
+    Для каждого селектора берется первый блок в документе; его текст — все
+    абзацы через пробел (или только первый абзац при first_paragraph).
+    Блок подходит, если текст не короче min_length; иначе пробуем следующий
+    селектор.
+    """
+    parser = _Extractor(targets, first_paragraph, min_length)
+    for start in range(0, len(html), FEED_SIZE):
+        parser.feed(html[start:start + FEED_SIZE])
+        if parser.done:
+            return parser.result
+    parser.close()
+    return parser.finish()
+
+
+def extract_mail_ru(html: str) -> Optional[str]:
+    """Все абзацы статьи Mail.ru"""
+    return extract_text(html, MAIL_RU_TARGETS)
+
+
+def extract_rambler(html: str) -> Optional[str]:
+    """Первый абзац статьи Rambler длиннее 50 символов"""
+    return extract_text(html, RAMBLER_TARGETS, first_paragraph=True, min_length=51)
+
+
+async def run_parser(func: Callable[[str], Optional[str]], html: str) -> Optional[str]:
+    """Выполняет разбор страницы в пуле потоков, не блокируя event loop"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=Config.PARSE_WORKERS, thread_name_prefix="html-parse")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, func, html)
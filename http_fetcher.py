@@ -0,0 +1,177 @@
+"""
+Общий HTTP-клиент для парсинга источников гороскопов.
+
+Одна долгоживущая aiohttp.ClientSession на сервис: соединения к Mail.ru и
+Rambler переиспользуются (keep-alive), DNS-ответы кешируются, а число
+одновременных соединений ограничено. Сессия создается при старте бота
+(или при первом запросе) и закрывается при остановке.
+
+Тело ответа читается потоком и не дальше HTTP_MAX_BODY байт. fetch_parsed()
+запоминает ETag/Last-Modified вместе с результатом разбора страницы и
+отправляет условный запрос: на ответ 304 страница не скачивается и не
+разбирается заново.
+
+Перед запросом проверяется CircuitBreaker хоста: отключенный источник
+пропускается без запроса, а таймаут подбирается по времени его ответов.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from cache import LRUCache
+from circuit_breaker import breaker_stats, get_breaker
+from config import Config
+
+T = TypeVar("T")
+
+# Размер порции при потоковом чтении тела ответа
+READ_CHUNK = 16 * 1024
+
+log = logging.getLogger(__name__)
+
+
+class _Response(NamedTuple):
+    status: int
+    html: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class _Validated(NamedTuple):
+    """Валидаторы ответа и результат разбора этой версии страницы"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    parsed: object
+
+
+class HttpFetcher:
+    def __init__(self, headers: Optional[Dict[str, str]] = None) -> None:
+        self.headers = headers or {}
+        self.max_body = Config.HTTP_MAX_BODY
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._validated = LRUCache(Config.HTTP_VALIDATOR_CACHE_SIZE)
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_read = 0
+        self.truncated = 0
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=Config.HTTP_POOL_LIMIT,
+            limit_per_host=Config.HTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=Config.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=Config.HTTP_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+            ssl=False,
+        )
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+
+    async def start(self) -> None:
+        """Создает сессию (должно вызываться внутри работающего event loop)"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            log.info("🌐 HTTP-сессия для источников создана")
+
+    async def close(self) -> None:
+        """Закрывает сессию и все соединения пула"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            log.info("🌐 HTTP-сессия для источников закрыта")
+        self._session = None
+
+    async def _read(self, resp: aiohttp.ClientResponse, url: str) -> str:
+        """Читает тело потоком, останавливаясь на лимите max_body"""
+        data = bytearray()
+        async for chunk in resp.content.iter_chunked(READ_CHUNK):
+            data += chunk
+            if len(data) >= self.max_body:
+                del data[self.max_body:]
+                self.truncated += 1
+                log.info(f"✂️ Ответ {url} обрезан до {self.max_body} байт")
+                break
+        self.bytes_read += len(data)
+        return data.decode(resp.charset or "utf-8", errors="replace")
+
+    async def _get(self, url: str, timeout: int, validated: Optional[_Validated] = None) -> _Response:
+        """GET-запрос с обработкой ошибок (статус 0 — запрос не удался)"""
+        breaker = get_breaker(urlsplit(url).netloc or url)
+        if not breaker.allow():
+            log.info(f"⏭️ Источник {breaker.name} временно отключен, пропускаем {url}")
+            return _Response(0)
+
+        await self.start()
+        headers = {}
+        if validated is not None:
+            if validated.etag:
+                headers["If-None-Match"] = validated.etag
+            if validated.last_modified:
+                headers["If-Modified-Since"] = validated.last_modified
+        self.requests += 1
+        timeout = breaker.timeout(timeout)
+        started = time.monotonic()
+        try:
+            timeout_obj = aiohttp.ClientTimeout(total=timeout)
+            async with self._session.get(url, timeout=timeout_obj, headers=headers) as resp:
+                if resp.status == 304 and validated is not None:
+                    breaker.record_success(time.monotonic() - started)
+                    self.not_modified += 1
+                    log.info(f"♻️ {url} не изменился (304)")
+                    return _Response(304)
+                if resp.status == 200:
+                    html = await self._read(resp, url)
+                    breaker.record_success(time.monotonic() - started)
+                    log.info(f"✅ Успешно получен контент с {url} ({len(html)} символов)")
+                    return _Response(200, html, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                else:
+                    log.warning(f"⚠️ Статус {resp.status} для {url}")
+        except asyncio.CancelledError:
+            # Запрос отменен вызывающим (не ошибка источника)
+            breaker.record_cancel()
+            raise
+        except asyncio.TimeoutError:
+            log.error(f"⏱️ Таймаут {timeout:.1f} с при запросе к {url}")
+        except Exception as exc:
+            log.error(f"❌ Ошибка при запросе к {url}: {type(exc).__name__}: {exc}")
+        breaker.record_failure()
+        return _Response(0)
+
+    async def fetch(self, url: str, timeout: int = 10) -> Optional[str]:
+        """Выполняет GET-запрос с таймаутом и обработкой ошибок"""
+        return (await self._get(url, timeout)).html
+
+    async def fetch_parsed(
+        self,
+        url: str,
+        parse: Callable[[str], Awaitable[Optional[T]]],
+        timeout: int = 10,
+    ) -> Optional[T]:
+        """
+        Загружает и разбирает страницу, повторно используя разбор при 304.
+
+        Результат parse() запоминается вместе с ETag/Last-Modified ответа;
+        следующий запрос к тому же url будет условным.
+        """
+        validated = self._validated.get(url)
+        response = await self._get(url, timeout, validated)
+        if response.status == 304:
+            return validated.parsed
+        if response.html is None:
+            return None
+
+        parsed = await parse(response.html)
+        if parsed is not None and (response.etag or response.last_modified):
+            self._validated.set(url, _Validated(response.etag, response.last_modified, parsed))
+        return parsed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "bytes_read": self.bytes_read,
+            "truncated": self.truncated,
+            "sources": breaker_stats(),
+        }
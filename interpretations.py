@@ -1,192 +1,112 @@
 # interpretations.py
+"""
+Общие для процесса тексты интерпретаций только для чтения.
 
-class Interpretations:
-    def __init__(self):
-        self.matrix_data = self._create_matrix_interpretations()
-        self.tasks_data = self._create_tasks_interpretations()
+Тексты лежат в interpretations_data.py и загружаются при первом обращении,
+а не при импорте модуля; все экземпляры Interpretations используют одно
+хранилище.
+
+При загрузке каждая комбинация (цифра 1-9, количество 0..MAX_COUNT, пол)
+заранее разрешается в текст по единым правилам resolve_matrix_key(),
+поэтому выбор интерпретации ячейки — это индексация плотной таблицы.
+"""
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import List, Optional
+
+# Максимальное количество одной цифры в матрице (в полном массиве не больше 19 цифр)
+MAX_COUNT = 24
+GENDERS = ("women", "men")
+
+_store: Optional["InterpretationStore"] = None
+
+
+def resolve_matrix_key(digit: int, count: int, keys) -> Optional[str]:
+    """
+    Единое правило выбора ключа интерпретации для ячейки матрицы.
+    
+    Нет цифр — ключ "{цифра}0"; иначе цифра, повторенная count раз;
+    если такого ключа нет и цифр больше 5, берем все кроме первых 5.
+    """
+    if count == 0:
+        key = f"{digit}0"
+        return key if key in keys else None
     
-    def _create_matrix_interpretations(self):
-        """Создание словаря с интерпретациями матрицы"""
-        return {
-            "1": {
-                "women": """деспот. При рождении милосердные, альтруисты, быстро адаптируются к миру, если что-то идет не так, но цена такой адаптации – болезни. Необходимо научиться проживать эмоции. Цена непрожитых эмоций – странная семейная жизнь или неожиданные болезни. В комбинации с какой-то цифрой может получать онкологию. В основе характера максимальная доброта, нежность, сострадательность. Но, в какой-то момент происходит сильный слом. Женщина остается в состоянии я сама. Карта переворачивается. В итоге, внутри нежная и ранимая, снаружи кирпич. Из-за того, что на них часто наваливают большое кол-во задач (внутри хрупкость) происходят болезни.(ОПЖ: смерть насильственного характера, как правило всегда).Рекомендации как проживать эмоции: проживать свои эмоции, 3 часа есть у Человека, чтобы эвакуировать эмоции; отдавать или делегировать задачи.
-Как эвакуировать чувства? 1 способ: плюнуть смачно от души (2-3 раза)
-2 способ: покричать (важно чтобы голос был направлен на землю, т.е. не на повышение шел, а на понижение)
-3 способ: удары! Что-то бросить, разбить, ударить.""",
-                "men": """крайне любит отыгрываться на других людях, абьюзит семью. Не нашел свое предназначение/путь -> деспот (злость, агрессия, лицемерие, зависть)
-Часто если у мужчины 1 / 11, в роду женщины были очень сильными из поколения в поколение, что мужской род ослаб."""
-            },
-            "11": {
-                "women": """семейная женщина, приоритет семья, будет стараться принести в дом ресурсы, можно легко договориться, очень мягкая, уступчивая, ведомая""",
-                "men": """много страхов. Мягкий и уступчивый характер. Много ограничивающих убеждений. Думают своей головой. Часто, симбиоз с мамой, созависимость от мнения женщины. (Женщина рядом с таким мужчиной должна быть направляющей рукой)
-Часто если у мужчины 1 / 11, в роду женщины были очень сильными из поколения в поколение, что мужской род ослаб."""
-            },
-            "111": {
-                "women": """врожденная женская мудрость, хорошая интуиция, важно, чтобы такой человек слышал первый сигнал, который к нему приходит, ведь, у нее сильная родовая интуитивная связь. Нужно уметь слушать себя. Важно раскачивать интуицию.""",
-                "men": """хороший показатель. Ценности: семья, дети. Если женщина, находящаяся рядом ничего не хочет, то такой мужчина не стремится никуда. У него хорошие результаты, когда он находится с женой, которой все мало."""
-            },
-            "1111": {
-                "women": """мужская сила характера, внутри есть структура, воля, цель. Этой женщине важно делать карьеру. Реализоваться в социуме. Часто, пока такая женщина не найдет место под солнцем, не может устроить личную жизнь. Есть соперничество с мужчинами( в детстве с отцом, после на работе и семье).""",
-                "men": """идеальный характер. Подарок судьбы. Значит, что в роду есть поток силы. 
-Ответственный, высокое целеполагание, амбиции. Может быть добрым, гибким, договариваться, пчелка. Часто занимает высокий пост, так как дипломатичен"""
-            },
-            "11111": {
-                "women": """тираны. Продавливают под себя мир и людей. Жестокие, манипуляторы, злопамятная. Часто, такому человеку до определенного момента все равно, что происходит, пока дело не коснется ее личных моральных принципов""",
-                "men": """поздно взрослеет. Огромная сила (упакована до 26-31 г), потом постепенно распаковывается. Значит в роду были сильные, решительные мужчины из п.в.п. и они передали ему поток силы, но он начнет распаковываться только тогда, когда человек начнет взрослеть."""
-            },
-            "2": """нейтрал (но больше относятся к дефицитникам). Могут обмениваться энергией. 
-Хватает энергии где-то до 40 лет, а после энергия уходит скачками (ушла, остановилась и т.д). В 45 лет тотальный уход энергии. В 50 сил нет. Это вампирский показатель. (Истинные вампиры никого не провоцируют, у них на это нет сил.Вампиры так же те, у кого нет 2. Как правило конфликты разжигают либо доноры (четыре 2) либо (три, пять 2)).""",
-            "22": """донор энергии. Как правило доживают до старости. Нужно как можно больше двигаться, делать дела с 7го возраста. (делиться такому человеку энергией крайне полезно) Когда донор устал, ему важны: сон, одиночество, близость к воде. Должен обязательно делиться энергией.""",
-            "222": """ведьмы/ведьмаки. Родители ведующие. Равное количество вампирической и донорской энергии. Для таких людей есть три тотальных запрета: нельзя ревновать и завидовать (включается программа оттока финансового потока), рассказывать о своих планах (исключение: люди, у которых мы можем взять совет и тем, с кем ведет совместные дела). Часто такие люди сами привлекают к себе болезни, если у них происходит уныние, поэтому такому человеку можно страдать только 24 часа. Если происходит стресс, то он быстро оказывается на дне стрессовой воронки. 
-Им сложно выбраться из воронки депрессии, поэтому страдаем мало.""",
-            "2222": """обязаны быть в постоянном активном движении. Это люди с профицитом энергии. Такой профицит вредит. Часто, если не растрачивает туда куда нужно, то человек встает на путь саморазрушения. Следовательно, депрессии, плохое настроение, панические атаки. Именно поэтому, движение для них – жизнь. Пока он действует – сил много, но стоит ему скатиться в лень, будет крайне сложно восстановить энергию. 
-Есть риск серьезных депрессий.""",
-            "22222": """ведьмы/ведьмаки. Родители ведующие. Равное количество вампирической и донорской энергии. Для таких людей есть три тотальных запрета: нельзя ревновать и завидовать (включается программа оттока финансового потока), рассказывать о своих планах (исключение: люди, у которых мы можем взять совет и тем, с кем ведет совместные дела). Часто такие люди сами привлекают к себе болезни, если у них происходит уныние, поэтому такому человеку можно страдать только 24 часа. Если происходит стресс, то он быстро оказывается на дне стрессовой воронки. 
-Им сложно выбраться из воронки депрессии, поэтому страдаем мало.""",
-            "20": """истинные вампиры. С 26-28 лет (зависит от характера) постепенно начинают терять силы. Если у доверителя характер две- три 1, то с 26 лет, если четыре 1, то 28 лет. С 40 сильная энергопотеря. В 50 тотальные болезни. Избежать энергопотерю легко: восполнение у женщины: контакт с природой в летнее время, море, солнце, жизнь за городом, прогулки. Зимой: сон до 23:00 ложиться, каждодневные дыхательные практики (10-15 минут дыхание по стрельниковой), ежедневное удовлетворение хочушек(хочу вкусный чай/кофе/блюдо, сходить куда-то). (Отдавать деньги с благодарностью, иначе, если нет этого чувства, то деньги не возвращаются и набора энергии не происходит). Также девушкам хорошо заниматься танцами, творчеством(любым).
-Набор энергии у мужчин: часто М хотят набирать энергию через алкоголь,потому что э то самое простое. Это не верный выход.Т.к  70 % энергии добавляет алкоголь, а потом сильнейший отток, на все 99%. Равивать духовность (М достаточно верить в то, что он хочет), расширение мировоззрения, помочь принять другим людям, что мир многогранен. Нужны нежность, секс, тактильность, объятия. Отдавайте сами и получайте от женщин. Крайне важно иметь прекрасные отношения с мамой и сестрой, а с дочерью и женой отношения могут быть любыми. Нужна еда приготовленная с любовью.
-Когда в роду много боли, тяжелых испытаний – 2 не приходит, а приходят дефицитники. Когда ни одной двойки – значит в роду не осталось права на жизнь.""",
-            "3": """норма. Разумный, реалистичный, практичный.""",
-            "33": """способность находить нестандартные решения в разных ситуациях. Большой поток родового креатива, когда в роду было много талантливых людей. Однако, такие люди любят накопительство, иногда летают в облаках, поэтому таким людям важно делать упор на материальное.""",
-            "333": """видит мир через призму красоты.""",
-            "3333": """много страхов за многие вещи. Часто, страх за все. Часто, есть программа страха потери репутации.""",
-            "33333": """много страхов за многие вещи. Часто, страх за все. Часто, есть программа страха потери репутации.""",
-            "30": """боятся потерять финансовый достаток. В родовой системе были серьезные потери денег. Страхи, что неспособность быть суперчеловеком. Не умеют анализировать пространство ситуаций. Часто делают ошибки, много анализируют. 
-Такому человеку, чтобы хорошо жить, нужно переживать все на собственном опыте.""",
-            "4": """сексуальная энергия: достаточно стабильная потребность быть любимым, тяжело переносят насилие. Важно в отношениях мужчина – женщина не придать самого себя. 
-Годами могут без партнера. Деторождение/энергия прихода детей: кол-во детей = желанию.   хорошее здоровье, хорошая способность к восстановлению. Болезни в основном от нервов, психосоматические. Если есть постоянное чувство вины, то часто ломается эндокринная система, появляются заболевания ССС. Рекомендации: чувствовать свое тело, понимать что нужно, а что нет, выбрасывать негативные эмоции, не судить (активатор болезни такого человека практический всегда – обида). 
-Важно, прощать, принимать, благодарить и легко отпускать.""",
-            "44": """не богатырское, но очень крепкое здоровье!
-Люди с невероятным ресурсом для продолжения Рода. Дар быть сексуальным, причем человек по желанию может включать и выключать этот дар. Часто, чем старше такая женщина – тем моложе их муж, потому что они долго остаются молодыми, именно с точки зрения родовой энергии.  люди с большим ресурсом к продолжению рода. Могут начинать все сначала ооочень много раз за жизнь. У таких людей часто до 48-49 лет остается способность к зачатию. И они могут рожать много детей без проблем! Энергия прихода детей: красивые, способные, умные дети.
-Мужчины с 44 - это ходаки, ловеласы""",
-            "444": """не богатырское, но очень крепкое здоровье!
-Часто люди, которые любят сексуальные извращения, изыски. «По вере вашей будет дано вам». Поверив во что-то, такой человек начинает жить и пропагандировать всем. Из одной плоскости в другая. Часто, директивно склонен влиять на других людей.""",
-            "4444": """богатырский потенциал здоровья и восстановления. В любом состоянии такие люди могут агрессировать.  У кого 4444 могут словом трансформировать программы других людей. Такой человек, вложив в слово «я тебя благодарю» энергию, может зарядить человека на большие успехи, так же как и «ты меня бесишь» могут пробить человеческое поле.""",
-            "40": """нет право на продолжение рода. 
-Прекрасная сексуальная фантазия, но в реальности часто не получается такое  найти, поэтому они могут разругаться из-за мелочи. Они не понимают, что все люди  разные. тяжелая история. Нарушена связь головы и тела. Тело не дает сигнал вовремя,  что оно заболело. Поэтому, тяжело восстанавливаются . Тотальный риск по здоровью:  ЖКТ, ССС, опорно-двигательный аппарат, психосоматика и по части неврологии. 
-Часто есть проблемы с зачатием, с репродуктивной системой. 
-Деторождение: для рождения здоровых детей таким людям нужно большое внимание уделять своему здоровью, нужно обязательно хотеть ребенка, эмоционально и морально быть готовым к дитю, обоюдное желание партнеров должно быть и знать идеальное время для прихода детей. Важный показатель на который мы смотрим: если у человека есть двойки( 1<), то лето – хороший период для беременности, а если нет – осень и зима. 
-Если сходятся два человека без единой 4, то большой риск рождения слабых и больных детей. Тотально соблюдать все правила! Очень большой риск, что в обоих родах нет энергии для продолжения рода. Из-за этого, люди часто имеют программу бесплодия или тяжелого прихода детей\\дети больные\\несколько ЭКО. Часто, обоюдное отсутствие 4 = тяжелая программа не прихода детей.""",
-            "5": {
-                "women": """нормальная женщина. Могут выбирать рожать или нет.""",
-                "men": """мужчина в мужском теле. М, который настоящий мужицкий мужик. 
-Прекрасные наставник для подчиненных и детей. Основательно подходят к выбору спутницы. За ним как за каменной стеной."""
-            },
-            "55": """все что дано такому человеку должен отдать детям. Важно возрождение рода. 
-Хорошо не делать аборты, рожать детей и помогать им. Все ресурсы, которые идут к этим людям идут через детей. Если Ч рожает ребенка, то к нему приходят очень хорошие возможности, а если аборт – возможности уходят. Для мужчин с таким показателем важно, чтоб были секс, деньги и уметь прощать. Женщинам, радость, личная жизнь, чувствование вкуса жизни. Часто, бывает, что, когда у таких людей нет детей, значит, что они что-то плохо сделали детям, им нужно вымолить ребенка, прочить родных мужа, потому что каналы детей закрываются, когда что-то плохое делает такой человек для детей. Все что дано от мира таким людям, дано для детей. 
-Тотальный запет на аборты. Если мужчина знает, что у женщины, которая сделала от него аборт такой показатель(55), то у М тотально схлопывается финансовый канал, начинаются проблемы в мочеполовой системе, закрывается возможность расти. У женщин блокируется радость, личная жизнь, сокращение продолжительности жизни и программа онкологии.""",
-            "555": """когда в родовой системе произошел сбой в 3, 4 поколении, жесткий отказ от любви. Например, вышла замуж не по любви, не пришла к любимому мужчине, не вышла за любимого или одного ребенка в семье любили, другого нет. Большая потребность любить у таких людей и быть любимым. Нет возможности удержать любовь. Тотально одиноки в паре. Должны выбирать любовь, делать все по любви. 
-Тяжелая родовая программа. Бывает в 2х случаях: человек не выбрал любовь к мужчине, отказался от любви или есть история по детям, кто-то детей любил, а кто-то нет. Такому человеку есть 2 тотальные задачи на жизнь. 
-1) Всегда и везде выбирать любовь (если любит печь пироги, значит должен стать пекарем и тд). 
-2) Научиться опираться только на себя, иначе, такому человеку постоянно не хватает любви. 
-3) Сонастроить свою жизнь со своими потребностями. 
-Эта программа замедленного действия. Часто, лет в 30 начинает активно действовать и такой человек остается совершенно один, если он всю жизнь не выбирает себя.""",
-            "50": {
-                "women": """тяжелый показатель. Внутри тела есть структура, есть воля, целепологание, внутренний стержень, контроль, управление. Такой Ж важно идти в социум, нельзя долго сидеть дома, нельзя выбирать работу, где нет карьерного роста или финансового, нельзя ограничивать круг общения, потому что дома такая Ж быстро деградирует. Задача: не потерять работу в социуме и родить детей. Для смягчения данного показателя.""",
-                "men": """очень тяжелый показатель. Глубинная большая доброта, эмоциональный, ранимый, переживает за близких. Такая энергия делает М управленцем. Воспринимает этот мир через эмоций, любовь. М с такими показателями должны постоянно доказывать, что они мужчины. Как доказывать: физическая компенсация (спорт, вызывающее плохое поведение), стремление носить форму и проф. Идентичность( любят притягиваться к М компаниям, работа в силовых структурах), стремление к финансовому успеху(но если у Ч плохо работает родовой финансовый канал, то такому Ч очень сложно, происходят болезни ЖКТ, инсульты, инфаркты). Часто такие М любят завоевывать внимание Ж. МБ дамскими угодниками. Еще одна компенсация – бегство от реальности (алкоголь и тд). Нельзя говорить, что он ведет себя как баба, иначе в ответ будет жестокость. С 8 лет такого мальчика мама не имеет права наказывать, только папа. Мальчики всю жизнь помнят наказания от женщин и переносят тяжело. 
-Часто у таких М много претензий к матери, много любви и боли. Такие М проходят 3 шоковые травмы: 2-8 лет отвержение, возникает чувство я никому не нужен. 9-13 лет осознование, появляется приставка очень (очень ранимый, очень закрытый, очень злопамятный). Нет способности забывать боль. 13-21 год период компенсации, в этот период М хотят много зарабатывать, стать директором, получить власть, идут в агрессивный спорт, на службу. Для такого М нужна правильная Ж. Она д.б. ухоженной, что-то представлять из себя в социуме. Хвалить его и его маму. Важно ее отношение к его маме. 
-Секреты в отношениях с такими М: 
-1. Принципиально важные женщины для такого М это мама и дочка. 
-2. У них много тревожностей, страх не быть мужиком, поэтому нужно постоянно хвалить его, подтверждать его силу, самцовость, сексуальность. 
-3. Склонны садомазо (находят слабого на работе, унижают, подтрунивают. Часто находят жертву в семье, к примеру кошку и начинает на нее ворчать. В сексе м.б. жестковатыми, а если не проявляют это, то значит они не доверяют своей Ж либо подавляют чувства (программа онкологии в дальнейшем).
-Что если Ж решила уйти от такого М?
-1. Уходить медленно, постепенно.
-2. Признать свою вину.
-3. Готовиться к мести (будет мстить до последнего). Такой М судится постоянно, делит все.  Если расстаться нормально, важно для М изменить свое мировоззрение. Если воспитание отстой, включается программа мести.
-4. Страх быть раздавленным( когда Ж настолько сильная, что может его раздавить, прихлопнуть)."""
-            },
-            "6": """норма. Умеет работать руками, с детства приучен, а если нет, то нет склонности к работе руками. Как правило не имеют ремесленников в роду, или малое кол-во таких сил. 
-когда она просто одна, это значит что во-первых в Роду не было серьезных потерь денег. Род имеет некоторую финансовую стабильность. Такой человек умеет договариваться с другими людьми. Прекрасно работает с помощью рук, кстати говоря у него руки заточены на нужное. Для него конечно же важно, чтобы он мог доносить информацию другим людям.
-Вообще вопрос с информацией у шестёрок никто практически не поднимает, я решила это поднять, объясню почему. Потому что на самом деле человек имеющий одну шестёрку, может прекрасно доносить другим людям различные информационные потоки. У него есть вход в точку Знаний и в точку Любви, соответственно у них действительно большой показатель желания помочь. И за счет желания помочь, они прекрасно доносят до других людей информацию. Они могут быть прекрасными учителями, могут быть прекрасными, например, наставниками. Потому что эти люди чётко и точно говорят вещи, которые в будут приняты другими людьми к сведению и реализованы.""",
-            "66": """манипуляторы. Дипломаты, умеют хорошо работать руками. Профессии, которые связаны с руками хорошо подойдут. Этот показатель дает право человеку быть крутым торговцем.
-эти люди, умеющие прекрасно манипулировать. Соответственно, они могут за счет этого потока информации, достаточно большого, они могут эту информацию немного искажать и преподносить ее под соусом, под которым сами посчитают нужным падать. Они конечно дипломаты. Они конечно хитренькие. Они правда могут договориться. Могут прекрасно что-то делать руками. Могут манипулировать различными способами. Они вообще манипулируют сами того не замечая. У них когда происходят их общение с кем-то, их очень хочется слушать. Они действительно обладают особым магнетизом, особым состоянием голоса, когда голос просто убаюкивает невероятно и возникают какие-то особые ассоциации с этим человеком.""",
-            "666": """кодировщик на страхи. Все что на уме, то и происходит. Он если что-то говорит, то он направляет эту энергию на реализацию этой истории. Т.е. если мама говорит вам: - ты никогда не выйдешь замуж, значит так оно и будет. Такой человек может программировать и перепрограмировать судьбу таких людей. Поэтому, важно, убрать родовые страхи. Эта программа связана с тем, что человек имеет много страхов ( а вдруг не получится, что-то произойдет и тд). Важно научить такого человека договариваться со своим страхом, например: что может произойти если человек опоздает на самолет? Да ничего страшного.. Для такого человека важно обоснование почему не надо бояться, почему его страх несущественный. Если человек умеет управлять этой энергией, то может в положительную сторону программировать жизнь людей. Например, помогает людям сдать хорошо экзамен «желаю сдать тебе экзамен, ты обязательно сдашь!» и т.д.
-это люди, которые действительно умеют очень круто манипулировать. Они вербально очень прекрасно манипулируют. Более того, они имеют, скажем так, способность направлять /вводить другие люди в состояния транса, за счёт этого менять судьбу других людей. Как они это делают? Если такой человек вдруг за что-то боится, то он каким-то невероятным образом входит в поле другого человека и начинает эти страхи туда записывать. Знаете как на веретено ниточку наматывать. Эти страхи оказываются записанными на уровне поля, и начинают работать как негативная, вредоносная программа и человек действительно, ну скажем так, все эти страхи которые были озвучены, или подуманы этими 666,  они в общем-то дойдут до адресата и всё будет ровно так, как говорит человек с 666. Т.е если такой человек боится, что его дочь не выйдет замуж, то такое вполне возможно. Если такой человек биться попасть в ДТП, то такое вполне возможно. 
-Когда ко мне на прием приходят такие люди, я стараюсь выписать их страхи и обсудить с ними эти страхи. Почему? Потому что, если вы с ними не обсудите, то когда он пойдёт в консультацию, из консультации он выйдет, всё будет в порядке да, но например он боится водить машину. Он ездит каждый день на работу, но всё равно он боится. И в какой-то момент  может навлечь на себя или на своих близких достаточно серьезные моменты. В плане каких-то катаклизмов. Он и себе то может, а уж другому-то тем более может. Он даже больше работает на других людей. Если он боится, что не родиться здоровый ребенок, у например, его дочери, то естественно ребёнок здоровым не родится. Они склонны к такой воинственности и достаточно воинственно они защищают вот эти свои страхи. Тяжело им эти страхи переработать. Часто они становятся клиентами психологов, и часто к ним ходят, а результата должного не получают. Как раз в силу того, что вот эти страхи, и в общем-то родовой поток Знаний, а он здесь превышает, грубо говоря он зашкаливает, и как раз активирует вот эту историю с кодированием других людей на какие-то нехорошие вещи.""",
-            "6666": """это достаточно редкий показатель. Как правило, это люди рождённые в 1966 году. Год этот был ознаменован энергетически, как очень сильный. Вот эти шестёрки, они достаточно сильно усиливали силу любого слова. И дети рождённые в этот год, практически все получили большой поток Родовых знаний и Любви. Значит этот родовой поток Знаний и Любви действует на них очень магическим образом. Такие люди сами себе могут такого «накаркать» просто слов нет. Сами себя могут запрограммировать на какие-то проблемы. Практически всегда они могут себе накликать болячки. Кстати говоря у них есть с история с осуждением близких. Когда они своим близким говорят например: «Вот заболею я раком, и тогда ты узнаешь какой я прекрасный был человек и тогда ты узнаешь как тебе будет сложно» и действительно заболевают раком. Ну или вот например у них нет никакой программы онкологии, у них прекрасное здоровье,  у них всё достаточно хорошо и отлично, но они сами себя настроили на такой негативный лад, сами себя раскачали на эту историю, плюс Сила слова и поток Знаний большой,  слово сказано-дело сделано! Результат налицо! Вот поэтому им очень важно следить за своей речью! Потому что у них в самом деле есть право на это вот «накарканье». Но работает оно, не как у 666 (у 666 это у них работает только на других людей в большей степени), то у человека с 6666 в большей степени только на себя. Т.е если он если он на себе поставил крест, не хочет реализовываться, если он сказал «я никогда не буду богатым», «деньги не для меня», то вот эти вот все родовые убеждения, они у этого человека супер триггерят! Супер! И это настолько сильно, настолько для него больно, настолько для него болезненно, что в один прекрасный момент у такого человека просто срывает «кукуху». Срывать «кукуху» может очень сильно. И он сам себе такого там может запрограммировать, что «мама не горюй». Поэтому им нужно объяснять, что им нужно следить за словами, следить за своей речью, следить за чистотой своих помыслов и постараться не желать зла, особенно себе самому, даже в гневе.""",
-            "60": """Если нет 6 у женщин - большое чувство вины за все. Страх, что всем должна. у таких людей очень часто возникает чувство вины, чувство ответственности, чувство «я всем должен». Это говорит, что в Роду были большие потерь денег. Это значит что у человека очень часто нестабильное финансовое положение. И вообще нестабильные отношения не только с деньгами, но и с Миром в целом. Потому что поток Знания закрыт полностью. Т.е у такого человека фактически очень слабый доступ к знаниям предков и к опыту предков. И как бы они не пытались эти знания и этот доступ получить,  у них практически всегда есть с этим затыки. Им в принципе рекомендована Родовая работа, как раз для того, чтобы наладить вот этот баланс общения между Родовым эгрегором и нашим членом рода (нашим доверителем).
+    key = str(digit) * count
+    if key in keys:
+        return key
+    if count > 5:
+        return resolve_matrix_key(digit, count - 5, keys)
+    return None
+
 
-Если нет 6 у мужчины - таким М управляет любая Ж, которая в него включена 9 управление мамой и т.д. ). Ведомые. Плохо настроен канал взаимоотношения с Ж. Если есть женщина о которой он постоянно говорит (неважно в каком ключе), нужно обратить внимание и навести справки, что же это за женщина.то такие мужчины очень ведомы. Ими прекрасно могут управлять разные всякие женщины. Причем даже одновременно несколько женщин могут управлять. Также, это отсутствие шестёрки говорит о том, что у них есть проблема с анализом отношений между мужчиной и женщиной. Вот такой вот затык. Они плохо анализируют, например, почему на них плохо влияет бухгалтер. Например они плохо анализируют, что нельзя подпускать к себе таких хищных женщин. Часто оказываются в созовисимых отношениях с этими хищными женщинами. Очень часто зависимы от своей мамы. Мама и правда склонна управлять таким мужчиной, и управлять достаточно успешно. Он будет считывать все решения мамы, даже если она ему их словесно и не озвучит никак, и полностью будет делать то, что думает мама. Потому что мама имеет с ним достаточно сильную энерго-связь, и очень часто будет вмешиваться в отношении такого мужчины с другими женщинами. Вот если у него еще нет 5ки, то эта история усугубляется. А если у него еще слабый поток Власти в роду, это 1 или 11, то все еще более усугубляется. То есть здесь конечно женщине такого мужчины, нужно быть очень внимательной, потому что ее задачей в общем-то будет постараться занять место мамы или хотя бы встать с мамой на одну ступень. Для того чтобы они управляли, грубо говоря, «в одну сторону». У них очень часто возникает история с алкогольной зависимостью, когда жена и мама в разные стороны им «рулят». И тут он оказывается между «молотом и наковальней», поток Любви у него и так нарушен, он у него и так не ритмичный, он у него и так пульсационный, то есть то нет, потому что нету этого показателя в Роду, плюс сложные отношения с деньгами, то какие-то взлёты, то падения, или вообще история что денег нет. Плюс пилящие мама и жена. Если они «пилят» хотя бы одну сторону, то результат будет лучше  у такого мужчины. Если они «пилят» в разные стороны, то результат будет совсем плачевный. И очень часто история с созовисимостями и с зависимостями могут уходить в алкогольные истории.""",
-            "7": """норма, мощный ангел хранитель. Отчасти пофигистичный ангел хранитель, который смотрит как на взрослую душу, до 33 лет позволяет ошибаться, а после 33 душа настолько развивается, что ангел позволяет душе быть самой кудесником собственной удачи.
+def gender_index(gender: Optional[str]) -> int:
+    """Номер варианта текста: 0 — женский, 1 — мужской"""
+    if gender and gender.lower() in ("women", "женский", "female"):
+        return 0
+    return 1
 
-это норма. Абсолютно нормальная история со связью с родом. Человек достаточно хорошо связан с родовой системой и очень часто вытворяет всякие касяки лет до 33. После 33 лет у таких людей связь с Родом начинает правильно резонировать, то есть правильно налаживается и соответственно становится гораздо проще, практически нет ошибок. Почему так, потому что до 33 лет мы считываемся нашей Родовой система как дети, поэтому в этот момент Душа продолжает развиваться. Этого скажем так, такая пофигистическая история, когда родовая система бережёт человека конечно, но без фанатизма.""",
-            "77": """везунчики. Ангел хранитель от рождения и второй АХ от рода (кто-то из предков, кто взял над этим человеком шевство, как правило прапрадет/прапрапрадет, прабабушка/прапрабабушка). Этот показатель дает человеку глобальную задачу, иметь везение и пользоваться. Т. Е такой человек может в последний момент успеть на поезд, устроиться туда, куда хочет. Такого человека ангелы хранители опекают, не дают идти туда, куда не надо. Кодируют других людей на удачу. Могут позволить себе делать то, что не могут другие. Однако, возможность у таких людей может закрываться, если такой человек гадит другим (осознанно). Таким людям крайне важно быть благодарным за все. Хорошо работает канал благодарности.
 
-это люди у которых есть большой поток удачи, у них сильная связь с Родом. Как правило, кто-то из предков Рода взял над этим человеком шефство. Грубо говоря- воспитывает этого человека, следит за ним. Как правило у девочек - это пра-пра-бабушка по материнской линии. У мальчиков - это пра-пра-дедушка по линии отца. На самом деле часто у них много проблем в жизни, если они например нарушают какие-то, ну скажем так, общемировые законы. Их конечно опекают ангелы-хранители, их не пускают идти там куда-то и так далее. Им всегда легко там, где их место. Часто они могут помогать другим людям, например, желая откровенно им «удачи», они подключают на какой-то момент их к своему Родовому потоку Удачи человека, которому они этой «удачи» пожелали. Но вместе с тем, есть история, что если такой человек что-то нарушает, то очень часто у них происходит достаточно тяжёлые жизненные проблемы. У них есть две важные задачи, которые они обязательно должны выполнять, чтобы их Родовой канал Удачи не схлопывался. Первое - это быть Благодарным, вот чтобы не случилось. И за плохое и за хорошее. Второе - это не вредить другим людям открыто. То есть, если такой человек начинает впадать в какую-то историю из разряда «Я хочу отомстить»,  у него практически всегда поток Удачи схлапывается и её очень сложно потом будет обратно распаковать. Потому что Родовой канал Удачи в целом это канал-то сильный, но вместе с тем это канал который очень легко самому себе прикрыть.""",
-            "777": """люди у которых 3 АХ. Они как феи. Трансформаторные станции удачи. Таким людям важно делиться информацией и помогать другим если есть возможностть. Если не вкладываются в чужую удачу, то канал удачи схлопывается. Поэтому важно желать удачи другим людям искренне и делиться удачей через прикосновения людей, которым они желают удачи, участвовать в благотворительности ( больному такой человек должен перевести денег и пожелать удачи, тогда сбор с большой долей вероятности будет закрыт).
+def resolve_matrix_texts(matrix_data: Mapping) -> List[Optional[str]]:
+    """
+    Плотная таблица [цифра 1-9][количество 0..MAX_COUNT][пол] -> текст.
+    Если у ключа нет текста для пола, у ячейки нет интерпретации (как в
+    сообщении бота раньше): текст другого пола не подставляется.
+    """
+    resolution: List[Optional[str]] = []
+    for digit in range(1, 10):
+        for count in range(MAX_COUNT + 1):
+            key = resolve_matrix_key(digit, count, matrix_data)
+            for gender in GENDERS:
+                if key is None:
+                    resolution.append(None)
+                    continue
+                value = matrix_data[key]
+                if isinstance(value, dict):
+                    value = value.get(gender)
+                resolution.append(value or None)
+    return resolution
 
-это невероятно сильный, невероятно мощный канал удачи. Такие люди охотно и прекрасно должны делиться информацией и должны обязательно помогать другим людям, если есть на то такая возможность. Им нужно стараться не вредить Миру, стараться принимать Мир таким какой он есть и знаете как, без фанатизма. То есть помогать другим, но без фанатизма. Не уходить в фанатскую историю, например они иногда слишком сильно вкладываются в какую-то чужую Удачу, и в такие моменты у них канал начинает сужаться. Потому что всё-таки таким людям дана задача от Рода, держать канал удачи в Роду именно. Поэтому это важный момент!""",
-            "7777": """опекают высшие силы. Есть сильное везение, но есть история с внезапной смертью. Имеют «реперные» точки ухода.(реперная точка – программа души, когда человек закончил свои земные дела и уходит на тот свет). Для таких людей важно быть порядочными, не нарушать законы вселенной, чувствовать свои потребности, помогать другим людям, чувствовать себя частью мира, не делать негативных вещей, не нарушать морально этических принципов. Также такие люди имеют мощную связь со своей родовой системой, поэтому важно сохранять отношения с потомками. Если у такого человека дальний родственник просит о помощи, то нужно это делать.
 
-этих людей с самого рождения опекают Высшие силы, опекает Родовая система. У них действительно очень сильное везение, но у них может быть история когда они вдруг неожиданно по какой-то причине, например, погибли.Рано, в молодом возрасте. Вообще для них очень важно быть порядочными, не нарушать законы Вселенной, принимать себя таким какой есть, помогать другим людям, чувствовать себя частью Мира, понимать свои потребности. Собственно, открыто не делать какие-то морально-этические поступки плохие и не вредить другим людям.""",
-            "70": """когда у ребенка нет 7, его сильно опекают высшие силы до 22, 23слет кажется, что их кто-то ведет. С 21 по 26 лет у них непростой этап в жизни. В 26 лет впервые вляпываются во что-то и им говорят «ты неуязвимый, не думай что уязвимый». В 33 включается вторая программа вляпался и в 36-41 третья программа и тотальное отключение удачи. Программа «вляпался» - в момент принятия решения, Ч считает, что решение верное, но оказывается, что решение вовсе не верное. Первое влючение такой программы выглядит как программа неуязвимости, им дает понять вселенная, что можно делать все что хотят, а родовая система, дает такому человеку право быть практический неуязвимым, у него какое-то сказочное везение. Если человек ведет себя правильно и не идет в разнос, то все хорошо, а если не правильно, то включается жесткая программа уже в следующем периоде (26-33 года). Начинаются потери, Ч чувствует на невербальном уровне, что где-то что-то болит, что-то происходит, но задача одна ОДУМАТЬСЯ и быть благодарным за все. К 41 году важно научиться наработать удачу(практикой благодарения), можно начать это делать с детства.(практика набора удачи – обязательно). Часто у таких людей нарабатывается навсегда энергия, есть тотальная защищенность высших сил. После наработки удачи становятся заметными.
+class InterpretationStore:
+    """Тексты интерпретаций и таблица выбора текста ячейки"""
 
-это нарушенный канал Родовой Удачи. Нарушенный канал Родовой удачи, говорит о том, что в роду была какая-то тяжёлая история, в результате которой, то что досталось роду в связи с какой-то Удачей, было по какой-то причине отнято. Например, вашему прадедушке дали поместье, он стал помещиком, потому что он там очень трудился, хорошо выслужился. И тут вдруг происходит революция, дедушку этого раскулачивают, то есть родовая система считывает Удачу как равную смерти, то есть Удача равно смерть. В таком случае Родовой канал Удачи схлопывается и перекрывается. Он перестаёт работать, то есть Родовой поток Удачи полностью перестаёт работать и рождаются дети, у которых нет канала Удачи. У них есть история с тем, что их до какого-то момента опекают Высшие силы, они себя ощущают практически неуязвимыми. Но где-то в 26 лет у них происходит тяжёлый жизненный этап, и первый раз у них включается программа когда они находят себе большие приключения. В 33 года второй раз включается данная программа. В 36 лет уже включение программы тотального невезения. Причём человек, например не понимает этого. Он же привык, что он оберегается Высшими силами, причем оберегается он только по той причине, что в Роду, грубо говоря,  поток этот очень снижен и чтобы такие дети выживали, им действительно нужна помощь Высших сил. Как только ты Миром считываешься как взрослый, соответственно тебе уже должен помогать твой Род и твой Род не работает, потому что не работает поток Удачи. И поэтому люди такие, в момент принятия каких-то важных решений, они считают что они все делают правильно. И тут, вдруг у них происходит какой-то жесткий откат,  ошибка, они кстати очень долго это ошибки могут не осознавать могут находиться в состоянии как будто они не осознают эти ошибки. Естественно до 26 лет они как правило думают что им всё можно и им можно делать ошибки и всё что хочешь. Поэтому если человек ведет себя более-менее нормально, то будет нормально даже потом, когда уже включится программа с отсутствием Удачи. Если же человек идёт в разнос, ну естественно, происходит история с жёстким каким-то выключением. Где-то с 26 до 33 лет, у таких людей начинает сбоить история с Удачей, и в общем-то начинается такое крутое пике. Они конечно могут одуматься, быть Благодарными за всё, но тем не менее Родовой канал удачи у них находятся в схлопнутом состоянии. Соответственно он ритмично не работает. И обычно у них уже к 42 годам нарастает история с кучей ошибок,  поэтому им обязательно нужно наладить канал Удачи. Собственно, как наработать это канал, достаточно просто. Есть специальная практика, она называется «Благодарение». Нужно взять лист, блокнот или тетрадку. Можно писать ежедневно несколько Благодарений. Есть также практика, которая заключается в том, что человек 90 дней Благодарит за все, вот буквально за всё. Утром встали и триада Благодарностей: себе, близким, Богу, людям и так далее. Ну в первую очередь себе, Богу, Творцу, людям, за всё! Первые три дня нужно прямо фанатично Благодарить за всё, а потом потихонечку 10-15 Благодарностей в день и так 90 дней. За это время нарабатывается достаточное количество канала Удачи. Канал начинает открываться, он до конца быстро не открывается, но в принципе начинает функционировать хотя бы как-то. Так же кстати, к этой практике Благодарения прилагается таким людям бонус, такая история как дополнительная энергия. Появляется защищенность, чувство защищённости. Их начинают замечать другие люди, то есть они становятся видимыми. Когда Родовой канал Удачи, родовой поток не работает или работает некорректно, то человека не замечают. К примеру, такой человек может быть прекрасным сотрудником, но его никогда не повысят в должности. Или быть замечательным режиссёром, но его фильмы не буду отправлять на кинофестивали и тд.""",
-            "8": """норма. Хочет и может служить семье. В меру свободолюбивый. Семья –путеводная звезда. Мужчины – семейные в меру.это достаточно простая история. Такой человек должен заниматься своим родом, заниматься именно своей семьёй, своими детьми, своими родителями, семьёй которую он создал. Такому человеку ну очень тяжело не быть привязанным к своей семье. Часто они на всю жизнь остается около своей семьи. У них такая большая потребность находиться около родовой семьи. Они, кстати говоря, достаточно тяжело переезжают, потому что привязаны к родовой семье и земле.""",
-            "88": """3и глобальные задачи.
-1.Служить семье.
-2.Дать что-то людям.
-3.Испытывать радость от помощи людям.
-Такой человек должен быть социально активным. Большая потребность в близком общении. Нуждаются в том, чтобы на них обращали внимание. Достоинство: готовность прийти на помощь нуждающимся. Есть код учителя. Такой человек может прекрасно преподавать т отдавать знания. Есть баланс между семьей и социумом, но они могут причинять добро. Часто, начинают директивно впаривать свою заботу, имеют склонность контролю и поучению других людей. Именно поэтому, важно избавиться от внутренней чувствительности и страха потерять эти отношения (страх одиночества). Потому что, если родители ребенка потакают его страхам, позволяя проявлять эти качества(недоверия и контроля), то эти страхи и привычка к контролю закрепляется в сознании и остаются на всю жизнь. Подобным образом также действуют шоковые события, развод, частые ссоры.
-если у человека две восьмёрки, то у них большая задача. Им обязательно нужно становиться наставником, им обязательно нужно становиться учителями, им обязательно нужно вести за собой людей. Но в тоже время и помогать всячески своей семье. Должна быть обязательно социальная активность. Они должны присутствовать Везде, должны чувствовать Мир, должны позволить себе реализовываться в социуме и не бояться этого.  Не бояться проявляться!
-Мужчины, у которых много восьмёрок- 88, 888, 8888, это мужчины, которые как правило, в 45 лет начинают активно собирать вокруг себя семью. Очень часто они принимают на себя, ну скажем, так такую задачу, как объединитель Рода.  Они всегда находят общий язык со всеми членами рода. Помогают всем членам рода. Поэтому мужчина с такими показателями с большим количеством восьмёрок, они такие домостроевцы и сильно вовлечены в дела семьи.""",
-            "888": """гуру, великие учителя. Задача: обучать людей всему чему они умеют и знают. 
-Очень сильно тираничные люди. Им важно идти своим путем. Могут быть закрытыми, жестокими в семье, потому что им нужно отдавать все в социум.
-это люди у которых есть обязательно тотальная задача- наставничать. Начать обучать других людей, передавать другим людям всё что они знают. Они привязаны не только к своей семье, но и к Миру. То есть их задача как можно больше отдавать в мир потому, что они как правило находятся в состоянии, когда они должны заниматься экспансией в Мир. То есть помогать родовой системе расширять свои сферы влияния.
-Им очень важно идти своим путём. При этом эти люди могут быть холодными, закрытыми людьми. Могут проявлять какую-то жестокость в семье, могут проявлять сверх-контроль за всеми, быть ревнивыми  и тд..
-Мужчины, у которых много восьмёрок- 88, 888, 8888, это мужчины, которые как правило, в 45 лет начинают активно собирать вокруг себя семью. Очень часто они принимают на себя, ну скажем, так такую задачу, как объединитель Рода.  Они всегда находят общий язык со всеми членами рода. Помогают всем членам рода. Поэтому мужчина с такими показателями с большим количеством восьмёрок, они такие домостроевцы и сильно вовлечены в дела семьи.""",
-            "8888": """редкий показатель. С детства нужно прививать духовность. В подростковом периоде могут быть закрытыми. Часто психосоматические проблемы в теле. У таких людей высокая сенсорика. Высокая духовность. Часто сходят с ума. С высокой долей вероятности алкоголики (потому что пытаются избавиться от этого). Можно спастись, если пойти в глубокую духовность.
-это редкий показатель. Практически всегда это люди у которых достаточно серьезно развита сенсорика. Это люди, у которых достаточно гибкий энергоинформационный фон. Это люди, у которых очень прекрасное чувствование других людей. Они с детства, как правило чувствует у себя связь с духовностью. В подростковом возрасте могут закрываться. Очень часто могут впадать в какие-то панические атаки, психические проблемы и так далее. Поэтому им важно отдавать в Мир свои знания. Вести за собой других людей. У них как правило происходит синдром гипер-контроля. Это кстати синдром который есть и у 88, 888, 8888, 88888. просто во всей красе проявляется.
-Мужчины, у которых много восьмёрок- 88, 888, 8888, это мужчины, которые как правило, в 45 лет начинают активно собирать вокруг себя семью. Очень часто они принимают на себя, ну скажем, так такую задачу, как объединитель Рода.  Они всегда находят общий язык со всеми членами рода. Помогают всем членам рода. Поэтому мужчина с такими показателя с большим количеством восьмёрок, они такие домостроевцы и сильно вовлечены в дела семьи.""",
-            "88888": """это усиление показатели 888 и 8888, поэтому здесь стоит говорить о том, что такому человеку необходимо реализовываться в духовной сфере, быть духовным учителем, духовным наставником, помогать людям развивать свои самые лучшие черты и отдавать это всё в Мир. Они кстати прекрасно несут серьезные знания в Мир. Через какое-то время, как правило они приходят к преподаванию так или иначе.""",
-            "80": """Свободолюбивые, не требуют особого внимания к себе от семьи и сами могут хорошо и долго жить, не общаясь с семьей. Но это же говорит и о том,что есть нарушением связи с родом. 
-Если это у женщин, то им вобщем-то очень легко служить детям, родителям, миру.
-Но при этом, к мужчине есть достаточно много претензий. И у них есть история, что если они мужчину не уважают, не доверяют, никак с ним не взаимодействуют, то часто у них возникают проблемы в браке, и какие-то моменты из разряда, когда тяжело им достаточно жить в отношениях, потому что если хотя бы один из этих трёх пунктов в провале, то  такая женщина перестаёт в общем-то таким своим мужем интересоваться. И он становится для неё просто как предмет мебели.
-Поэтому в таких отношениях у мужчин должны быть крепкие чувства к женщине.Чаще всего так и бывает. А у таких женщин отношения с мужчиной завязаны как правило на дружбе. Они должны этому мужчине доверять, уважать.И это важно.
-Мужчинам без 8 нельзя иметь претензии к родителям и каждый раз думая о родителях думать о них хорошо. 
-Если у мужчины нет восьмёрки - это история когда мужчина отдалён от своей семьи, но у него в приоритете, вот Парадокс, должна стоять его семья! Естественно, это семья, в которой он родился, никакая не жена! У него не должно быть претензии к родителям. Хотя они у него будут наверняка, учитывать этот показатель, потому что нарушена связь с родом. Каждый раз он должен думать о своих родных хорошо, и в общем-то включаться, если вдруг потребуется его помощь, в какие-то семейные, родовые дела. 
-Очень часто происходит у таких мужчин программа обнуления и лет в 45 лет у них просто случается «Бес в ребро», потому что это вечное, какое-то полу-присоединенное состояние к семье в которой он живет, к жене и ребенку,  и к родовой семье – это как правило разные истории. Он, как правило, находится «между молотом и наковальней», и в какой-то момент такие мужчины очень хотят новых, свежих ощущений и начать жизнь с «чистого листа». Поэтому у них такая история достаточно часто происходит.""",
-            "9": """нестабильная память. В 38-40 начинает теряться память. С 45-46 лет появляется внутреннее чувство скептиса, инфантильность, забывчивость, ошибки на пустом месте, поэтому такому человеку важно тренировать память. Таким людям мы советуем тренировать память, важна мнемоника, письмо левой рукой, произносить слова наоборот (из головы), вспоминать вчерашний день и записывать в дневник.
-это история с хлопывающимся каналом родовой памяти. Постепенно такой человек теряет способность запоминать, появляется очень много инфантильности. Таким людям действительно нужно очень здорово тренировать память. Для таких людей это один из важнейших этапов, потому что таким образом они будут усиливать свою родовую связь  с системой. Кроме того, они так избегут Альцгеймера, деменции, Паркинсона и прочих расстройств психического толка. 
-Также, я хочу сказать что люди у которых одна девятка, это люди которые всегда должны заниматься, скажем так, сбором информации про свой Род. Потому что, вот эта история, будет вам помогать стабилизировать вот этот родовой поток памяти, который в данном случае работает у них не очень качественно.""",
-            "99": """норма, хорошая память. Часто, Вкупе с числом родового пути 7 – наличие паранормальных способностей, крепкая интуиция или если это 11 или 12 воплощение. Если человек не имеет таких чисел, то это просто хорошая память. Таким людям постоянно нужно получать знания и применять их (с интересом получать знания, тогда память будет хорошо работать). 
-Нормальная, хорошая родовая память, нет особо страшных проблем. Им правда хочется набирать знания, они достаточно прекрасно этими знаниями пользуются. Умеют их в нужной степени применять, умеют их показывать миру - и помнит свою родовую систему достаточно неплохо.""",
-            "999": """у таких людей жесткая программа передачи знаний близким и дальним через чувствование себя. Много должно быть загруженно знаний, нужно чувствовать и рассказывать через чувства людям. Давать обратную связь миру – я чувствую мир, транслирую в мир. Если не дают связь в мир, то часто забывают о самом важном, начинают путаться. Такому человеку важно идти в эзотерику. Хорошие тарологи. 
-это история когда такой человек должен обязательно передавать в мир знания,  причём именно через то, как он это сам чувствует. В него действительно, по факту рождения, загружена большое количество знаний. Эти знания приходят к такому человеку, можно сказать фактически из хроник Акаши. То есть они сразу знают эти знания просто по факту рождения. Им важно давать/держать обратную связь с миром. Т.е что они чувствуют, то они в мир и транслируют. Если  они не дают обратную связь, то часто у них память эта отмирает и происходит некая амплитудность. Соответственно такой человек начинает забывать самое важное. То есть действительно надо нести в мир некие знания и как-то их реализовывать.""",
-            "9999": """маг. Трансформировал в прошлой жизни судьбы, вел за собой. Обязан помогать исцелением другим людям. Подключен к миру (особенно 12 воплощение). Сильный энергетический человек. Обалдевает кодами в любую эзотерику. Важно такому человеку учить с радостью, не желать другим людям зла, помогать людям. 
-Это код Мага. Это не стопроцентная история с кодом доступа, но часто один из маркеров, которые можно увидеть невооружённым глазом. Такие люди в прошлой жизни, действительно были Гуру´, поэтому они обязаны помогать и исцелять других людей. Они должны обязательно иметь своё собственное мировоззрение.  Подключить собственно, этот Путь к мировоззрению.  Подключить Мир к своему мировоззрению. И очень часто они должны учить, причём учить и точки зрения наставничества, и с точки зрения наставления на путь истинный, и с точки зрения привнесения новых знаний в мир. Часто кстати, они реализуют достаточно успешно, какие-то эзотерические проекты, именно с точки зрения изменения старых знаний и привнесения чего-то нового. Эти люди точно в прошлых жизнях так или иначе соприкасались с магией. И собственно в этой жизни Душа рождается уже очень мудрой.""",
-            "99999": """высокая способность принимать от высших сил, подвергая анализу. Такие люди как будто знают что-то, но не могут объяснить. Большие скептики, к 40 годам часто с ними происходит сильный перелом и они начинают идти в эзотерику/медицин/психологию. Очень часто если не распакуют свой потенциал включается ЯДЕРНАЯ программа онкологии. Избыточный потенциал при неиспользовании начинает разрушать все внутри
-это важная способность принимать от Высших сил, в общем-то, различную информацию. 
-99999 –  это люди у которых очень гибкая задача. Часто они очень сильно скептичны, потому что чувствую в себе большой потенциал и внутри этого потенциала очень бояться. К 43 годам у них задача: либо начать обучать большое количество людей, либо они могут очень неожиданно начать серьезно болеть. Это может быть медицина, эзотерика, литература. Часто у них есть проблемы с ЖКТ. Часто у них проблемы с гибкой памятью - это панические атаки, различные психические заболевания, вплоть до шизофрении. Поэтому им очень важно в Мир отдавать и  действительно, вести какую-то пропагандистскую, духовную деятельность, потому что у них действительно есть высокая способность принимать очень много информации и правильно её анализировать.""",
-            "90": """Людей без девяток не существует. Не может быть человек без родовой памяти, поэтому отсутствие девятки быть не может. Всегда должна быть у человека девятка. Если она одна, то это просто слабый схлапывающийся канал родовой памяти. КОСВЕНО может говорить о:  вырождение рода, косвенно может говорить о наличии каких-то проклятий в роду. Косвенно о наличии каких-то тяжелых, ну скажем так, родовых перекосах и родовых негативов в роду у нашего доверителя."""
-        }
+    def __init__(self, matrix_data: Mapping, tasks_data: Mapping):
+        self.matrix = MappingProxyType(matrix_data)
+        self.tasks = MappingProxyType(tasks_data)
+        self._resolution = resolve_matrix_texts(matrix_data)
+
+    def matrix_text(self, digit: int, count: int, gender: Optional[str]) -> Optional[str]:
+        """Интерпретация ячейки по цифре, количеству и полу (индексация таблицы)"""
+        if count > MAX_COUNT:
+            return None
+        return self._resolution[((digit - 1) * (MAX_COUNT + 1) + count) * len(GENDERS) + gender_index(gender)]
+
+
+def get_store() -> InterpretationStore:
+    """Общее для процесса хранилище (тексты загружаются при первом обращении)"""
+    global _store
+    if _store is None:
+        import interpretations_data
+
+        _store = InterpretationStore(interpretations_data.MATRIX_DATA, interpretations_data.TASKS_DATA)
+    return _store
+
+
+class Interpretations:
+    """Доступ к интерпретациям; все экземпляры используют общее хранилище"""
+
+    @property
+    def matrix_data(self) -> Mapping:
+        return get_store().matrix
+
+    @property
+    def tasks_data(self) -> Mapping:
+        return get_store().tasks
     
-    def _create_tasks_interpretations(self):
-        """Создание словаря с интерпретациями задач"""
-        return {
-            "1": "Личная задача души связана с развитием эго, самости, силы характера и амбиций.",
-            "2": "Личная задача души связана с энергией и преодолением лени.",
-            "3": "Личная задача души связана с креативностью, творчеством и материалистичностью.",
-            "4": "Личная задача души связана со здоровьем, сексуальной энергией и правом на продолжение рода.",
-            "5": "Личная задача души связана с балансом мужской и женской энергии в теле.",
-            "6": "Личная задача души связана с умением манипулировать и работать руками.",
-            "7": "Личная задача души связана с родовой энергией удачи, фортуны и помощью высших сил.",
-            "8": "Личная задача души связана со служением себе, людям и семье.",
-            "9": "Личная задача души связана с памятью и психологическими способностями.",
-            "10": "Задача связана с силой характера и энергией.",
-            "11": "Задача связана с силой характера и балансом.",
-            "12": "Задача связана с энергией и творчеством.",
-            "13": "Задача связана с творчеством и здоровьем.",
-            "14": "Задача связана с здоровьем и балансом.",
-            "15": "Задача связана с балансом и манипуляцией.",
-            "16": "Задача связана с умением работать и удачей.",
-            "17": "Задача связана с удачей и служением.",
-            "18": "Задача связана со служением и памятью.",
-            "19": "Задача связана с памятью и новым началом.",
-            "20": "Задача связана с двойной энергией.",
-            "21": "Задача связана с энергией и силой.",
-            "22": "Задача связана с двойной энергией.",
-        }
+    def matrix_text(self, number: int, count: int, gender: Optional[str]) -> Optional[str]:
+        """Интерпретация ячейки матрицы по единым правилам (см. resolve_matrix_key)"""
+        return get_store().matrix_text(number, count, gender)
     
     def get_matrix_interpretation(self, key, gender=None):
         """
@@ -232,20 +152,8 @@ class Interpretations:
         return self.tasks_data.get(key)
 
     def get_matrix_value(self, number: int, count: int, gender: str) -> str:
-        """Получение интерпретации для числа матрицы"""
-        key = str(number)
-        if count == 0:
-            key = f"{number}0"
-        elif count > 5:
-            # Для более 5 берем все кроме первых 5
-            key = str(number) * (count - 5)
-        
-        if key in self.matrix_data:
-            data = self.matrix_data[key]
-            if isinstance(data, dict):
-                return data.get(gender.lower(), data.get('women', ''))
-            return data
-        return ""
+        """Получение интерпретации для числа матрицы (без текста для пола — женский, как и раньше)"""
+        return self.matrix_text(number, count, gender) or self.matrix_text(number, count, "women") or ""
     
     def get_task_interpretation(self, task_number: str) -> str:
         """Получение интерпретации задачи"""
@@ -0,0 +1,198 @@
+"""
+Планировщик запросов к Groq.
+
+Все запросы к модели проходят через LLMScheduler: одновременно выполняется не
+больше LLM_CONCURRENCY запросов, а частоту ограничивают два ведра токенов —
+запросы в минуту (LLM_RPM) и токены в минуту (LLM_TPM). Ожидающие запросы
+стоят в очереди по приоритету: запросы пользователей (INTERACTIVE) идут раньше
+прогрева и пакетной генерации (BACKGROUND). Ответ 429 приостанавливает выдачу
+мест на время Retry-After, вместо того чтобы каждый следующий запрос тоже
+получал отказ.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from config import Config
+
+log = logging.getLogger(__name__)
+
+# Приоритеты: меньше — раньше
+INTERACTIVE = 0
+BACKGROUND = 1
+LANES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+# Грубая оценка символов на токен для русского текста
+CHARS_PER_TOKEN = 3
+
+_scheduler: Optional["LLMScheduler"] = None
+
+
+def estimate_tokens(messages: List[Dict], max_tokens: int) -> int:
+    """Оценка расхода токенов запроса: промпт по длине плюс максимум ответа"""
+    chars = sum(len(message["content"]) for message in messages)
+    return chars // CHARS_PER_TOKEN + max_tokens
+
+
+def rate_limit_delay(error: Exception) -> Optional[float]:
+    """Пауза после ответа 429 (по Retry-After) или None для прочих ошибок"""
+    if getattr(error, "status_code", None) != 429:
+        return None
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return Config.LLM_RETRY_DELAY
+
+
+class TokenBucket:
+    """Ведро на per_minute единиц в минуту (0 — без ограничения)"""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self.rate = per_minute / 60
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Сколько секунд ждать, пока в ведре наберется amount"""
+        if self.capacity <= 0:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        if self.capacity > 0:
+            self._refill()
+            self.level -= min(amount, self.capacity)
+
+    def give(self, amount: float) -> None:
+        """Возврат неизрасходованного (или доплата при отрицательном amount)"""
+        if self.capacity > 0:
+            self._refill()
+            self.level = min(self.capacity, self.level + amount)
+
+
+class LLMScheduler:
+    def __init__(
+        self,
+        rpm: float = Config.LLM_RPM,
+        tpm: float = Config.LLM_TPM,
+        concurrency: int = Config.LLM_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.requests = TokenBucket(rpm, clock)
+        self.tokens = TokenBucket(tpm, clock)
+        self.concurrency = max(1, concurrency)
+        self._clock = clock
+        # Очередь: [приоритет, порядковый номер, future, токены, время постановки]
+        self._queue: List[list] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._paused_until = 0.0
+        self.rate_limited = 0
+        self._lanes = {name: {"granted": 0, "wait_total": 0.0, "wait_max": 0.0} for name in LANES.values()}
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, priority: int = INTERACTIVE) -> AsyncIterator[None]:
+        """Место для одного запроса к модели; tokens — оценка расхода для TPM"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, [priority, next(self._seq), future, tokens, self._clock()])
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Место выдано, но ожидающий уже отменен
+                self._release()
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Выдает места по приоритету, пока хватает параллельности и лимитов"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue and self._active < self.concurrency:
+            priority, _, future, tokens, enqueued = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            now = self._clock()
+            wait = max(self._paused_until - now, self.requests.wait_time(1), self.tokens.wait_time(tokens))
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            heapq.heappop(self._queue)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self._active += 1
+            lane = self._lanes[LANES.get(priority, LANES[BACKGROUND])]
+            lane["granted"] += 1
+            lane["wait_total"] += now - enqueued
+            lane["wait_max"] = max(lane["wait_max"], now - enqueued)
+            future.set_result(None)
+
+    def settle(self, estimate: int, used: Optional[int]) -> None:
+        """Поправка ведра токенов по фактическому расходу из ответа"""
+        if used is not None:
+            self.tokens.give(estimate - used)
+
+    @property
+    def paused(self) -> bool:
+        """Выдача мест приостановлена после ответа 429"""
+        return self._clock() < self._paused_until
+
+    def backoff(self, delay: float) -> None:
+        """Приостанавливает выдачу мест после ответа 429"""
+        self.rate_limited += 1
+        self._paused_until = max(self._paused_until, self._clock() + delay)
+        log.warning(f"🚦 Groq ограничил частоту запросов, пауза {delay:.1f} с")
+
+    def stats(self) -> Dict[str, object]:
+        queued = {name: 0 for name in LANES.values()}
+        for priority, _, future, _, _ in self._queue:
+            if not future.done():
+                queued[LANES.get(priority, LANES[BACKGROUND])] += 1
+        lanes = {}
+        for name, lane in self._lanes.items():
+            granted = lane["granted"]
+            lanes[name] = {
+                "queued": queued[name],
+                "granted": granted,
+                "wait_avg": round(lane["wait_total"] / granted, 3) if granted else 0.0,
+                "wait_max": round(lane["wait_max"], 3),
+            }
+        return {
+            "active": self._active,
+            "queue_depth": sum(queued.values()),
+            "lanes": lanes,
+            "rate_limited": self.rate_limited,
+        }
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Общий для процесса планировщик: лимиты Groq считаются на API-ключ"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler()
+    return _scheduler
@@ -16,7 +16,10 @@ from telegram.ext import (
 
 from config import Config
 from matrix_calculator import MatrixCalculator
-from horoscope_service import HoroscopeService
+from message_chunks import send_chunk
+from message_stream import StreamingMessage
+from horoscope_service import SOUL_NUMBERS, HoroscopeService
+from prewarm import HoroscopePrewarmer
 from web_server import start_web_server
 
 # Настройка логирования
@@ -36,6 +39,10 @@ class NumerologyBot:
     def __init__(self):
         self.matrix_calc = MatrixCalculator()
         self.horoscope_service = HoroscopeService()
+        self.prewarmer = HoroscopePrewarmer(
+            self.horoscope_service,
+            soul_numbers=SOUL_NUMBERS if Config.PREWARM_SOUL_NUMBERS else (),
+        )
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Команда /start: приветствие и запрос данных."""
@@ -250,7 +257,6 @@ class NumerologyBot:
                 return
 
             zodiac = self._get_zodiac(birth_date.day, birth_date.month)
-            matrix["zodiac"] = zodiac
             
             # Сохраняем данные
             user_store[uid]["matrix"] = matrix
@@ -295,32 +301,29 @@ class NumerologyBot:
             return
 
         matrix = user["matrix"]
-        full_array = matrix.get("full_array", [])
         
         # Анализ силы каждой цифры
-        def get_count(num):
-            return len([x for x in full_array if x == num])
-        
         def get_level(count):
             if count == 0: return "❌"
             elif count == 1: return "⚠️"
             elif count in [2,3,4]: return "✅"
             else: return "💪"
         
-        counts = {i: get_count(i) for i in range(1, 10)}
+        counts = {i: matrix.count(i) for i in range(1, 10)}
+        cells = {i: matrix.cell(i) for i in range(1, 10)}
         
         # Формируем матрицу с подписями
         matrix_with_labels = (
             f"┏━━━━━━━━━┳━━━━━━━━━┳━━━━━━━━━┓\n"
-            f"┃ {' '.join([str(i) for i in full_array if i == 1]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 4]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 7]) or '—':^7} ┃\n"
+            f"┃ {cells[1]:^7} ┃ {cells[4]:^7} ┃ {cells[7]:^7} ┃\n"
             f"┃Характер ┃Здоровье ┃  Удача  ┃\n"
             f"┃   {get_level(counts[1])}    ┃   {get_level(counts[4])}    ┃   {get_level(counts[7])}    ┃\n"
             f"┣━━━━━━━━━╋━━━━━━━━━╋━━━━━━━━━┫\n"
-            f"┃ {' '.join([str(i) for i in full_array if i == 2]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 5]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 8]) or '—':^7} ┃\n"
+            f"┃ {cells[2]:^7} ┃ {cells[5]:^7} ┃ {cells[8]:^7} ┃\n"
             f"┃ Энергия ┃ Логика  ┃  Долг   ┃\n"
             f"┃   {get_level(counts[2])}    ┃   {get_level(counts[5])}    ┃   {get_level(counts[8])}    ┃\n"
             f"┣━━━━━━━━━╋━━━━━━━━━╋━━━━━━━━━┫\n"
-            f"┃ {' '.join([str(i) for i in full_array if i == 3]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 6]) or '—':^7} ┃ {' '.join([str(i) for i in full_array if i == 9]) or '—':^7} ┃\n"
+            f"┃ {cells[3]:^7} ┃ {cells[6]:^7} ┃ {cells[9]:^7} ┃\n"
             f"┃Творчест ┃  Труд   ┃ Память  ┃\n"
             f"┃   {get_level(counts[3])}    ┃   {get_level(counts[6])}    ┃   {get_level(counts[9])}    ┃\n"
             f"┗━━━━━━━━━┻━━━━━━━━━┻━━━━━━━━━┛"
@@ -365,10 +368,9 @@ class NumerologyBot:
                 summary.append(f"• {labels[num]} - нуждается в развитии")
         
         # Формируем дополнительные числа
-        additional = matrix.get("additional", [])
-        additional_str = ' → '.join(map(str, additional))
-        soul_number = additional[1] if len(additional) > 1 else "?"
-        family_number = additional[-1] if additional else "?"
+        additional_str = ' → '.join(map(str, matrix.additional))
+        soul_number = matrix.soul_number if matrix.soul_number is not None else "?"
+        family_number = matrix.family_number if matrix.family_number is not None else "?"
         
         gender_emoji = "👨" if user.get("gender") == "мужской" else "👩"
         
@@ -405,8 +407,7 @@ class NumerologyBot:
 
         matrix = user["matrix"]
         matrix_table = self.matrix_calc.format_matrix_display(matrix)
-        additional = matrix.get("additional", [])
-        additional_str = ' → '.join(map(str, additional))
+        additional_str = ' → '.join(map(str, matrix.additional))
         gender_emoji = "👨" if user.get("gender") == "мужской" else "👩"
         
         response = (
@@ -441,9 +442,6 @@ class NumerologyBot:
         )
         
         gender = user.get("gender", "мужской")
-        interpretations = self.matrix_calc.get_interpretations(user["matrix"], gender)
-        
-        await status_msg.delete()
         
         # Добавляем заголовок
         gender_emoji = "👨" if gender == "мужской" else "👩"
@@ -455,10 +453,11 @@ class NumerologyBot:
             f"━━━━━━━━━━━━━━━━━━━━━\n\n"
         )
         
-        interpretations = header + interpretations
+        # Текст уже разбит на части и закеширован по сигнатуре матрицы
+        rendered = self.matrix_calc.render_interpretations(user["matrix"], gender, header)
         
-        # Разбиваем на части если нужно
-        await self._send_long_message(update.message, interpretations)
+        await status_msg.delete()
+        await self._send_chunks(update.message, rendered.chunks)
     
     async def show_interpretations_callback(self, query, context: ContextTypes.DEFAULT_TYPE):
         """Вывод интерпретаций через callback"""
@@ -470,56 +469,27 @@ class NumerologyBot:
             return
         
         gender = user.get("gender", "мужской")
-        interpretations = self.matrix_calc.get_interpretations(user["matrix"], gender)
-        
         gender_emoji = "👨" if gender == "мужской" else "👩"
         header = f"{gender_emoji} *Интерпретации для: {gender}*\n\n"
-        interpretations = header + interpretations
-        
-        await self._send_long_message(query.message, interpretations)
-
-    async def _send_long_message(self, message, text: str):
-        """Отправка длинного сообщения с разбивкой"""
-        max_length = 4000
-        
-        if len(text) <= max_length:
-            try:
-                await message.reply_text(text, parse_mode="Markdown")
-            except Exception as e:
-                log.error(f"Ошибка отправки: {e}")
-                # Если ошибка Markdown, отправляем без форматирования
-                await message.reply_text(text)
-            return
         
-        # Разбиваем по двойным переносам строк
-        parts = text.split('\n\n')
-        current_message = []
-        current_length = 0
-        
-        for i, part in enumerate(parts):
-            part_length = len(part) + 2
-            
-            if current_length + part_length > max_length:
-                # Отправляем накопленное
-                msg_text = '\n\n'.join(current_message)
-                try:
-                    await message.reply_text(msg_text, parse_mode="Markdown")
-                except:
-                    await message.reply_text(msg_text)
-                
-                current_message = [part]
-                current_length = part_length
-            else:
-                current_message.append(part)
-                current_length += part_length
-        
-        # Отправляем остаток
-        if current_message:
-            msg_text = '\n\n'.join(current_message)
-            try:
-                await message.reply_text(msg_text, parse_mode="Markdown")
-            except:
-                await message.reply_text(msg_text)
+        rendered = self.matrix_calc.render_interpretations(user["matrix"], gender, header)
+        await self._send_chunks(query.message, rendered.chunks)
+
+    async def _send_chunks(self, message, chunks):
+        """
+        Отправка заранее разбитого и проверенного текста. Если Telegram все же
+        отклонил разметку части, она переотправляется без разметки, а остальные
+        части отправляются как обычно.
+        """
+        for chunk in chunks:
+            await send_chunk(message.reply_text, chunk)
+
+    async def _stream_horoscope(self, status_msg, user: dict, header: str):
+        """Гороскоп в статусном сообщении: AI-ответ появляется по мере генерации"""
+        stream = StreamingMessage(status_msg, header)
+        on_progress = stream.update if Config.HOROSCOPE_STREAMING else None
+        horo_text = await self.horoscope_service.get_daily_horoscope(user, on_progress)
+        await stream.finish(horo_text)
 
     async def daily_horoscope(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Вывод гороскопа"""
@@ -540,9 +510,6 @@ class NumerologyBot:
         )
         
         try:
-            horo_text = await self.horoscope_service.get_daily_horoscope(user)
-            await status_msg.delete()
-            
             header = (
                 f"━━━━━━━━━━━━━━━━━━━━━\n"
                 f"🔮 *ГОРОСКОП НА СЕГОДНЯ*\n"
@@ -550,8 +517,7 @@ class NumerologyBot:
                 f"✨ Знак: *{user['zodiac']}*\n"
                 f"📅 {datetime.now().strftime('%d.%m.%Y')}\n\n"
             )
-            
-            await update.message.reply_text(header + horo_text, parse_mode="Markdown")
+            await self._stream_horoscope(status_msg, user, header)
         except Exception as e:
             log.error(f"Ошибка гороскопа: {e}")
             await status_msg.edit_text(
@@ -569,12 +535,11 @@ class NumerologyBot:
             await query.message.reply_text("⚠️ Сначала рассчитайте матрицу!")
             return
 
-        await query.message.reply_text("🔮 Получаю гороскоп...")
+        status_msg = await query.message.reply_text("🔮 Получаю гороскоп...")
         
         try:
-            horo_text = await self.horoscope_service.get_daily_horoscope(user)
             header = f"✨ *Гороскоп для {user['zodiac']}*\n\n"
-            await query.message.reply_text(header + horo_text, parse_mode="Markdown")
+            await self._stream_horoscope(status_msg, user, header)
         except Exception as e:
             log.error(f"Ошибка гороскопа: {e}")
             await query.message.reply_text("❌ Не удалось получить гороскоп. Попробуйте позже.")
@@ -650,6 +615,13 @@ class NumerologyBot:
                 return name
         return "♑ Козерог"
 
+    def metrics(self) -> dict:
+        """Метрики кешей для эндпоинта /metrics"""
+        return {
+            "horoscope": self.horoscope_service.stats(),
+            "interpretation_cache": self.matrix_calc.interp_cache.stats(),
+        }
+
 def main():
     """Точка входа"""
     bot_logic = NumerologyBot()
@@ -667,16 +639,23 @@ def main():
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot_logic.handle_message))
 
     # Запуск бота и веб-сервера
-    asyncio.run(run_bot_with_server(application))
+    asyncio.run(run_bot_with_server(application, bot_logic))
 
 
-async def run_bot_with_server(application):
+async def run_bot_with_server(application, bot_logic: NumerologyBot):
     """Запуск бота и веб-сервера одновременно"""
     port = int(os.environ.get("PORT", 8080))
     
     # Запускаем веб-сервер для health checks
     log.info(f"🚀 Запуск веб-сервера на порту {port}")
-    web_runner = await start_web_server(port)
+    web_runner = await start_web_server(port, bot_logic.metrics, bot_logic.prewarmer.status)
+    
+    # Общая HTTP-сессия для источников гороскопов
+    await bot_logic.horoscope_service.start()
+    
+    # Фоновый прогрев гороскопов всех знаков (сразу и после каждой полуночи)
+    if Config.PREWARM_ENABLED:
+        bot_logic.prewarmer.start()
     
     # Инициализация бота
     await application.initialize()
@@ -699,6 +678,9 @@ async def run_bot_with_server(application):
         await application.stop()
         await application.shutdown()
         
+        await bot_logic.prewarmer.stop()
+        await bot_logic.horoscope_service.close()
+        
         log.info("🛑 Остановка веб-сервера...")
         await web_runner.cleanup()
 
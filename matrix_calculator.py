@@ -1,11 +1,308 @@
 import logging
-from interpretations import Interpretations
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from cache import LRUCache
+from config import Config
+from interpretations import interpretations
+from matrix_table import MatrixTable
+from message_chunks import RenderedText, render
 
 log = logging.getLogger(__name__)
 
+# Увеличивать при любом изменении алгоритма расчета: таблица пересоберется
+ALGORITHM_VERSION = 1
+
+_table: Optional[MatrixTable] = None
+
+# Структура записи calculate_matrix_batch (совпадает с записью таблицы матриц)
+BATCH_DTYPE = [
+    ("counts", "u1", (9,)),
+    ("additional", "u1", (5,)),
+    ("n_additional", "u1"),
+    ("valid", "?"),
+]
+
+
+@lru_cache(maxsize=None)
+def _cell_text(digit: int, count: int) -> str:
+    """Строка ячейки для отображения: "1 1 1" или "—" (общая для всех матриц)"""
+    if count == 0:
+        return "—"
+    # Сохраняем числа через пробел как в App.tsx
+    return ' '.join([str(digit)] * count)
+
+
+class MatrixResult:
+    """
+    Неизменяемый результат расчета матрицы.
+    
+    Хранит только счетчики ячеек 1-9 (bytes из 9 элементов), дополнительные
+    числа, дату и год. Строки ячеек и полный массив цифр строятся по запросу.
+    Для старого кода поддерживается чтение как из словаря: matrix["1"],
+    matrix.get("additional") и т.д.
+    """
+    __slots__ = ("counts", "additional", "date", "year")
+    
+    def __init__(self, counts: bytes, additional: Tuple[int, ...], date: str, year: int):
+        object.__setattr__(self, "counts", bytes(counts))
+        object.__setattr__(self, "additional", tuple(additional))
+        object.__setattr__(self, "date", date)
+        object.__setattr__(self, "year", year)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("MatrixResult неизменяем")
+    
+    def __delattr__(self, name):
+        raise AttributeError("MatrixResult неизменяем")
+    
+    def __reduce__(self):
+        # pickle и copy собирают объект через конструктор, а не через __setattr__
+        return (MatrixResult, (self.counts, self.additional, self.date, self.year))
+    
+    def count(self, digit: int) -> int:
+        """Количество цифр digit (1-9) в матрице"""
+        return self.counts[digit - 1]
+    
+    def cell(self, digit: int) -> str:
+        """Строка ячейки для отображения"""
+        return _cell_text(digit, self.counts[digit - 1])
+    
+    @property
+    def soul_number(self) -> Optional[int]:
+        """Личная задача души — второе дополнительное число"""
+        return self.additional[1] if len(self.additional) > 1 else None
+    
+    @property
+    def family_number(self) -> Optional[int]:
+        """Родовая задача — последнее дополнительное число"""
+        return self.additional[-1] if self.additional else None
+    
+    @property
+    def full_array(self) -> List[int]:
+        """Полный массив: цифры даты + доп. числа (разбитые на цифры)"""
+        full_array = [int(d) for d in self.date.replace('.', '')]
+        for num in self.additional:
+            full_array.extend([int(d) for d in str(num)])
+        if self.year >= 2020:
+            full_array.append(9)
+        return full_array
+    
+    def __getitem__(self, key: str):
+        if key in _CELL_KEYS:
+            return self.cell(int(key))
+        if key in ("additional", "date", "year", "full_array"):
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __eq__(self, other):
+        if not isinstance(other, MatrixResult):
+            return NotImplemented
+        return (self.counts, self.additional, self.date, self.year) == \
+            (other.counts, other.additional, other.date, other.year)
+    
+    def __hash__(self):
+        return hash((self.counts, self.additional, self.date, self.year))
+    
+    def __repr__(self):
+        return f"MatrixResult(date={self.date!r}, counts={list(self.counts)}, additional={self.additional})"
+
+
+_CELL_KEYS = frozenset(str(i) for i in range(1, 10))
+
+
+def _compute_numbers(nums: List[int], day: int, year: int) -> Tuple[bytes, List[int], List[int]]:
+    """Расчет дополнительных чисел и счетчиков ячеек по цифрам даты"""
+    # Первое число - сумма всех цифр даты
+    first = sum(nums)
+    
+    # Второе число - сумма цифр первого числа
+    second = sum(int(d) for d in str(first))
+    
+    # Третье число зависит от года рождения
+    if year >= 2000:
+        # Для людей родившихся после 2000 года
+        third = first + 19
+        additional = [first, second, 19, third]
+    else:
+        # Для людей до 2000 года
+        first_digit = next(d for d in str(day) if d != '0')
+        third = first - (int(first_digit) * 2)
+        additional = [first, second, third]
+    
+    # Четвертое число - сумма цифр третьего числа
+    fourth = sum(int(d) for d in str(third))
+    additional.append(fourth)
+    
+    # Полный массив: цифры даты + доп. числа (разбитые на цифры)
+    full_array = nums.copy()
+    for num in additional:
+        full_array.extend([int(d) for d in str(num)])
+    
+    # Особый случай: для рожденных >= 2020, добавляем дополнительную 9
+    if year >= 2020:
+        full_array.append(9)
+    
+    counts = bytes(full_array.count(i) for i in range(1, 10))
+    return counts, additional, full_array
+
+
+def _compute_for_string(birth_date_str: str) -> Tuple[bytes, List[int]]:
+    """
+    Прямой расчет по строке даты в любом виде, который принимает
+    calculate_matrix (например, 1.1.1990 или 00.01.2005). Для неразборчивой
+    строки или даты, по которой число не считается, бросает исключение.
+    """
+    parts = birth_date_str.split('.')
+    if len(parts) != 3:
+        raise ValueError(f"Неверный формат даты: {birth_date_str!r}")
+    day, _, year = int(parts[0]), int(parts[1]), int(parts[2])
+    # Разбиваем дату на цифры (убираем точки)
+    nums = [int(d) for d in birth_date_str.replace('.', '')]
+    counts, additional, _ = _compute_numbers(nums, day, year)
+    return counts, additional
+
+
+def _compute_for_date(day: int, month: int, year: int) -> Tuple[bytes, List[int]]:
+    """Расчет для сборки таблицы: дата в формате ДД.ММ.ГГГГ"""
+    nums = [int(d) for d in f"{day:02d}{month:02d}{year:04d}"]
+    counts, additional, _ = _compute_numbers(nums, day, year)
+    return counts, additional
+
+
+def compute_matrix_batch(dates):
+    """
+    Векторизованный расчет матриц для массива дат (NumPy); им же собирается
+    таблица матриц
+    
+    Args:
+        dates: массив строк ДД.ММ.ГГГГ, numpy datetime64 или объектов date
+    
+    Returns:
+        numpy structured array с полями counts (ячейки 1-9), additional
+        (до 5 дополнительных чисел), n_additional и valid. Для строк,
+        которые не удалось разобрать, valid=False (аналог None в
+        calculate_matrix).
+    
+    Строки ДД.ММ.ГГГГ считаются векторно; остальные строки, которые
+    принимает calculate_matrix (без ведущих нулей, нулевой день), — тем же
+    прямым расчетом, что и в calculate_matrix.
+    """
+    import numpy as np
+    
+    arr = np.asarray(dates)
+    if arr.ndim != 1:
+        arr = arr.reshape(-1)
+    
+    if arr.dtype.kind in "US":
+        # Строки ДД.ММ.ГГГГ: разбираем посимвольно как матрицу байтов
+        text = arr.astype("U")
+        encoded = np.char.encode(text, "ascii", "replace").astype("S10")
+        raw = np.frombuffer(encoded.tobytes(), dtype=np.uint8).reshape(-1, 10)
+        lengths = np.char.str_len(text)
+        codes = raw.astype(np.int64) - ord('0')
+        digit_cols = [0, 1, 3, 4, 6, 7, 8, 9]
+        digits = codes[:, digit_cols]
+        valid = (
+            (lengths == 10)
+            & (raw[:, 2] == ord('.'))
+            & (raw[:, 5] == ord('.'))
+            & ((digits >= 0) & (digits <= 9)).all(axis=1)
+        )
+        digits = np.where(valid[:, None], digits, 0)
+        day = digits[:, 0] * 10 + digits[:, 1]
+        year = digits[:, 4] * 1000 + digits[:, 5] * 100 + digits[:, 6] * 10 + digits[:, 7]
+    else:
+        days = arr.astype("datetime64[D]")
+        year = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        month = (days.astype("datetime64[M]") - days.astype("datetime64[Y]")).astype(np.int64) + 1
+        day = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+        valid = (year >= 0) & (year <= 9999)
+        digits = np.stack([
+            day // 10, day % 10,
+            month // 10, month % 10,
+            year // 1000, year // 100 % 10, year // 10 % 10, year % 10,
+        ], axis=1)
+    
+    # Все промежуточные числа меньше 100, поэтому сумма цифр — десятки + единицы
+    first = digits.sum(axis=1)
+    second = first // 10 + first % 10
+    
+    after_2000 = year >= 2000
+    first_digit = np.where(day >= 10, day // 10, day)
+    third = np.where(after_2000, first + 19, first - first_digit * 2)
+    fourth = third // 10 + third % 10
+    
+    # Прямой расчет не справляется с нулевым днем до 2000 года и отрицательным
+    # третьим числом; строки с нулевым днем пересчитываются ниже по одной
+    valid &= (day > 0) & (third >= 0)
+    
+    zero = np.zeros_like(first)
+    additional = np.where(
+        after_2000[:, None],
+        np.stack([first, second, np.full_like(first, 19), third, fourth], axis=1),
+        np.stack([first, second, third, fourth, zero], axis=1),
+    )
+    
+    # Полный массив: цифры даты + цифры доп. чисел + 9 для рожденных >= 2020.
+    # Нули в ячейки 1-9 не попадают, поэтому однозначные числа можно не обрезать.
+    columns = np.concatenate([
+        digits,
+        additional // 10,
+        additional % 10,
+        np.where(year >= 2020, 9, 0)[:, None],
+    ], axis=1)
+    counts = (columns[:, :, None] == np.arange(1, 10)).sum(axis=1)
+    
+    result = np.zeros(len(arr), dtype=BATCH_DTYPE)
+    result["counts"] = np.where(valid[:, None], counts, 0)
+    result["additional"] = np.where(valid[:, None], additional, 0)
+    result["n_additional"] = np.where(valid, np.where(after_2000, 5, 4), 0)
+    result["valid"] = valid
+    
+    if arr.dtype.kind in "US":
+        # Строки не в формате ДД.ММ.ГГГГ — как в calculate_matrix, по одной
+        for i in np.flatnonzero(~valid):
+            try:
+                row_counts, row_additional = _compute_for_string(str(text[i]))
+            except Exception:
+                continue
+            # Числа из очень длинных строк не помещаются в поля u1
+            if len(row_additional) > 5 or max(row_additional) > 255:
+                continue
+            result["counts"][i] = list(row_counts)
+            result["additional"][i, :len(row_additional)] = row_additional
+            result["n_additional"][i] = len(row_additional)
+            result["valid"][i] = True
+    return result
+
+
+def get_matrix_table() -> Optional[MatrixTable]:
+    """Общая для процесса таблица матриц (открывается один раз)"""
+    global _table
+    if _table is None:
+        try:
+            _table = MatrixTable(
+                Config.MATRIX_TABLE_PATH, ALGORITHM_VERSION, _compute_for_date, compute_matrix_batch
+            ).open()
+        except Exception as e:
+            log.error(f"❌ Не удалось загрузить таблицу матриц, используем прямой расчет: {e}")
+            return None
+    return _table
+
+
 class MatrixCalculator:
-    def __init__(self):
-        self.interp = Interpretations()
+    def __init__(self, use_table: bool = True):
+        self.interp = interpretations
+        self.table = get_matrix_table() if use_table else None
+        # Готовый текст интерпретаций по сигнатуре (счетчики, душа, род, пол, заголовок)
+        self.interp_cache = LRUCache(Config.INTERPRETATION_CACHE_SIZE)
     
     def calculate_matrix(self, birth_date_str: str):
         """Полный расчет нумерологической матрицы по алгоритму из App.tsx"""
@@ -17,63 +314,29 @@ class MatrixCalculator:
             
             day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
             
-            # Разбиваем дату на цифры (убираем точки)
-            nums = [int(d) for d in birth_date_str.replace('.', '')]
-            
-            # Первое число - сумма всех цифр даты
-            first = sum(nums)
-            
-            # Второе число - сумма цифр первого числа
-            second = sum(int(d) for d in str(first))
+            # Для даты в формате ДД.ММ.ГГГГ берем готовый результат из таблицы
+            row = None
+            if self.table is not None and len(birth_date_str) == 10 and birth_date_str[2] == birth_date_str[5] == '.':
+                row = self.table.lookup(day, month, year)
             
-            # Третье число зависит от года рождения
-            if year >= 2000:
-                # Для людей родившихся после 2000 года
-                third = first + 19
-                additional = [first, second, 19, third]
+            if row is not None:
+                counts, additional = row
             else:
-                # Для людей до 2000 года
-                first_digit = next(d for d in str(day) if d != '0')
-                third = first - (int(first_digit) * 2)
-                additional = [first, second, third]
+                counts, additional = _compute_for_string(birth_date_str)
             
-            # Четвертое число - сумма цифр третьего числа
-            fourth = sum(int(d) for d in str(third))
-            additional.append(fourth)
-            
-            # Полный массив: цифры даты + доп. числа (разбитые на цифры)
-            full_array = nums.copy()
-            for num in additional:
-                full_array.extend([int(d) for d in str(num)])
-            
-            # Особый случай: для рожденных >= 2020, добавляем дополнительную 9
-            if year >= 2020:
-                full_array.append(9)
-            
-            # Заполнение ячеек 1-9
-            matrix = {}
-            for i in range(1, 10):
-                count = full_array.count(i)
-                if count > 0:
-                    # Сохраняем числа через пробел как в App.tsx
-                    matrix[str(i)] = ' '.join([str(i)] * count)
-                else:
-                    matrix[str(i)] = "—"
-            
-            matrix["additional"] = additional
-            matrix["date"] = birth_date_str
-            matrix["year"] = year
-            matrix["full_array"] = full_array
-            
-            return matrix
+            return MatrixResult(counts, additional, birth_date_str, year)
             
         except Exception as e:
             log.error(f"Ошибка в расчете матрицы: {e}")
             return None
 
-    def format_matrix_display(self, matrix_data: dict) -> str:
+    def calculate_matrix_batch(self, dates):
+        """Векторизованный расчет матриц для массива дат (см. compute_matrix_batch)"""
+        return compute_matrix_batch(dates)
+
+    def format_matrix_display(self, matrix_data: MatrixResult) -> str:
         """Отрисовка таблицы с использованием моноширинных рамок"""
-        m = {str(i): matrix_data.get(str(i), "—") for i in range(1, 10)}
+        m = {str(i): matrix_data.cell(i) for i in range(1, 10)}
 
         header = "┏━━━━━━━━━┳━━━━━━━━━┳━━━━━━━━━┓"
         row1   = f"┃{m['1']:^9}┃{m['4']:^9}┃{m['7']:^9}┃"
@@ -84,79 +347,77 @@ class MatrixCalculator:
 
         return f"{header}\n{row1}\n{sep}\n{row2}\n{sep}\n{row3}\n{footer}"
     
-    def get_interpretations(self, matrix_data: dict, gender: str) -> str:
+    def render_interpretations(self, matrix_data: MatrixResult, gender: str, header: str = "") -> RenderedText:
+        """
+        Интерпретации с заголовком, уже разбитые на сообщения.
+        
+        Текст зависит только от счетчиков ячеек, чисел души и рода и пола,
+        поэтому результат кешируется по этой сигнатуре.
+        """
+        key = (matrix_data.counts, matrix_data.soul_number, matrix_data.family_number, gender, header)
+        rendered = self.interp_cache.get(key)
+        if rendered is not None:
+            return rendered
+        
+        try:
+            rendered = render(header + self._build_interpretations(matrix_data, gender))
+        except Exception as e:
+            log.error(f"Ошибка в получении интерпретаций: {e}")
+            return render(header + "❌ Не удалось получить интерпретации")
+        
+        self.interp_cache.set(key, rendered)
+        return rendered
+    
+    def get_interpretations(self, matrix_data: MatrixResult, gender: str) -> str:
         """Получение интерпретаций для матрицы с учетом пола"""
         try:
-            result = []
+            return self._build_interpretations(matrix_data, gender)
+        except Exception as e:
+            log.error(f"Ошибка в получении интерпретаций: {e}")
+            return "❌ Не удалось получить интерпретации"
+    
+    def _build_interpretations(self, matrix_data: MatrixResult, gender: str) -> str:
+        """Сборка текста интерпретаций"""
+        result = []
+        
+        # Дополнительные числа
+        additional = matrix_data.additional
+        if len(additional) >= 4:
+            # ВАЖНО: Личная задача души = ВТОРОЕ число (index 1)
+            # Родовая задача = ЧЕТВЕРТОЕ число (index 3 или last)
+            second = str(additional[1])
+            fourth = str(additional[-1])  # Последнее число
             
-            # Дополнительные числа
-            additional = matrix_data.get("additional", [])
-            if len(additional) >= 4:
-                # ВАЖНО: Личная задача души = ВТОРОЕ число (index 1)
-                # Родовая задача = ЧЕТВЕРТОЕ число (index 3 или last)
-                second = str(additional[1])
-                fourth = str(additional[-1])  # Последнее число
-                
-                result.append("━━━━━━━━━━━━━━━━━━━━━")
-                result.append("🎯 *ЛИЧНАЯ ЗАДАЧА ДУШИ*")
-                result.append(f"_(Число {second})_\n")
-                task_text = self.interp.tasks_data.get(second, "Нет данных")
-                result.append(task_text)
-                result.append("")
-                
-                result.append("━━━━━━━━━━━━━━━━━━━━━")
-                result.append("👪 *РОДОВАЯ ЗАДАЧА (ЧРП)*")
-                result.append(f"_(Число {fourth})_\n")
-                task_text = self.interp.tasks_data.get(fourth, "Нет данных")
-                result.append(task_text)
-                result.append("")
+            result.append("━━━━━━━━━━━━━━━━━━━━━")
+            result.append("🎯 *ЛИЧНАЯ ЗАДАЧА ДУШИ*")
+            result.append(f"_(Число {second})_\n")
+            task_text = self.interp.tasks_data.get(second, "Нет данных")
+            result.append(task_text)
+            result.append("")
             
-            result.append("📊 *ЗНАЧЕНИЯ МАТРИЦЫ*\n")
+            result.append("━━━━━━━━━━━━━━━━━━━━━")
+            result.append("👪 *РОДОВАЯ ЗАДАЧА (ЧРП)*")
+            result.append(f"_(Число {fourth})_\n")
+            task_text = self.interp.tasks_data.get(fourth, "Нет данных")
+            result.append(task_text)
+            result.append("")
+        
+        result.append("📊 *ЗНАЧЕНИЯ МАТРИЦЫ*\n")
+        
+        # Интерпретации для каждой цифры
+        for num in range(1, 10):
+            count = matrix_data.count(num)
             
-            # Интерпретации для каждой цифры
-            for num in range(1, 10):
-                cell_value = matrix_data.get(str(num), "—")
-                
-                # Пропускаем пустые ячейки
-                if cell_value == "—":
-                    continue
-                
-                # Определяем ключ для интерпретации (количество цифр)
-                count = len(cell_value.replace(' ', ''))
-                
-                # Формируем ключ
-                if num in [1, 2, 3, 4, 6, 7, 8, 9]:
-                    # Для этих цифр есть разные интерпретации
-                    if count == 0:
-                        key = f"{num}0"
-                    else:
-                        key = str(num) * count
-                else:
-                    key = str(num) * count if count > 0 else f"{num}0"
-                
-                # Получаем интерпретацию
-                interpretation = self.interp.matrix_data.get(key, "")
-                
-                if interpretation:
-                    result.append(f"*Цифра {num}* ({cell_value}):")
-                    
-                    # Если интерпретация зависит от пола (словарь)
-                    if isinstance(interpretation, dict):
-                        if gender == "женский":
-                            text = interpretation.get("women", "")
-                        else:  # мужской
-                            text = interpretation.get("men", "")
-                        
-                        if text:
-                            result.append(text)
-                    else:
-                        # Обычная интерпретация (строка)
-                        result.append(interpretation)
-                    
-                    result.append("")
+            # Пропускаем пустые ячейки
+            if count == 0:
+                continue
             
-            return "\n".join(result)
+            # Интерпретация по единой таблице (цифра, количество, пол)
+            text = self.interp.matrix_text(num, count, gender)
             
-        except Exception as e:
-            log.error(f"Ошибка в получении интерпретаций: {e}")
-            return "❌ Не удалось получить интерпретации"
+            if text:
+                result.append(f"*Цифра {num}* ({matrix_data.cell(num)}):")
+                result.append(text)
+                result.append("")
+        
+        return "\n".join(result)
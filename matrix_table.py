@@ -0,0 +1,176 @@
+"""
+Предрассчитанная таблица матриц для всех дат с 01.01.1900 по 31.12.2100.
+
+Результат расчета матрицы зависит только от даты, поэтому все ~73 тыс. дат
+считаются один раз и складываются в компактный бинарный файл фиксированного
+формата. Файл отображается в память (mmap), поиск по дате — O(1) без разбора
+строки и без построения промежуточных списков.
+
+Формат файла:
+    заголовок  — magic, версия формата, версия алгоритма, ordinal первой даты,
+                 количество записей;
+    записи     — по 16 байт на дату: 9 счетчиков ячеек 1-9, количество
+                 дополнительных чисел и до 5 дополнительных чисел.
+
+Если версия алгоритма в заголовке не совпадает с текущей, таблица
+пересобирается автоматически. При наличии NumPy все даты считаются одним
+векторизованным расчетом (~0.2 с вместо ~1.6 с поштучно), так что сборка
+после чистого деплоя почти не задерживает запуск бота.
+"""
+import logging
+import mmap
+import os
+import struct
+from datetime import date
+from typing import Callable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"MXTB"
+FORMAT_VERSION = 1
+
+FIRST_DATE = date(1900, 1, 1)
+LAST_DATE = date(2100, 12, 31)
+
+HEADER = struct.Struct("<4sHHII")
+RECORD = struct.Struct("<9sB5Bx")
+MAX_ADDITIONAL = 5
+
+# (day, month, year) -> (счетчики ячеек 1-9, дополнительные числа)
+ComputeFn = Callable[[int, int, int], Tuple[bytes, List[int]]]
+
+# Массив numpy datetime64 -> структурированный массив с полями counts,
+# additional, n_additional и valid (см. matrix_calculator.compute_matrix_batch)
+ComputeBatchFn = Callable[[object], object]
+
+# Запись таблицы в виде dtype NumPy (совпадает с RECORD)
+RECORD_DTYPE = [
+    ("counts", "u1", (9,)),
+    ("n_additional", "u1"),
+    ("additional", "u1", (MAX_ADDITIONAL,)),
+    ("pad", "u1"),
+]
+
+
+class MatrixTable:
+    """Таблица матриц, отображенная в память"""
+
+    def __init__(
+        self,
+        path: str,
+        algorithm_version: int,
+        compute: ComputeFn,
+        compute_batch: Optional[ComputeBatchFn] = None,
+    ):
+        self.path = path
+        self.algorithm_version = algorithm_version
+        self._compute = compute
+        self._compute_batch = compute_batch
+        self._file = None
+        self._mm = None
+        self._first_ordinal = FIRST_DATE.toordinal()
+        self._count = 0
+
+    def open(self) -> "MatrixTable":
+        """Открывает таблицу, пересобирая ее при отсутствии или смене версии"""
+        if not self._is_current():
+            self.build()
+
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, self._first_ordinal, self._count = HEADER.unpack_from(self._mm, 0)
+        log.info(f"📦 Таблица матриц загружена: {self._count} дат ({self.path})")
+        return self
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _is_current(self) -> bool:
+        """Проверяет, что файл существует и собран текущей версией алгоритма"""
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(HEADER.size)
+        except OSError:
+            return False
+
+        if len(header) != HEADER.size:
+            return False
+
+        magic, fmt, algo, first_ordinal, count = HEADER.unpack(header)
+        expected_count = LAST_DATE.toordinal() - FIRST_DATE.toordinal() + 1
+        return (
+            magic == MAGIC
+            and fmt == FORMAT_VERSION
+            and algo == self.algorithm_version
+            and first_ordinal == FIRST_DATE.toordinal()
+            and count == expected_count
+            and os.path.getsize(self.path) == HEADER.size + count * RECORD.size
+        )
+
+    def build(self) -> None:
+        """Рассчитывает все даты диапазона и атомарно записывает файл"""
+        first_ordinal = FIRST_DATE.toordinal()
+        count = LAST_DATE.toordinal() - first_ordinal + 1
+        log.info(f"🔨 Сборка таблицы матриц (версия алгоритма {self.algorithm_version})...")
+
+        buf = bytearray(HEADER.size + count * RECORD.size)
+        HEADER.pack_into(buf, 0, MAGIC, FORMAT_VERSION, self.algorithm_version, first_ordinal, count)
+
+        records = self._build_records_batch(count) if self._compute_batch is not None else None
+        if records is not None:
+            buf[HEADER.size:] = records
+        else:
+            for idx in range(count):
+                d = date.fromordinal(first_ordinal + idx)
+                counts, additional = self._compute(d.day, d.month, d.year)
+                if len(additional) > MAX_ADDITIONAL or not all(0 <= n <= 255 for n in additional):
+                    raise ValueError(f"Дополнительные числа {additional} не помещаются в запись таблицы")
+                padded = list(additional) + [0] * (MAX_ADDITIONAL - len(additional))
+                RECORD.pack_into(buf, HEADER.size + idx * RECORD.size, counts, len(additional), *padded)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(buf)
+        os.replace(tmp_path, self.path)
+        log.info(f"✅ Таблица матриц собрана: {count} дат, {len(buf)} байт")
+
+    def _build_records_batch(self, count: int) -> Optional[bytes]:
+        """Записи всех дат одним векторизованным расчетом (None без NumPy)"""
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+
+        days = np.datetime64(FIRST_DATE, "D") + np.arange(count)
+        batch = self._compute_batch(days)
+        if not batch["valid"].all():
+            raise ValueError("Пакетный расчет не смог обработать часть дат диапазона")
+        records = np.zeros(count, dtype=RECORD_DTYPE)
+        records["counts"] = batch["counts"]
+        records["n_additional"] = batch["n_additional"]
+        records["additional"] = batch["additional"]
+        return records.tobytes()
+
+    def lookup(self, day: int, month: int, year: int) -> Optional[Tuple[bytes, Tuple[int, ...]]]:
+        """Возвращает (счетчики ячеек 1-9, дополнительные числа) или None вне диапазона"""
+        if self._mm is None:
+            return None
+
+        try:
+            idx = date(year, month, day).toordinal() - self._first_ordinal
+        except ValueError:
+            return None
+
+        if not 0 <= idx < self._count:
+            return None
+
+        counts, n, *additional = RECORD.unpack_from(self._mm, HEADER.size + idx * RECORD.size)
+        return counts, tuple(additional[:n])
@@ -0,0 +1,196 @@
+"""
+Разбивка длинных текстов на сообщения Telegram
+
+Текст режется по абзацам, затем по строкам и словам так, чтобы каждая часть
+укладывалась в лимит Telegram. Каждая часть заранее проверяется парсером
+Markdown (legacy-режим Bot API): незакрытые `*`, `_`, `` ` `` и `[`
+экранируются, поэтому отправка обычно проходит с первой попытки. Если
+Telegram все же отклонил разметку части, send_chunk переотправляет ее
+простым текстом.
+"""
+import logging
+from functools import lru_cache
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple
+
+from telegram.error import BadRequest
+
+log = logging.getLogger(__name__)
+
+# Лимит Telegram — 4096 символов в UTF-16; оставляем запас на экранирование
+MAX_MESSAGE_LENGTH = 4096
+_ESCAPE_RESERVE = 64
+
+_ENTITY_CHARS = "_*`["
+
+
+class Chunk(NamedTuple):
+    """Часть сообщения и режим разметки, с которым ее можно отправить"""
+    text: str
+    parse_mode: Optional[str] = "Markdown"
+
+
+class RenderedText(NamedTuple):
+    """Готовый текст и его разбивка на сообщения"""
+    text: str
+    chunks: Tuple[Chunk, ...]
+
+
+def _tg_len(text: str) -> int:
+    """Длина в единицах UTF-16, как ее считает Telegram"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def find_markdown_error(text: str) -> Optional[int]:
+    """
+    Проверяет текст парсером legacy Markdown.
+
+    Returns:
+        Позицию начала незакрытой сущности или None, если текст корректен
+    """
+    i = 0
+    size = len(text)
+    while i < size:
+        c = text[i]
+        if c == "\\" and i + 1 < size and text[i + 1] in _ENTITY_CHARS:
+            i += 2
+            continue
+        if c not in _ENTITY_CHARS:
+            i += 1
+            continue
+
+        start = i
+        if c == "`" and text.startswith("```", i):
+            end = text.find("```", i + 3)
+            if end == -1:
+                return start
+            i = end + 3
+            continue
+
+        end_char = "]" if c == "[" else c
+        end = text.find(end_char, i + 1)
+        if end == -1:
+            return start
+        i = end + 1
+
+        if c == "[" and i < size and text[i] == "(":
+            close = text.find(")", i + 1)
+            if close == -1:
+                return start
+            i = close + 1
+    return None
+
+
+def escape_unbalanced(text: str) -> str:
+    """Экранирует начала незакрытых сущностей, пока текст не станет корректным"""
+    while True:
+        pos = find_markdown_error(text)
+        if pos is None:
+            return text
+        text = text[:pos] + "\\" + text[pos:]
+
+
+def _split_long(piece: str, limit: int) -> List[str]:
+    """Режет слишком длинный фрагмент по строкам, словам и, в крайнем случае, по символам"""
+    for sep in ("\n", " "):
+        if sep not in piece:
+            continue
+        parts: List[str] = []
+        current = ""
+        for word in piece.split(sep):
+            candidate = f"{current}{sep}{word}" if current else word
+            if _tg_len(candidate) <= limit:
+                current = candidate
+                continue
+            if current:
+                parts.append(current)
+            if _tg_len(word) <= limit:
+                current = word
+            else:
+                parts.extend(_split_long(word, limit))
+                current = ""
+        if current:
+            parts.append(current)
+        return parts
+
+    parts = []
+    current = ""
+    for ch in piece:
+        if _tg_len(current) + _tg_len(ch) > limit:
+            parts.append(current)
+            current = ""
+        current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_message(text: str, max_length: int = MAX_MESSAGE_LENGTH) -> Tuple[Chunk, ...]:
+    """Разбивает текст на части, готовые к отправке с parse_mode="Markdown" """
+    limit = max(1, max_length - _ESCAPE_RESERVE)
+
+    pieces: List[str] = []
+    current: List[str] = []
+    current_length = 0
+
+    for part in text.split("\n\n"):
+        part_length = _tg_len(part) + 2
+
+        if part_length - 2 > limit:
+            if current:
+                pieces.append("\n\n".join(current))
+                current, current_length = [], 0
+            pieces.extend(_split_long(part, limit))
+            continue
+
+        if current and current_length + part_length > limit:
+            pieces.append("\n\n".join(current))
+            current, current_length = [], 0
+
+        current.append(part)
+        current_length += part_length
+
+    if current:
+        pieces.append("\n\n".join(current))
+
+    chunks = []
+    for piece in pieces:
+        if not piece.strip():
+            continue
+        escaped = escape_unbalanced(piece)
+        if _tg_len(escaped) <= max_length:
+            chunks.append(Chunk(escaped))
+        else:
+            # Экранирование не уместилось в лимит — отправляем как простой текст
+            chunks.append(Chunk(piece, None))
+    return tuple(chunks)
+
+
+def render(text: str) -> RenderedText:
+    return RenderedText(text, split_message(text))
+
+
+@lru_cache(maxsize=256)
+def render_cached(text: str) -> RenderedText:
+    """render() с запоминанием: повторная отправка того же текста не режет его заново"""
+    return render(text)
+
+
+async def send_chunk(send: Callable[..., Awaitable], chunk: Chunk) -> bool:
+    """
+    Отправляет часть через send (reply_text или edit_text сообщения). Часть,
+    разметку которой отклонил Telegram, переотправляется без разметки.
+    Возвращает False, если отправить так и не удалось.
+    """
+    try:
+        await send(chunk.text, parse_mode=chunk.parse_mode)
+        return True
+    except BadRequest as e:
+        log.warning(f"⚠️ Telegram отклонил часть сообщения: {e}")
+        if chunk.parse_mode is None:
+            return False
+    try:
+        await send(chunk.text, parse_mode=None)
+        return True
+    except BadRequest as e:
+        log.error(f"❌ Не удалось отправить часть сообщения: {e}")
+        return False
@@ -0,0 +1,79 @@
+"""
+Постепенное обновление сообщения Telegram по мере генерации текста.
+
+Пока модель печатает ответ, StreamingMessage редактирует статусное сообщение
+частичным текстом — не чаще раза в STREAM_EDIT_INTERVAL секунд, чтобы не
+упереться в лимиты Bot API. Правка выполняется в фоне и не задерживает чтение
+потока. Финальный текст проверяется и режется так же, как обычные ответы
+(message_chunks): первая часть заменяет статус, остальные отправляются
+следующими сообщениями. Часть, разметку которой Telegram все же отклонил,
+уходит простым текстом.
+"""
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from config import Config
+from message_chunks import MAX_MESSAGE_LENGTH, _tg_len, escape_unbalanced, render_cached, send_chunk
+
+log = logging.getLogger(__name__)
+
+# Курсор в конце частичного текста
+CURSOR = " ▌"
+
+
+class StreamingMessage:
+    def __init__(
+        self,
+        message,
+        header: str = "",
+        interval: float = Config.STREAM_EDIT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.message = message
+        self.header = header
+        self.interval = interval
+        self._clock = clock
+        self._last_edit: Optional[float] = None
+        self._latest: Optional[str] = None
+        self._shown: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self.edits = 0
+
+    async def update(self, text: str) -> None:
+        """Новый частичный текст; правка — не чаще раза в interval секунд"""
+        self._latest = text
+        if self._task is not None and not self._task.done():
+            return
+        if self._last_edit is not None and self._clock() - self._last_edit < self.interval:
+            return
+        self._last_edit = self._clock()
+        self._task = asyncio.ensure_future(self._edit_partial())
+
+    async def _edit_partial(self) -> None:
+        text = escape_unbalanced(self.header + self._latest) + CURSOR
+        # Частичный текст, не влезающий в одно сообщение, дальше не показываем
+        if text == self._shown or _tg_len(text) > MAX_MESSAGE_LENGTH:
+            return
+        try:
+            await self.message.edit_text(text, parse_mode="Markdown")
+            self._shown = text
+            self.edits += 1
+        except Exception as e:
+            log.debug(f"Не удалось обновить сообщение: {type(e).__name__}: {e}")
+
+    async def finish(self, text: str) -> None:
+        """Финальный текст: проверенная разметка, длинный текст — несколькими сообщениями"""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+        first, *rest = render_cached(self.header + text).chunks
+        try:
+            edited = await send_chunk(self.message.edit_text, first)
+        except Exception as e:
+            log.warning(f"⚠️ Не удалось заменить статус гороскопом: {type(e).__name__}: {e}")
+            edited = False
+        if not edited:
+            await send_chunk(self.message.reply_text, first)
+        for chunk in rest:
+            await send_chunk(self.message.reply_text, chunk)
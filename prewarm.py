@@ -0,0 +1,171 @@
+"""
+Прогрев кеша гороскопов после смены суток.
+
+Фоновая задача вскоре после полуночи генерирует гороскопы всех 12 знаков
+с ограниченной параллельностью, чтобы первый пользователь каждого знака
+получал ответ из кеша, а не ждал парсинга источников и ответа AI. AI-гороскоп
+зависит от числа души, поэтому (PREWARM_SOUL_NUMBERS) прогреваются все
+варианты знак × число души; без Groq — только знаки. Сервис с
+get_daily_horoscopes получает все варианты знака одним вызовом: источники
+знака парсятся один раз, а один запрос к AI покрывает пачку из LLM_BATCH_SIZE
+вариантов.
+Резервные гороскопы без AI на новый день строятся в начале прогрева. При
+старте бота прогрев запускается сразу для текущего дня. Прогресс доступен
+через status() (эндпоинт /prewarm).
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from config import Config
+from horoscope_fallback import daily_fallbacks
+
+log = logging.getLogger(__name__)
+
+# Названия знаков в том виде, в каком их сохраняет NumerologyBot._get_zodiac
+ZODIAC_SIGNS = (
+    "♈ Овен", "♉ Телец", "♊ Близнецы", "♋ Рак", "♌ Лев", "♍ Дева",
+    "♎ Весы", "♏ Скорпион", "♐ Стрелец", "♑ Козерог", "♒ Водолей", "♓ Рыбы",
+)
+
+
+def prewarm_variants(signs=ZODIAC_SIGNS, soul_numbers=()) -> Dict[str, Dict]:
+    """Запросы для прогрева: подпись -> user_data для get_daily_horoscope"""
+    if not soul_numbers:
+        return {sign: {"zodiac": sign} for sign in signs}
+    # Из матрицы гороскопу нужно только число души (второе дополнительное число)
+    return {
+        f"{sign} / {soul}": {"zodiac": sign, "matrix": {"additional": [0, soul]}}
+        for sign in signs
+        for soul in soul_numbers
+    }
+
+
+def seconds_until_next_run(now: datetime, delay: float) -> float:
+    """Секунды до следующего прогрева: полночь плюс delay секунд"""
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(0.0, (midnight - now).total_seconds() + delay)
+
+
+class HoroscopePrewarmer:
+    def __init__(
+        self,
+        service,
+        signs=ZODIAC_SIGNS,
+        soul_numbers=(),
+        concurrency: int = Config.PREWARM_CONCURRENCY,
+        delay: float = Config.PREWARM_DELAY,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.service = service
+        # Без AI гороскоп от числа души не зависит
+        if getattr(service, "groq_client", None) is None:
+            soul_numbers = ()
+        self.variants = prewarm_variants(signs, soul_numbers)
+        self.concurrency = max(1, concurrency)
+        self.delay = delay
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._status: Dict[str, object] = {
+            "state": "idle",
+            "date": None,
+            "total": len(self.variants),
+            "done": 0,
+            "failed": 0,
+            "items": {},
+            "started_at": None,
+            "duration": None,
+            "next_run": None,
+        }
+
+    def status(self) -> Dict[str, object]:
+        """Снимок состояния прогрева"""
+        status = dict(self._status)
+        status["items"] = dict(self._status["items"])
+        return status
+
+    def _groups(self) -> List[Dict[str, Dict]]:
+        """Варианты, которые прогреваются одним вызовом (все варианты знака, если сервис умеет пачки)"""
+        if not hasattr(self.service, "get_daily_horoscopes"):
+            return [{label: user_data} for label, user_data in self.variants.items()]
+        groups: Dict[str, Dict[str, Dict]] = {}
+        for label, user_data in self.variants.items():
+            groups.setdefault(user_data["zodiac"], {})[label] = user_data
+        return list(groups.values())
+
+    async def run_once(self) -> Dict[str, object]:
+        """Генерирует гороскопы всех знаков на текущий день"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        self._status.update(
+            state="running",
+            date=self._clock().strftime("%Y-%m-%d"),
+            done=0,
+            failed=0,
+            items={label: "pending" for label in self.variants},
+            started_at=self._clock().isoformat(timespec="seconds"),
+            duration=None,
+        )
+        log.info(f"🔥 Прогрев гороскопов на {self._status['date']}: {len(self.variants)} вариантов")
+        # Резервные гороскопы на день готовы до первого запроса без источников и AI
+        daily_fallbacks(self._clock().date())
+
+        async def warm(group: Dict[str, Dict]) -> None:
+            async with semaphore:
+                for label in group:
+                    self._status["items"][label] = "running"
+                try:
+                    # get_daily_horoscopes ставит запросы к AI в фоновую очередь
+                    # планировщика (и для одного варианта), чтобы прогрев не
+                    # обгонял пользователей
+                    if hasattr(self.service, "get_daily_horoscopes"):
+                        await self.service.get_daily_horoscopes(list(group.values()))
+                    else:
+                        await self.service.get_daily_horoscope(*group.values())
+                except Exception as e:
+                    log.error(f"❌ Прогрев {', '.join(group)} не удался: {type(e).__name__}: {e}")
+                    state, counter = "failed", "failed"
+                else:
+                    state, counter = "done", "done"
+                for label in group:
+                    self._status["items"][label] = state
+                    self._status[counter] += 1
+
+        await asyncio.gather(*(warm(group) for group in self._groups()))
+
+        duration = round(time.perf_counter() - started, 2)
+        self._status.update(state="done", duration=duration)
+        log.info(
+            f"✅ Прогрев завершен за {duration} с: "
+            f"{self._status['done']} готово, {self._status['failed']} с ошибкой"
+        )
+        return self.status()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                log.error(f"❌ Ошибка прогрева: {type(e).__name__}: {e}")
+                self._status["state"] = "failed"
+
+            wait = seconds_until_next_run(self._clock(), self.delay)
+            self._status["next_run"] = (self._clock() + timedelta(seconds=wait)).isoformat(timespec="seconds")
+            await asyncio.sleep(wait)
+
+    def start(self) -> None:
+        """Запускает фоновый прогрев (сразу и далее после каждой полуночи)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            log.info("🔥 Планировщик прогрева гороскопов запущен")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,160 @@
+"""
+Реестр источников гороскопов.
+
+Каждый источник описывается декларативно: шаблон URL, селекторы блока со
+статьей, вес и лимит одновременных запросов. SourceRegistry загружает все
+источники параллельно через общую HTTP-сессию под общим семафором, с
+дедлайном и кешем опоздавших к нему текстов. Чтобы добавить источник,
+достаточно вызвать register_source() — код сервисов при этом не меняется.
+"""
+import asyncio
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cache import get_source_cache
+from config import Config
+from deadline import gather_with_deadline
+from html_extract import MAIL_RU_TARGETS, RAMBLER_TARGETS, Target, extract_text, run_parser
+from http_fetcher import HttpFetcher
+
+log = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Текст короче этого считается не найденным
+MIN_CONTENT_LENGTH = 51
+
+
+class Source(NamedTuple):
+    """Описание источника гороскопов"""
+    name: str
+    url_template: str                  # {sign} — английское название знака
+    targets: Tuple[Target, ...]        # селекторы блока в порядке приоритета
+    first_paragraph: bool = False      # брать только первый абзац блока
+    min_length: int = 1                # минимальная длина текста для селектора
+    weight: float = 1.0                # порядок источников в контексте гороскопа
+    concurrency: int = 4               # одновременных запросов к источнику
+    max_chars: int = 800
+
+    def url(self, sign_en: str) -> str:
+        return self.url_template.format(sign=sign_en)
+
+    def extract(self, html: str) -> Optional[str]:
+        return extract_text(html, self.targets, self.first_paragraph, self.min_length)
+
+
+SOURCES: Dict[str, Source] = {}
+
+_registry: Optional["SourceRegistry"] = None
+
+
+def register_source(source: Source) -> None:
+    """Добавляет (или заменяет) источник в реестре"""
+    SOURCES[source.name] = source
+
+
+register_source(Source(
+    name="Mail.ru",
+    url_template="https://horo.mail.ru/prediction/{sign}/today/",
+    targets=MAIL_RU_TARGETS,
+    weight=1.0,
+))
+register_source(Source(
+    name="Rambler",
+    url_template="https://horoscopes.rambler.ru/{sign}/",
+    targets=RAMBLER_TARGETS,
+    first_paragraph=True,
+    min_length=MIN_CONTENT_LENGTH,
+    weight=0.9,
+))
+
+
+class SourceRegistry:
+    def __init__(
+        self,
+        sources: Optional[Dict[str, Source]] = None,
+        http: Optional[HttpFetcher] = None,
+        concurrency: int = Config.SOURCE_CONCURRENCY,
+    ) -> None:
+        self._sources = sources
+        self.http = http or HttpFetcher(HEADERS)
+        self.cache = get_source_cache()
+        self._shared = asyncio.Semaphore(concurrency)
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def sources(self) -> List[Source]:
+        """Источники по убыванию веса"""
+        sources = SOURCES if self._sources is None else self._sources
+        return sorted(sources.values(), key=lambda s: -s.weight)
+
+    async def start(self) -> None:
+        await self.http.start()
+
+    async def close(self) -> None:
+        await self.http.close()
+
+    async def _extract(self, source: Source, html: str) -> Optional[str]:
+        """Текст источника (при ответе 304 используется прежний результат)"""
+        try:
+            content = await run_parser(source.extract, html)
+            if content and len(content) >= MIN_CONTENT_LENGTH:
+                log.info(f"✅ {source.name}: получено {len(content)} символов")
+                return content[:source.max_chars]
+            log.warning(f"⚠️ {source.name}: контент не найден или слишком короткий")
+        except Exception as e:
+            log.error(f"❌ Ошибка парсинга {source.name}: {e}")
+        return None
+
+    async def fetch(self, source: Source, sign_en: str) -> Optional[str]:
+        """Загружает текст одного источника с учетом лимитов параллельности"""
+        limit = self._limits.get(source.name)
+        if limit is None:
+            limit = self._limits[source.name] = asyncio.Semaphore(source.concurrency)
+        url = source.url(sign_en)
+        # Сначала лимит источника, затем общий: ожидающий своей очереди запрос
+        # к медленному источнику не занимает общие слоты остальных
+        async with limit, self._shared:
+            log.info(f"🔍 Парсинг {source.name}: {url}")
+            return await self.http.fetch_parsed(url, lambda html: self._extract(source, html))
+
+    async def fetch_all(self, sign_en: str, deadline: float = Config.PARSE_DEADLINE) -> Dict[str, str]:
+        """
+        Тексты всех источников для знака, готовые к дедлайну.
+
+        Опоздавшие к дедлайну результаты сохраняются в кеш в фоне
+        (PARSE_MERGE_LATE) и используются следующим вызовом, пока не истечет
+        PARSE_LATE_TTL. Вовремя полученные тексты не кешируются: повторный
+        запрос идет к источнику условным GET и при ответе 304 обходится без
+        загрузки и разбора страницы.
+        """
+        sources = self.sources
+        cached = {s.name: self.cache.get((s.name, sign_en)) for s in sources}
+        coros = {s.name: self.fetch(s, sign_en) for s in sources if cached[s.name] is None}
+
+        def merge_late(name: str, text: str) -> None:
+            self.cache.set((name, sign_en), text)
+
+        fresh = await gather_with_deadline(coros, deadline, merge_late if Config.PARSE_MERGE_LATE else None)
+
+        texts = {}
+        for source in sources:
+            text = cached[source.name] or fresh.get(source.name)
+            if text:
+                texts[source.name] = text
+        return texts
+
+
+def get_source_registry() -> SourceRegistry:
+    """Общий для сервисов реестр: одна HTTP-сессия и общий семафор"""
+    global _registry
+    if _registry is None:
+        _registry = SourceRegistry()
+    return _registry
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Тесты пакетной генерации AI-гороскопов
+"""
+
+import asyncio
+import json
+
+from conftest import FakeGroq, config_override, make_service
+from horoscope_service import parse_batch
+
+SIGN = "♌ Лев"
+
+
+def _text(sign: str = "Лев") -> str:
+    return f"🔮 *ГОРОСКОП*\n*{sign}*\n⭐ *РЕЙТИНГ ДНЯ: 8/10*\n" + "Звезды благоволят вам." * 20
+
+
+def _reply(broken=()):
+    """Ответ модели: пакетный ответ портит элементы из broken"""
+
+    def reply(params):
+        if "response_format" not in params:
+            return _text()
+        prompt = params["messages"][1]["content"]
+        count = prompt.split("🔮 ВАРИАНТЫ:\n")[1].split("\n\n")[0].count("Знак:")
+        items = [
+            {"id": i, "text": "слишком коротко" if i in broken else _text()}
+            for i in range(1, count + 1)
+        ]
+        return json.dumps({"horoscopes": items}, ensure_ascii=False)
+
+    return reply
+
+
+def _users(*souls):
+    return [{"zodiac": SIGN, "matrix": {"additional": [0, soul]}} for soul in souls]
+
+
+def test_parse_batch():
+    """Проверяется каждый элемент: номер, повторы, длина, рейтинг и знак"""
+    expected = {1: "Лев", 2: "Лев", 3: "Лев", 4: "Дева"}
+    content = json.dumps({"horoscopes": [
+        {"id": 1, "text": _text()},
+        {"id": 2, "text": "коротко"},
+        {"id": 3, "text": _text()},
+        {"id": 3, "text": _text()},
+        {"id": 4, "text": _text("Лев")},
+        {"id": 9, "text": _text()},
+        "не объект",
+    ]}, ensure_ascii=False)
+    assert parse_batch(content, expected) == {1: _text()}
+    assert parse_batch("не JSON", expected) == {}
+    assert parse_batch('["horoscopes"]', expected) == {}
+
+
+def test_batch_with_fallback():
+    """Одна пачка на 4 варианта и отдельный запрос только для испорченного"""
+    with config_override(LLM_STRUCTURED=False):
+        _batch_with_fallback()
+
+
+def _batch_with_fallback():
+    groq = FakeGroq(_reply(broken={2}), delay=0.01)
+    service = make_service(groq)
+
+    async def run():
+        users = _users(1, 2, 3, 4)
+        texts, single = await asyncio.gather(
+            service.get_daily_horoscopes(users),
+            service.get_daily_horoscope(users[0]),
+        )
+        again = await service.get_daily_horoscopes(users)
+        return texts, single, again
+
+    texts, single, again = asyncio.run(run())
+    assert texts == [_text()] * 4 and single == _text() and again == texts
+    assert len(groq.requests) == 2
+    assert "response_format" in groq.requests[0] and "response_format" not in groq.requests[1]
+    assert "число души: 4" in groq.requests[0]["messages"][1]["content"]
+
+    today = service.stats()["llm_today"]
+    assert today["calls"] == 2 and today["batch_calls"] == 1
+    assert today["batched_items"] == 3 and today["fallback_items"] == 1
+    assert today["calls_saved"] == 2 and today["tokens_saved"] > 0
+
+    # Пачка на 4 варианта — один вызов модели, плюс отдельный для испорченного
+    calls = service.stats()["llm_calls"]
+    assert sorted(calls.values()) == [1, 1] and sum(calls.values()) == len(groq.requests)
+    assert any(key.count(" + ") == 3 for key in calls)
+
+
+if __name__ == "__main__":
+    test_parse_batch()
+    test_batch_with_fallback()
+    print("✅ Пакетная генерация гороскопов работает корректно")
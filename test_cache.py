@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Тесты кешей общего назначения
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from cache import DailyCache, LRUCache, SingleFlight
+from conftest import FakeClock
+
+
+def test_lru_cache():
+    """Вытеснение самых давно использованных записей и счетчики"""
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["evictions"] == 1
+
+
+def test_daily_cache_rollover():
+    """Записи живут до конца дня, при смене дня удаляются разом"""
+    clock = FakeClock(datetime(2024, 3, 10, 23, 50))
+    cache = DailyCache(100, clock=clock)
+    for i in range(10):
+        cache.set(f"sign{i}_2024-03-10", i)
+    assert cache.get("sign3_2024-03-10") == 3
+    assert len(cache) == 10
+
+    clock.now += timedelta(minutes=15)
+    assert cache.get("sign3_2024-03-10") is None
+    assert len(cache) == 0
+    assert cache.stats()["expired"] == 10
+
+    # Память не растет при многих днях работы
+    for day in range(30):
+        clock.now += timedelta(days=1)
+        for i in range(12):
+            cache.set(f"sign{i}_{clock.now.date()}", i)
+    assert len(cache) == 12
+
+
+def test_daily_cache_bounds():
+    """Ограничение по размеру и по ttl"""
+    clock = FakeClock(datetime(2024, 3, 10, 12, 0))
+    cache = DailyCache(3, ttl=60, clock=clock)
+    for i in range(5):
+        cache.set(i, str(i))
+    assert len(cache) == 3
+    assert cache.stats()["evictions"] == 2
+    assert cache.get(4) == "4"
+    assert 4 in cache
+
+    clock.now += timedelta(seconds=61)
+    assert 4 not in cache
+    assert cache.get(4) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_single_flight():
+    """Одновременные вызовы с одним ключом ждут одно вычисление"""
+    flights = SingleFlight()
+    calls = []
+
+    async def compute(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"result {key}"
+
+    async def failing():
+        calls.append("fail")
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(flights.run("leo", lambda: compute("leo")) for _ in range(20)),
+            flights.run("aries", lambda: compute("aries")),
+        )
+        assert results[:20] == ["result leo"] * 20
+        assert results[20] == "result aries"
+        assert calls == ["leo", "aries"]
+        assert len(flights) == 0
+
+        # Исключение получают все ожидающие, ключ освобождается
+        errors = await asyncio.gather(
+            *(flights.run("bad", failing) for _ in range(5)), return_exceptions=True
+        )
+        assert all(isinstance(e, RuntimeError) for e in errors)
+        assert calls.count("fail") == 1
+        assert "bad" not in flights
+
+        # Отмена одного ожидающего не отменяет вычисление для остальных
+        first = asyncio.ensure_future(flights.run("leo", lambda: compute("leo")))
+        second = asyncio.ensure_future(flights.run("leo", lambda: compute("leo")))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "result leo"
+
+    asyncio.run(scenario())
+    stats = flights.stats()
+    assert stats["flights"] == 4 and stats["coalesced"] == 24
+
+
+if __name__ == "__main__":
+    test_lru_cache()
+    test_daily_cache_rollover()
+    test_daily_cache_bounds()
+    test_single_flight()
+    print("✅ Кеши работают корректно")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Тесты отключения источников и адаптивных таймаутов
+"""
+
+import asyncio
+
+from aiohttp import web
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from config import Config
+from conftest import FakeClock
+from http_fetcher import HttpFetcher
+
+
+def test_breaker_states():
+    """Отключение после ошибок подряд, охлаждение и пробный запрос"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("mail", failure_threshold=3, cooldown=60, clock=clock)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    clock.now += 61
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Пока пробный запрос не завершен, остальные пропускаются
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now += 61
+    assert breaker.allow()
+    breaker.record_success(0.2)
+    assert breaker.state == CLOSED and breaker.failures == 0
+    assert breaker.stats()["skipped"] == 2
+
+
+def test_adaptive_timeout():
+    """Таймаут по p95 с запасом, в пределах [SOURCE_TIMEOUT_MIN, limit]"""
+    breaker = CircuitBreaker("rambler")
+    assert breaker.timeout(10) == 10
+    for latency in [0.3] * 19 + [1.0]:
+        breaker.record_success(latency)
+    assert breaker.p95() == 0.3
+    assert breaker.timeout(10) == max(Config.SOURCE_TIMEOUT_MIN, 0.3 * Config.SOURCE_TIMEOUT_FACTOR)
+    for _ in range(50):
+        breaker.record_success(5.0)
+    assert breaker.timeout(10) == 10
+
+
+def test_fetcher_skips_dead_source():
+    """После порога ошибок запросы к источнику не отправляются"""
+    hits = []
+
+    async def broken(request):
+        hits.append(request.path)
+        return web.Response(status=503)
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/{sign}/", broken)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        fetcher = HttpFetcher()
+        try:
+            for i in range(Config.SOURCE_FAILURE_THRESHOLD + 3):
+                assert await fetcher.fetch(f"http://127.0.0.1:{port}/{i}/") is None
+        finally:
+            await fetcher.close()
+            await runner.cleanup()
+        source = fetcher.stats()["sources"][f"127.0.0.1:{port}"]
+        assert source["state"] == OPEN and source["skipped"] == 3
+
+    asyncio.run(scenario())
+    assert len(hits) == Config.SOURCE_FAILURE_THRESHOLD
+
+
+if __name__ == "__main__":
+    test_breaker_states()
+    test_adaptive_timeout()
+    test_fetcher_skips_dead_source()
+    print("✅ Отключение источников работает корректно")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Тесты общего дедлайна парсинга источников
+"""
+
+import asyncio
+import time
+
+from deadline import gather_with_deadline
+
+
+async def _source(text, delay, log=None):
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        if log is not None:
+            log.append(f"cancelled {text}")
+        raise
+    return text
+
+
+async def _failing():
+    raise RuntimeError("источник недоступен")
+
+
+def test_partial_results():
+    """Возвращается то, что готово к дедлайну; опоздавшие отменяются"""
+    async def scenario():
+        log = []
+        started = time.perf_counter()
+        results = await gather_with_deadline(
+            {
+                "slow": _source("медленный", 5, log),
+                "fast": _source("быстрый", 0.01),
+                "empty": _source("", 0.01),
+                "broken": _failing(),
+            },
+            deadline=0.1,
+        )
+        elapsed = time.perf_counter() - started
+        assert results == {"fast": "быстрый"}
+        assert elapsed < 0.5
+        assert log == ["cancelled медленный"]
+
+    asyncio.run(scenario())
+
+
+def test_late_results_merged():
+    """С on_late опоздавшие дорабатывают в фоне и отдают результат"""
+    async def scenario():
+        late = {}
+        results = await gather_with_deadline(
+            {"Mail.ru": _source("первый", 0.01), "Rambler": _source("второй", 0.15)},
+            deadline=0.05,
+            on_late=lambda name, text: late.__setitem__(name, text),
+        )
+        assert results == {"Mail.ru": "первый"}
+        assert late == {}
+        await asyncio.sleep(0.2)
+        assert late == {"Rambler": "второй"}
+
+        # Результаты идут в порядке источников, а не завершения
+        results = await gather_with_deadline(
+            {"a": _source("a", 0.03), "b": _source("b", 0.01)}, deadline=1
+        )
+        assert list(results) == ["a", "b"]
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_partial_results()
+    test_late_results_merged()
+    print("✅ Дедлайн парсинга работает корректно")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Тесты кеша гороскопов на диске
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+
+from conftest import FakeClock
+from disk_cache import DiskCache
+
+
+def test_disk_cache_survives_restart():
+    """Записанное до перезапуска читается новым экземпляром"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "horoscopes.sqlite3")
+        clock = FakeClock(datetime(2024, 3, 10, 12, 0))
+
+        async def write():
+            cache = DiskCache(path, clock)
+            assert await cache.get("basic", "♌ Лев", "2024-03-10") is None
+            cache.put("basic", "♌ Лев", "2024-03-10", "гороскоп Льва")
+            cache.put("premium", "♌ Лев", "2024-03-10", "премиум Льва")
+            cache.put("basic", "♌ Лев", "2024-03-10", "для числа души 7", personalization="7")
+            await cache.flush()
+            assert cache.stats()["writes"] == 3
+            cache.close()
+
+        async def read():
+            cache = DiskCache(path, clock)
+            assert await cache.get("basic", "♌ Лев", "2024-03-10") == "гороскоп Льва"
+            assert await cache.get("premium", "♌ Лев", "2024-03-10") == "премиум Льва"
+            assert await cache.get("basic", "♌ Лев", "2024-03-10", "7") == "для числа души 7"
+            assert await cache.get("basic", "♈ Овен", "2024-03-10") is None
+            stats = cache.stats()
+            assert stats["hits"] == 3 and stats["misses"] == 1
+            cache.close()
+
+        asyncio.run(write())
+        asyncio.run(read())
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+
+def test_disk_cache_compaction():
+    """После смены дня записи за прошлые дни удаляются"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "horoscopes.sqlite3")
+        clock = FakeClock(datetime(2024, 3, 10, 23, 59))
+
+        async def scenario():
+            cache = DiskCache(path, clock)
+            cache.put("basic", "♌ Лев", "2024-03-10", "вчерашний")
+            await cache.flush()
+
+            clock.now += timedelta(minutes=2)
+            cache.put("basic", "♌ Лев", "2024-03-11", "сегодняшний")
+            await cache.flush()
+            assert await cache.get("basic", "♌ Лев", "2024-03-10") is None
+            assert await cache.get("basic", "♌ Лев", "2024-03-11") == "сегодняшний"
+            cache.close()
+
+        asyncio.run(scenario())
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM horoscopes").fetchone()[0] == 1
+        conn.close()
+
+
+def test_generations_kept_for_reuse_days():
+    """AI-гороскопы по хешу источников хранятся reuse_days дней"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "horoscopes.sqlite3")
+        clock = FakeClock(datetime(2024, 3, 10, 12, 0))
+
+        async def scenario():
+            cache = DiskCache(path, clock, reuse_days=2)
+            cache.put_generation("a" * 64, "2024-03-10", "гороскоп 10.03.2024")
+            await cache.flush()
+
+            clock.now += timedelta(days=2)
+            assert await cache.get_generation("a" * 64) == ("2024-03-10", "гороскоп 10.03.2024")
+            clock.now += timedelta(days=1)
+            assert await cache.get_generation("a" * 64) is None
+            cache.close()
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_disk_cache_survives_restart()
+    test_disk_cache_compaction()
+    test_generations_kept_for_reuse_days()
+    print("✅ Кеш гороскопов на диске работает корректно")
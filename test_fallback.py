@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Тесты гороскопов без AI: детерминированность и готовые тексты на день
+"""
+
+import random
+from datetime import date
+
+from horoscope_fallback import daily_fallbacks, fallback_horoscope, render_basic, render_fallback
+from horoscope_service import HoroscopeService
+from message_chunks import find_markdown_error
+
+DAY = date(2024, 3, 10)
+
+
+def test_deterministic():
+    """Гороскоп знака зависит только от знака и даты, глобальный random не трогается"""
+    random.seed(42)
+    state = random.getstate()
+    text = render_fallback("Лев", DAY)
+    assert random.getstate() == state
+    assert text == render_fallback("Лев", DAY)
+    assert "🔮 *ГОРОСКОП НА 10.03.2024*\n*Лев*" in text and find_markdown_error(text) is None
+    assert text != render_fallback("Лев", date(2024, 3, 11))
+    assert render_fallback("Дева", DAY) != render_fallback("Лев", DAY).replace("Лев", "Дева")
+
+    basic = render_basic("Лев", DAY, {"Mail.ru": "Звезды благоволят вам."})
+    assert basic == render_basic("Лев", DAY, {"Mail.ru": "Звезды благоволят вам."})
+    assert "✨ *Mail.ru:*\nЗвезды благоволят вам." in basic
+    assert random.getstate() == state
+
+
+def test_daily_fallbacks():
+    """Резервные гороскопы всех знаков строятся один раз за день"""
+    texts = daily_fallbacks(DAY)
+    assert len(texts) == 12 and texts["Рыбы"] == render_fallback("Рыбы", DAY)
+    assert daily_fallbacks(DAY) is texts
+    assert fallback_horoscope("Лев", DAY) is texts["Лев"]
+    assert "*Змееносец*" in fallback_horoscope("Змееносец", DAY)
+
+
+def test_service_wrappers():
+    """Сервис отдает те же тексты, повторный вызов за день совпадает"""
+    service = HoroscopeService()
+    assert service._generate_fallback_horoscope("♌ Лев") == service._generate_fallback_horoscope("Лев")
+    assert service._generate_basic_horoscope("♌ Лев", {}) == service._generate_fallback_horoscope("♌ Лев")
+    sources = {"Mail.ru": "Звезды благоволят вам."}
+    assert service._generate_basic_horoscope("♌ Лев", sources) == service._generate_basic_horoscope("♌ Лев", sources)
+    assert service._get_zodiac_traits("Лев")["planet"] == "Солнце"
+
+
+if __name__ == "__main__":
+    test_deterministic()
+    test_daily_fallbacks()
+    test_service_wrappers()
+    print("✅ Гороскопы без AI работают корректно")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Тесты подстраховки медленной модели на локальной имитации Groq
+"""
+
+import asyncio
+import time
+
+from groq import AsyncGroq
+
+from config import Config
+from conftest import config_override, make_service
+from fake_groq import FakeGroqServer, fixed, horoscope_reply
+from llm_scheduler import LLMScheduler
+
+PRIMARY = Config.GROQ_MODEL
+HEDGE = Config.LLM_HEDGE_MODEL
+
+
+async def _generate(server: FakeGroqServer, hedge_after: float, on_progress=None, concurrency=4, background=None):
+    """
+    Гороскоп через настоящий клиент groq; возвращает текст, время и счетчики.
+    background(service) запускается параллельно и раньше генерации.
+    """
+    base_url = await server.start()
+    service = make_service(
+        AsyncGroq(api_key="test", base_url=base_url, max_retries=0),
+        llm=LLMScheduler(rpm=0, tpm=0, concurrency=concurrency),
+    )
+    side = None
+    try:
+        if background is not None:
+            side = asyncio.ensure_future(background(service))
+            await asyncio.sleep(0)
+        started = time.perf_counter()
+        with config_override(LLM_HEDGE_AFTER=hedge_after):
+            text = await service.get_daily_horoscope({"zodiac": "♌ Лев"}, on_progress)
+        elapsed = time.perf_counter() - started
+        if side is not None:
+            await side
+        await asyncio.sleep(0.05)
+        return text, elapsed, service.stats()["llm_today"]
+    finally:
+        await service.groq_client.close()
+        await server.close()
+
+
+def test_fast_primary():
+    """Основная модель успела — запасная не вызывается"""
+    server = FakeGroqServer({PRIMARY: fixed(0.02), HEDGE: fixed(0.02)})
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.5))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text
+    assert server.started == {PRIMARY: 1} and today["hedged"] == 0
+
+
+def test_hedge_wins():
+    """Основная модель медленная — отвечает запасная, основной запрос отменяется"""
+    server = FakeGroqServer({PRIMARY: fixed(2.0), HEDGE: fixed(0.05)})
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.1))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text
+    assert elapsed < 1.0
+    assert server.completed == {HEDGE: 1} and server.cancelled == {PRIMARY: 1}
+    assert today["hedged"] == 1 and today["hedge_wins"] == 1
+
+
+def test_hedge_streaming():
+    """Потоковый вывод идет от модели, которая начала отвечать первой"""
+    server = FakeGroqServer({PRIMARY: fixed(2.0), HEDGE: fixed(0.05)}, chunks=4)
+    progress = []
+
+    async def on_progress(text):
+        progress.append(text)
+
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.1, on_progress=on_progress))
+    assert elapsed < 1.0 and progress and progress[-1] == text
+    assert "Звезды советуют" in text and server.rejected == {}
+    assert today["hedge_wins"] == 1
+
+
+def test_invalid_primary():
+    """Ответ основной модели не прошел схему — сразу используется запасная"""
+    server = FakeGroqServer(
+        {PRIMARY: fixed(0.02), HEDGE: fixed(0.02)},
+        reply=lambda model: "не JSON" if model == PRIMARY else horoscope_reply(model),
+    )
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=1.0))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text and elapsed < 0.5
+    assert today["hedged"] == 1 and today["hedge_wins"] == 1
+
+
+def test_queue_wait_not_counted():
+    """Ожидание места в планировщике не запускает подстраховку"""
+    server = FakeGroqServer({PRIMARY: fixed(0.05), HEDGE: fixed(0.01)})
+
+    async def busy(service):
+        async with service.llm.slot(0):
+            await asyncio.sleep(0.4)
+
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.1, concurrency=1, background=busy))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text and elapsed > 0.4
+    assert server.started == {PRIMARY: 1} and today["hedged"] == 0
+
+
+def test_no_hedge_while_paused():
+    """После 429 планировщик на паузе — запрос не дублируется, ждем основную модель"""
+    server = FakeGroqServer({PRIMARY: fixed(0.4), HEDGE: fixed(0.01)})
+
+    async def rate_limited(service):
+        await asyncio.sleep(0.05)
+        service.llm.backoff(1.0)
+
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.1, background=rate_limited))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text
+    assert server.started == {PRIMARY: 1} and today["hedged"] == 0
+
+
+def test_streaming_first_token():
+    """Поток, начавшийся вовремя, не дублируется, даже если читается дольше порога"""
+    server = FakeGroqServer({PRIMARY: fixed(0.02), HEDGE: fixed(0.01)}, chunks=8, chunk_interval=0.05)
+    progress = []
+
+    async def on_progress(text):
+        progress.append(text)
+
+    text, elapsed, today = asyncio.run(_generate(server, hedge_after=0.1, on_progress=on_progress))
+    assert elapsed > 0.3 and progress[-1] == text
+    assert server.started == {PRIMARY: 1} and today["hedged"] == 0
+
+
+if __name__ == "__main__":
+    test_fast_primary()
+    test_hedge_wins()
+    test_hedge_streaming()
+    test_invalid_primary()
+    test_queue_wait_not_counted()
+    test_no_hedge_while_paused()
+    test_streaming_first_token()
+    print("✅ Подстраховка медленной модели работает корректно")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Тесты структурированного AI-гороскопа
+"""
+
+import json
+
+from horoscope_render import make_bar, parse_horoscope, parse_partial, render_horoscope, validate_horoscope
+from horoscope_service import parse_batch
+from message_chunks import find_markdown_error
+
+HOROSCOPE = {
+    "rating": 8,
+    "energy": {"love": 85, "career": 70, "money": 60, "health": 90, "luck": 75},
+    "astrologers": "Звезды советуют не откладывать важные разговоры.",
+    "love": "День для искренности и теплых слов.",
+    "career": "Смелые решения окупятся уже к вечеру.",
+    "health": "Больше движения и свежего воздуха.",
+    "advice": "Доверьтесь интуиции.",
+    "warning": "Не спешите с крупными тратами.",
+    "soul": "Число 7 усиливает внутреннее чутье.",
+}
+
+
+def test_validate():
+    """Ответ проверяется по схеме: все поля, типы и диапазоны"""
+    assert validate_horoscope(HOROSCOPE) == HOROSCOPE
+    assert validate_horoscope({**HOROSCOPE, "rating": 8.4})["rating"] == 8
+    assert validate_horoscope({**HOROSCOPE, "rating": 11}) is None
+    assert validate_horoscope({**HOROSCOPE, "rating": True}) is None
+    assert validate_horoscope({**HOROSCOPE, "energy": {**HOROSCOPE["energy"], "luck": "75"}}) is None
+    assert validate_horoscope({key: value for key, value in HOROSCOPE.items() if key != "warning"}) is None
+    assert validate_horoscope({**HOROSCOPE, "love": "   "}) is None
+    assert validate_horoscope({**HOROSCOPE, "love": "а" * 2000}) is None
+    assert parse_horoscope("не JSON") is None
+    assert parse_horoscope("[1, 2]") is None
+
+
+def test_render():
+    """Рамки и бары рисует бот, разметка корректна"""
+    text = render_horoscope(HOROSCOPE, "Лев", "10.03.2024", 7)
+    assert "🔮 *ГОРОСКОП на 10.03.2024*\n*Лев*" in text
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10* ⭐⭐⭐⭐⭐" in text
+    assert f"❤️ Любовь:     {make_bar(85)} 85%" in text
+    assert f"🎯 Удача:      {make_bar(75)} 75%" in text
+    assert "💼 *Карьера и финансы:* 70%\nСмелые решения окупятся уже к вечеру." in text
+    assert "🔢 *Влияние числа души (7):*\nЧисло 7 усиливает внутреннее чутье." in text
+    assert find_markdown_error(text) is None
+    assert make_bar(85) == "████████░░"
+
+
+def test_partial():
+    """Незаконченный JSON: открытые строки и скобки закрываются"""
+    content = json.dumps(HOROSCOPE, ensure_ascii=False)
+    cut = content.index("День для") + 4
+    data = parse_partial(content[:cut])
+    assert data["love"] == "День" and data["energy"] == HOROSCOPE["energy"]
+    assert parse_partial('{"rating": 8, "ene') is None
+    assert parse_partial('{"rating": 8, "energy": {"love": 8') == {"rating": 8, "energy": {"love": 8}}
+
+    text = render_horoscope(data, "Лев", "10.03.2024", 7)
+    assert "РЕЙТИНГ ДНЯ" in text and "ЭНЕРГЕТИКА" in text and "Совет дня" not in text
+    assert render_horoscope({}, "Лев", "10.03.2024", 7).endswith("━")
+
+
+def test_structured_batch():
+    """В пакете каждый вариант проверяется по схеме отдельно"""
+    content = json.dumps({"horoscopes": [
+        {"id": 1, "horoscope": HOROSCOPE},
+        {"id": 2, "horoscope": {**HOROSCOPE, "rating": 0}},
+        {"id": 3, "text": "гороскоп без данных"},
+    ]}, ensure_ascii=False)
+    valid = parse_batch(content, {1: "Лев", 2: "Лев", 3: "Дева"}, lambda i, data: f"{i}:{data['rating']}")
+    assert valid == {1: "1:8"}
+
+
+if __name__ == "__main__":
+    test_validate()
+    test_render()
+    test_partial()
+    test_structured_batch()
+    print("✅ Структурированный гороскоп работает корректно")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Тесты извлечения текста гороскопа из страниц источников
+"""
+
+import asyncio
+
+import html_extract
+from html_extract import extract_mail_ru, extract_rambler, run_parser
+
+LONG = "Сегодня звезды благоприятны для новых начинаний и смелых решений."
+
+
+def test_mail_ru():
+    """Приоритет селекторов и текст абзацев как у get_text(strip=True)"""
+    page = (
+        "<html><head><script>var s = '<div class=\"article__item\"><p>нет</p></div>';</script></head><body>"
+        "<article><p>Запасной блок</p></article>"
+        "<div class='content article__item'><p> Первый <b>абзац</b>, &laquo;цитата&raquo; </p>"
+        "<div><p>Второй<br>абзац</p></div><!-- комментарий --><p>Третий</p></div>"
+        "</body></html>"
+    )
+    assert extract_mail_ru(page) == "Первыйабзац, «цитата» Второйабзац Третий"
+
+    # Основного блока нет — берем article, затем data-qa="Article"
+    assert extract_mail_ru("<article><p>Из статьи</p></article>") == "Из статьи"
+    assert extract_mail_ru("<div class='article__item'>без абзацев</div><div data-qa='Article'><p>Запас</p></div>") == "Запас"
+    assert extract_mail_ru("<div><p>Ничего подходящего</p></div>") is None
+
+
+def test_rambler():
+    """Первый абзац длиннее 50 символов, иначе следующий селектор"""
+    page = f"<div data-mt-part='article'><div><p>{LONG}</p><p>Второй</p></div></div><article><p>{LONG}!</p></article>"
+    assert extract_rambler(page) == LONG
+
+    short = f"<div data-mt-part='article'><p>Коротко</p></div><article><p>{LONG}!</p></article>"
+    assert extract_rambler(short) == LONG + "!"
+    assert extract_rambler("<div data-mt-part='article'><p>Коротко</p></div>") is None
+
+
+def test_chunked_feed():
+    """Результат не зависит от того, где страница разрезана на порции"""
+    page = "<html><body>" + "<div>шум</div>" * 200 + f"<div class='article__item'><p>{LONG} &amp; еще</p></div></body></html>"
+    expected = extract_mail_ru(page)
+    size = html_extract.FEED_SIZE
+    try:
+        for feed_size in (1, 7, 100):
+            html_extract.FEED_SIZE = feed_size
+            assert extract_mail_ru(page) == expected
+    finally:
+        html_extract.FEED_SIZE = size
+    assert expected == f"{LONG} & еще"
+
+
+def test_run_parser():
+    """Разбор в пуле потоков возвращает тот же результат"""
+    page = f"<article><p>{LONG}</p></article>"
+    assert asyncio.run(run_parser(extract_rambler, page)) == LONG
+
+
+if __name__ == "__main__":
+    test_mail_ru()
+    test_rambler()
+    test_chunked_feed()
+    test_run_parser()
+    print("✅ Извлечение текста из страниц работает корректно")
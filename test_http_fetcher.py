@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Тесты HTTP-клиента источников: общая сессия, условные запросы и лимит тела ответа
+"""
+
+import asyncio
+
+from aiohttp import web
+
+from http_fetcher import HttpFetcher
+
+PAGE = "<article><p>Гороскоп на сегодня</p></article>"
+
+
+async def _serve(app: web.Application) -> tuple:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_session_lifecycle():
+    """Одна сессия и одно keep-alive соединение на все запросы; после close() сессия создается заново"""
+    peers = []
+
+    async def page(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/leo/", page)
+        runner, base = await _serve(app)
+        fetcher = HttpFetcher()
+        try:
+            await fetcher.start()
+            session = fetcher._session
+            assert session is not None and not session.closed
+            await fetcher.start()
+            assert fetcher._session is session
+
+            for _ in range(3):
+                assert await fetcher.fetch(f"{base}/leo/") == PAGE
+            assert fetcher._session is session
+
+            await fetcher.close()
+            assert session.closed and fetcher._session is None
+            await fetcher.close()
+
+            # Запрос после close() открывает новую сессию, а не падает
+            assert await fetcher.fetch(f"{base}/leo/") == PAGE
+            assert fetcher._session is not session and not fetcher._session.closed
+        finally:
+            await fetcher.close()
+            await runner.cleanup()
+        assert len(peers) == 4 and len(set(peers[:3])) == 1
+        assert fetcher.stats()["requests"] == 4
+
+    asyncio.run(scenario())
+
+
+def test_conditional_get():
+    """Повторный запрос условный, на 304 возвращается прежний разбор"""
+    requests = []
+
+    async def page(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=PAGE, content_type="text/html", headers={"ETag": '"v1"'})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/leo/", page)
+        runner, base = await _serve(app)
+        fetcher = HttpFetcher()
+        parsed = []
+
+        async def parse(html):
+            parsed.append(html)
+            return html.upper()
+
+        try:
+            first = await fetcher.fetch_parsed(f"{base}/leo/", parse)
+            second = await fetcher.fetch_parsed(f"{base}/leo/", parse)
+        finally:
+            await fetcher.close()
+            await runner.cleanup()
+        assert first == second == PAGE.upper()
+        assert parsed == [PAGE]
+        assert requests == [None, '"v1"']
+        assert fetcher.stats()["not_modified"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_body_cap():
+    """Тело ответа читается не дальше лимита"""
+    async def big(request):
+        return web.Response(text="x" * 200_000, content_type="text/html")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/big/", big)
+        runner, base = await _serve(app)
+        fetcher = HttpFetcher()
+        fetcher.max_body = 50_000
+        try:
+            html = await fetcher.fetch(f"{base}/big/")
+            missing = await fetcher.fetch(f"{base}/missing/")
+        finally:
+            await fetcher.close()
+            await runner.cleanup()
+        assert len(html) == 50_000
+        assert missing is None
+        assert fetcher.stats()["truncated"] == 1
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_session_lifecycle()
+    test_conditional_get()
+    test_body_cap()
+    print("✅ HTTP-клиент источников работает корректно")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Тесты планировщика запросов к Groq
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from conftest import FakeGroq, make_service
+from llm_scheduler import BACKGROUND, INTERACTIVE, LLMScheduler, TokenBucket, rate_limit_delay
+
+
+def test_token_bucket():
+    now = [0.0]
+    bucket = TokenBucket(60, clock=lambda: now[0])
+    assert bucket.wait_time(60) == 0
+    bucket.take(60)
+    assert bucket.wait_time(1) == 1.0
+    now[0] = 0.5
+    assert bucket.wait_time(1) == 0.5
+    # Запрос больше емкости ждет полного ведра, а не вечно
+    assert bucket.wait_time(1000) == 59.5
+    bucket.give(100)
+    assert bucket.level == 60
+    assert TokenBucket(0).wait_time(10 ** 6) == 0
+
+
+def test_priority_and_concurrency():
+    """Запросы пользователей обгоняют фоновые, параллельность ограничена"""
+    scheduler = LLMScheduler(rpm=0, tpm=0, concurrency=2)
+    order = []
+    active = [0, 0]
+
+    async def job(name, priority):
+        async with scheduler.slot(100, priority):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            order.append(name)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def run():
+        background = [asyncio.create_task(job(f"bg{i}", BACKGROUND)) for i in range(4)]
+        await asyncio.sleep(0)
+        interactive = [asyncio.create_task(job(f"user{i}", INTERACTIVE)) for i in range(2)]
+        await asyncio.gather(*background, *interactive)
+
+    asyncio.run(run())
+    assert active[1] == 2
+    assert order[:2] == ["bg0", "bg1"] and order[2:4] == ["user0", "user1"]
+
+    stats = scheduler.stats()
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+    assert stats["lanes"]["interactive"]["granted"] == 2 and stats["lanes"]["background"]["granted"] == 4
+    assert stats["lanes"]["background"]["wait_max"] > 0
+
+
+def test_rate_limits():
+    """Пустое ведро и ответ 429 задерживают выдачу мест"""
+    scheduler = LLMScheduler(rpm=600, tpm=0, concurrency=4)
+    scheduler.requests.level = 0
+
+    async def wait_slot():
+        started = time.monotonic()
+        async with scheduler.slot(1):
+            return time.monotonic() - started
+
+    assert 0.08 < asyncio.run(wait_slot()) < 0.5
+
+    scheduler.requests.level = 600
+    scheduler.backoff(0.1)
+    assert 0.08 < asyncio.run(wait_slot()) < 0.5
+    assert scheduler.stats()["rate_limited"] == 1
+
+    error = SimpleNamespace(status_code=429, response=SimpleNamespace(headers={"retry-after": "7"}))
+    assert rate_limit_delay(error) == 7.0
+    assert rate_limit_delay(RuntimeError("500")) is None
+
+
+def test_cancelled_waiter():
+    """Отмененный в очереди запрос не занимает место"""
+    scheduler = LLMScheduler(rpm=0, tpm=0, concurrency=1)
+
+    async def run():
+        async with scheduler.slot(1):
+            waiter = asyncio.create_task(scheduler.slot(1).__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+        async with scheduler.slot(1):
+            return scheduler.stats()
+
+    stats = asyncio.run(run())
+    assert stats["active"] == 1 and stats["queue_depth"] == 0
+
+
+class RateLimitError(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after": "0.05"})
+
+
+def test_service_retries_after_429():
+    """Ответ 429 не превращается в базовый гороскоп: запрос повторяется после паузы"""
+    horoscope = {
+        "rating": 8,
+        "energy": {"love": 80, "career": 70, "money": 60, "health": 90, "luck": 75},
+        **{key: "Звезды благоволят вам." for key in ("astrologers", "love", "career", "health", "advice", "warning", "soul")},
+    }
+    replies = [RateLimitError("429"), json.dumps(horoscope, ensure_ascii=False)]
+
+    service = make_service(
+        FakeGroq(lambda params: replies.pop(0)),
+        llm=LLMScheduler(rpm=0, tpm=0, concurrency=1),
+    )
+    text = asyncio.run(service.get_daily_horoscope({"zodiac": "♍ Дева"}))
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text and "❤️ Любовь:     ████████░░ 80%" in text
+    stats = service.stats()
+    assert stats["llm_scheduler"]["rate_limited"] == 1
+    assert stats["llm_scheduler"]["lanes"]["interactive"]["granted"] == 2
+
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_priority_and_concurrency()
+    test_rate_limits()
+    test_cancelled_waiter()
+    test_service_retries_after_429()
+    print("✅ Планировщик запросов к Groq работает корректно")
@@ -3,6 +3,9 @@
 Тестовый скрипт для проверки корректности расчета матрицы
 """
 
+import copy
+import pickle
+
 from matrix_calculator import MatrixCalculator
 
 def test_matrix():
@@ -46,5 +49,176 @@ def test_matrix():
         interpretations = calc.get_interpretations(matrix1, "женский")
         print(interpretations[:500] + "...\n(показаны первые 500 символов)")
 
+def test_matrix_table():
+    """Таблица должна давать тот же результат, что и прямой расчет"""
+    from datetime import date, timedelta
+    
+    table_calc = MatrixCalculator()
+    direct_calc = MatrixCalculator(use_table=False)
+    assert table_calc.table is not None
+    
+    d = date(1900, 1, 1)
+    while d <= date(2100, 12, 31):
+        date_str = d.strftime("%d.%m.%Y")
+        assert table_calc.calculate_matrix(date_str) == direct_calc.calculate_matrix(date_str), date_str
+        d += timedelta(days=7)
+    
+    # Даты вне диапазона таблицы и без ведущих нулей считаются напрямую
+    for date_str in ("31.12.1899", "01.01.2101", "5.3.1992"):
+        assert table_calc.calculate_matrix(date_str) == direct_calc.calculate_matrix(date_str), date_str
+
+def test_matrix_table_batch_build():
+    """Векторизованная сборка таблицы дает тот же файл, что и поштучная"""
+    import os
+    import tempfile
+    from matrix_calculator import ALGORITHM_VERSION, _compute_for_date, compute_matrix_batch
+    from matrix_table import MatrixTable
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        single = MatrixTable(os.path.join(tmp, "single.bin"), ALGORITHM_VERSION, _compute_for_date)
+        batch = MatrixTable(os.path.join(tmp, "batch.bin"), ALGORITHM_VERSION, _compute_for_date, compute_matrix_batch)
+        single.build()
+        batch.build()
+        with open(single.path, "rb") as a, open(batch.path, "rb") as b:
+            assert a.read() == b.read()
+
+def test_matrix_batch():
+    """Пакетный расчет должен совпадать со скалярным"""
+    calc = MatrixCalculator(use_table=False)
+    dates = ["15.05.1992", "10.03.2005", "25.12.2021", "01.01.1900", "31.12.2100",
+             "09.10.1999", "29.09.1999", "5.3.1992", "00.01.1990", "xx.xx.xxxx",
+             # Без ведущих нулей и с нулевым днем после 2000 года скалярный расчет работает
+             "1.1.1990", "01.1.2005", "00.01.2005", "0.1.2005", "1.1.90", "01.01.20050",
+             "1.1", "1..1990", " 1.1.1990", "-1.1.1990"]
+    
+    batch = calc.calculate_matrix_batch(dates)
+    assert len(batch) == len(dates)
+    assert [row["valid"] for row in batch[-10:]] == [True] * 6 + [False] * 4
+    
+    for date_str, row in zip(dates, batch):
+        matrix = calc.calculate_matrix(date_str)
+        if matrix is None:
+            assert not row["valid"], date_str
+            continue
+        
+        assert row["valid"], date_str
+        assert bytes(row["counts"]) == matrix.counts, date_str
+        assert tuple(row["additional"][:row["n_additional"]]) == matrix.additional, date_str
+
+def test_matrix_result():
+    """Компактный результат: счетчики, строки ячеек и совместимость со словарем"""
+    calc = MatrixCalculator()
+    matrix = calc.calculate_matrix("25.12.2021")
+    
+    assert matrix.counts == bytes(matrix.full_array.count(i) for i in range(1, 10))
+    assert matrix.full_array[-1] == 9
+    assert matrix.soul_number == matrix.additional[1]
+    assert matrix.family_number == matrix.additional[-1]
+    for i in range(1, 10):
+        count = matrix.count(i)
+        assert matrix.cell(i) == (' '.join([str(i)] * count) if count else "—")
+        assert matrix[str(i)] == matrix.cell(i)
+    assert matrix.get("additional") == matrix.additional
+    assert matrix.get("zodiac") is None
+    
+    try:
+        matrix.year = 1990
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("MatrixResult должен быть неизменяемым")
+    
+    # Результат сохраняется и копируется (например, вместе с данными пользователя)
+    restored = pickle.loads(pickle.dumps(matrix))
+    assert restored == matrix and restored.cell(9) == matrix.cell(9)
+    assert copy.deepcopy(matrix) == matrix and copy.copy(matrix) == matrix
+
+def test_interpretation_cache():
+    """Одинаковые сигнатуры матриц берутся из кеша без повторной сборки"""
+    calc = MatrixCalculator()
+    first = calc.calculate_matrix("15.05.1992")
+    # Та же цифровая сигнатура: переставлены цифры месяца
+    same_signature = calc.calculate_matrix("15.50.1992")
+    
+    rendered = calc.render_interpretations(first, "женский", "header\n")
+    assert rendered.text == "header\n" + calc.get_interpretations(first, "женский")
+    assert "".join(c.text for c in rendered.chunks).replace("\n", "") == rendered.text.replace("\n", "")
+    assert calc.interp_cache.stats()["misses"] == 1
+    
+    assert calc.render_interpretations(same_signature, "женский", "header\n") is rendered
+    assert calc.interp_cache.stats()["hits"] == 1
+    
+    calc.render_interpretations(first, "мужской", "header\n")
+    assert calc.interp_cache.stats()["misses"] == 2
+
+def test_interpretation_store():
+    """Хранилище отдает исходные тексты и общее для всех"""
+    import interpretations_data
+    from interpretations import Interpretations, get_store
+    
+    store = get_store()
+    assert dict(store.matrix) == interpretations_data.MATRIX_DATA
+    assert dict(store.tasks) == interpretations_data.TASKS_DATA
+    assert Interpretations().matrix_data is MatrixCalculator().interp.matrix_data
+
+
+def test_interpretation_resolution():
+    """Таблица (цифра, количество, пол) следует единым правилам resolve_matrix_key"""
+    import interpretations_data
+    from interpretations import interpretations, resolve_matrix_key
+    
+    data = interpretations_data.MATRIX_DATA
+    for digit in range(1, 10):
+        for count in range(0, 12):
+            key = resolve_matrix_key(digit, count, data)
+            for gender, variant in (("женский", "women"), ("мужской", "men")):
+                expected = None
+                if key is not None:
+                    value = data[key]
+                    expected = value[variant] if isinstance(value, dict) else value
+                assert interpretations.matrix_text(digit, count, gender) == expected, (digit, count, gender)
+                assert interpretations.get_matrix_value(digit, count, variant) == (expected or "")
+    
+    # Больше пяти цифр: берем все кроме первых пяти
+    assert resolve_matrix_key(1, 7, data) == "11"
+    assert resolve_matrix_key(2, 0, data) == "20"
+
+
+def test_missing_gender_text():
+    """Нет текста для пола: в сообщении бота ячейки нет, get_matrix_value отдает женский текст"""
+    import interpretations as module
+    
+    data = {"1": {"women": "для женщин"}, "11": {"men": "для мужчин"}, "111": "общий"}
+    store = module.InterpretationStore(data, {})
+    assert store.matrix_text(1, 1, "мужской") is None
+    assert store.matrix_text(1, 1, "женский") == "для женщин"
+    assert store.matrix_text(1, 2, "женский") is None
+    assert store.matrix_text(1, 3, "мужской") == store.matrix_text(1, 3, "женский") == "общий"
+    
+    saved, module._store = module._store, store
+    try:
+        interp = module.Interpretations()
+        assert interp.get_matrix_value(1, 1, "men") == "для женщин"
+        assert interp.get_matrix_value(1, 2, "women") == ""
+        assert interp.get_matrix_value(1, 2, "men") == "для мужчин"
+        
+        calc = MatrixCalculator(use_table=False)
+        calc.interp = interp
+        # Шесть единиц — текст ключа «1», который есть только для женщин
+        matrix = calc.calculate_matrix("10.10.1990")
+        assert matrix.count(1) == 6
+        assert "*Цифра 1*" in calc.get_interpretations(matrix, "женский")
+        assert "*Цифра 1*" not in calc.get_interpretations(matrix, "мужской")
+    finally:
+        module._store = saved
+
 if __name__ == "__main__":
     test_matrix()
+    test_matrix_table()
+    test_matrix_table_batch_build()
+    test_matrix_batch()
+    test_matrix_result()
+    test_interpretation_cache()
+    test_interpretation_store()
+    test_interpretation_resolution()
+    test_missing_gender_text()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Тесты разбивки длинных сообщений для Telegram
+"""
+
+import asyncio
+
+from telegram.error import BadRequest
+
+from main import NumerologyBot
+from matrix_calculator import MatrixCalculator
+from message_chunks import MAX_MESSAGE_LENGTH, Chunk, _tg_len, find_markdown_error, split_message
+
+
+def _unescape(text: str) -> str:
+    for ch in "_*`[":
+        text = text.replace("\\" + ch, ch)
+    return text
+
+
+def test_markdown_validation():
+    assert find_markdown_error("*жирный* и _курсив_ и `код`") is None
+    assert find_markdown_error("```\nтаблица\n```") is None
+    assert find_markdown_error("[ссылка](https://example.com)") is None
+    assert find_markdown_error("snake_case") == 5
+    assert find_markdown_error("экранировано: snake\\_case") is None
+
+
+def test_split_message():
+    calc = MatrixCalculator()
+    matrix = calc.calculate_matrix("11.11.1911")
+    text = "*Заголовок*\n\n" + calc.get_interpretations(matrix, "женский") * 3 + "\n\nхвост_без_пары *жирный"
+    
+    chunks = split_message(text)
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert _tg_len(chunk.text) <= MAX_MESSAGE_LENGTH
+        assert chunk.parse_mode == "Markdown"
+        assert find_markdown_error(chunk.text) is None
+    
+    # Текст не теряется: совпадает с исходным с точностью до разделителей
+    joined = "".join(_unescape(chunk.text) for chunk in chunks)
+    assert joined.replace("\n", "").replace(" ", "") == text.replace("\n", "").replace(" ", "")
+    
+    # Один очень длинный абзац без переносов режется по словам
+    long_paragraph = "слово " * 2000
+    assert all(_tg_len(c.text) <= MAX_MESSAGE_LENGTH for c in split_message(long_paragraph))
+
+
+class FakeMessage:
+    """Сообщение, для которого Telegram отклоняет разметку текста с "сломано" """
+
+    def __init__(self):
+        self.replies = []
+
+    async def reply_text(self, text, parse_mode=None):
+        if parse_mode is not None and "сломано" in text:
+            raise BadRequest("Can't parse entities: can't find end of the entity")
+        self.replies.append((text, parse_mode))
+
+
+def test_send_chunks_fallback():
+    """Отклоненная часть уходит без разметки, следующие части не теряются"""
+    message = FakeMessage()
+    chunks = [Chunk("*раз*"), Chunk("*сломано"), Chunk("*три*")]
+    asyncio.run(NumerologyBot._send_chunks(None, message, chunks))
+    assert message.replies == [("*раз*", "Markdown"), ("*сломано", None), ("*три*", "Markdown")]
+
+
+if __name__ == "__main__":
+    test_markdown_validation()
+    test_split_message()
+    test_send_chunks_fallback()
+    print("✅ Разбивка сообщений работает корректно")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Тесты потокового вывода гороскопа в сообщение Telegram
+"""
+
+import asyncio
+
+from telegram.error import BadRequest
+
+from conftest import FakeGroq, config_override, make_service
+from message_chunks import find_markdown_error
+from message_stream import CURSOR, StreamingMessage
+
+
+class FakeMessage:
+    def __init__(self, reject_markdown=False):
+        self.reject_markdown = reject_markdown
+        self.edits = []
+        self.replies = []
+
+    async def edit_text(self, text, parse_mode=None):
+        if self.reject_markdown and parse_mode is not None:
+            raise BadRequest("Can't parse entities: can't find end of the entity")
+        self.edits.append((text, parse_mode))
+
+    async def reply_text(self, text, parse_mode=None):
+        self.replies.append((text, parse_mode))
+
+
+def test_throttled_edits():
+    """Частичный текст не чаще раза в интервал, финальный — с проверенной разметкой"""
+    now = [0.0]
+    message = FakeMessage()
+    stream = StreamingMessage(message, "*Заголовок*\n\n", interval=1.0, clock=lambda: now[0])
+
+    async def run():
+        for t, text in ((0.0, "*Раз"), (0.3, "*Раз два"), (0.6, "*Раз два три"), (1.1, "*Раз два три четыре")):
+            now[0] = t
+            await stream.update(text)
+            await asyncio.sleep(0)
+        await stream.finish("*Раз два три четыре* snake_case")
+
+    asyncio.run(run())
+    partial, final = message.edits[:-1], message.edits[-1]
+    assert [text for text, _ in partial] == [
+        "*Заголовок*\n\n\\*Раз" + CURSOR,
+        "*Заголовок*\n\n\\*Раз два три четыре" + CURSOR,
+    ]
+    assert final[1] == "Markdown" and find_markdown_error(final[0]) is None
+    assert final[0].startswith("*Заголовок*\n\n*Раз два три четыре*")
+    assert message.replies == []
+
+
+def test_long_final_text():
+    """Длинный гороскоп: первая часть заменяет статус, остальные — новыми сообщениями"""
+    message = FakeMessage()
+    asyncio.run(StreamingMessage(message).finish("Абзац гороскопа.\n\n" * 600))
+    assert len(message.edits) == 1 and len(message.replies) >= 1
+
+
+def test_rejected_final_edit():
+    """Отклоненная разметка финального текста: статус заменяется простым текстом, а не падает"""
+    message = FakeMessage(reject_markdown=True)
+    asyncio.run(StreamingMessage(message, "*Заголовок*\n\n").finish("*Гороскоп*"))
+    assert message.edits == [("*Заголовок*\n\n*Гороскоп*", None)]
+    assert message.replies == []
+
+
+def _stream_service(parts):
+    """Гороскоп с колбэком дважды: первый раз генерируется потоком, второй — из кеша"""
+    service = make_service(FakeGroq(lambda params: parts))
+    user = {"zodiac": "♌ Лев", "matrix": {"additional": [0, 5]}}
+    progress = []
+
+    async def on_progress(text):
+        progress.append(text)
+
+    async def run():
+        first = await service.get_daily_horoscope(user, on_progress)
+        second = await service.get_daily_horoscope(user, on_progress)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert len(service.groq_client.requests) == 1 and service.groq_client.requests[0]["stream"] is True
+    return first, progress
+
+
+def test_service_streaming():
+    """AI-ответ в Markdown читается потоком, повторный запрос — из кеша без колбэка"""
+    parts = ["⭐ *РЕЙТИНГ ДНЯ: 8/10*", "\nЗвезды ", "благоволят ", "вам."]
+    with config_override(LLM_STRUCTURED=False):
+        text, progress = _stream_service(parts)
+    assert text == "".join(parts)
+    assert progress == ["".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def test_structured_streaming():
+    """Незаконченный JSON показывается уже отрисованным: сначала рейтинг и бары"""
+    content = (
+        '{"rating": 8, "energy": {"love": 80, "career": 70, "money": 60, "health": 90, "luck": 75}, '
+        '"astrologers": "Звезды на вашей стороне.", "love": "Время для искренности.", '
+        '"career": "Смелые решения окупятся.", "health": "Больше прогулок.", '
+        '"advice": "Доверьтесь интуиции.", "warning": "Не спешите с тратами.", "soul": "Число 5 дает энергию."}'
+    )
+    parts = [content[i:i + 20] for i in range(0, len(content), 20)]
+    text, progress = _stream_service(parts)
+    assert "⭐ *РЕЙТИНГ ДНЯ: 8/10*" in text and "🔢 *Влияние числа души (5):*" in text
+    assert progress[-1] == text
+    assert "РЕЙТИНГ ДНЯ" in progress[0] and "Совет дня" not in progress[0]
+
+
+if __name__ == "__main__":
+    test_throttled_edits()
+    test_long_final_text()
+    test_rejected_final_edit()
+    test_service_streaming()
+    test_structured_streaming()
+    print("✅ Потоковый вывод гороскопа работает корректно")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Тесты персонализации кеша гороскопов по числу души
+"""
+
+import asyncio
+
+from cache import get_horoscope_cache
+from conftest import SOURCE_TEXT, FakeGroq, make_service
+from horoscope_service_premium import PremiumHoroscopeService
+
+SIGN = "♌ Лев"
+
+
+def _user(soul: int) -> dict:
+    return {"zodiac": SIGN, "matrix": {"additional": [0, soul]}}
+
+
+def _premium() -> PremiumHoroscopeService:
+    service = PremiumHoroscopeService()
+    service._disk = None
+    get_horoscope_cache().clear()
+
+    async def parse_horoscopes(zodiac_sign, deadline=None):
+        return {"Mail.ru": SOURCE_TEXT}
+
+    service.parse_horoscopes = parse_horoscopes
+    return service
+
+
+def _twice(service):
+    """Гороскопы двух пользователей одного знака; второй запрос каждого — из кеша"""
+
+    async def run():
+        three = await service.get_daily_horoscope(_user(3))
+        seven = await service.get_daily_horoscope(_user(7))
+        return three, seven, await service.get_daily_horoscope(_user(3)), await service.get_daily_horoscope(_user(7))
+
+    return asyncio.run(run())
+
+
+def test_ai_horoscope_by_soul():
+    """AI-гороскоп первого пользователя знака не достается пользователю с другим числом души"""
+    service = make_service(FakeGroq())
+    three, seven, three_again, seven_again = _twice(service)
+    assert "Влияние числа души (3)" in three and "Влияние числа души (7)" in seven
+    assert three_again == three and seven_again == seven
+    assert len(service.groq_client.requests) == 2
+
+
+def test_premium_horoscope_by_soul():
+    """Премиум-гороскоп кешируется отдельно для каждого числа души"""
+    three, seven, three_again, seven_again = _twice(_premium())
+    assert "Ваше число души (3)" in three and "Ваше число души (7)" in seven
+    assert three_again == three and seven_again == seven
+
+
+if __name__ == "__main__":
+    test_ai_horoscope_by_soul()
+    test_premium_horoscope_by_soul()
+    print("✅ Персонализация кеша гороскопов работает корректно")
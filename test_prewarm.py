@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Тесты прогрева гороскопов
+"""
+
+import asyncio
+from datetime import datetime
+
+from conftest import FakeGroq, config_override, make_service
+from horoscope_fallback import daily_fallbacks
+from prewarm import ZODIAC_SIGNS, HoroscopePrewarmer, prewarm_variants, seconds_until_next_run
+
+
+class FakeService:
+    groq_client = "groq"
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_daily_horoscope(self, user_data):
+        self.calls.append(user_data)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if user_data["zodiac"] == "♋ Рак":
+            raise RuntimeError("источник недоступен")
+        return "гороскоп"
+
+
+def test_run_once():
+    """Все 12 знаков, ограниченная параллельность, ошибки учитываются"""
+    service = FakeService()
+    prewarmer = HoroscopePrewarmer(service, concurrency=3)
+    assert prewarmer.status()["state"] == "idle"
+
+    status = asyncio.run(prewarmer.run_once())
+    assert sorted(call["zodiac"] for call in service.calls) == sorted(ZODIAC_SIGNS)
+    assert service.max_active == 3
+    assert status["state"] == "done"
+    assert status["total"] == 12 and status["done"] == 11 and status["failed"] == 1
+    assert status["items"]["♋ Рак"] == "failed"
+    assert status["items"]["♌ Лев"] == "done"
+
+
+def test_fallbacks_prepared():
+    """Резервные гороскопы всех знаков строятся при прогреве, а не в первом запросе"""
+    day = datetime(2024, 3, 10, 0, 1)
+    daily_fallbacks.cache_clear()
+    prewarmer = HoroscopePrewarmer(FakeService(), clock=lambda: day)
+    asyncio.run(prewarmer.run_once())
+    assert daily_fallbacks.cache_info().currsize == 1
+    daily_fallbacks(day.date())
+    assert daily_fallbacks.cache_info().hits == 1
+
+
+def test_soul_number_variants():
+    """С числами души прогреваются все варианты знак × число души"""
+    variants = prewarm_variants(ZODIAC_SIGNS, range(1, 13))
+    assert len(variants) == 144
+    assert variants["♌ Лев / 7"] == {"zodiac": "♌ Лев", "matrix": {"additional": [0, 7]}}
+
+    service = FakeService()
+    prewarmer = HoroscopePrewarmer(service, signs=["♌ Лев"], soul_numbers=(3, 4), concurrency=2)
+    status = asyncio.run(prewarmer.run_once())
+    assert status["total"] == 2 and status["done"] == 2
+    assert [call["matrix"]["additional"][1] for call in service.calls] == [3, 4]
+
+
+class FakeBatchService(FakeService):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def get_daily_horoscopes(self, users):
+        self.batches.append([user["matrix"]["additional"][1] for user in users])
+        return ["гороскоп"] * len(users)
+
+
+def test_batched_variants():
+    """Сервис с пакетной генерацией получает все варианты знака одним вызовом"""
+    service = FakeBatchService()
+    prewarmer = HoroscopePrewarmer(service, signs=["♌ Лев", "♍ Дева"], soul_numbers=range(1, 6))
+    status = asyncio.run(prewarmer.run_once())
+    assert service.batches == [[1, 2, 3, 4, 5], [1, 2, 3, 4, 5]]
+    assert service.calls == []
+    assert status["done"] == 10 and status["items"]["♌ Лев / 3"] == "done"
+
+
+def _counting_service(groq):
+    service = make_service(groq)
+    parse = service.parse_horoscopes
+    service.parsed = []
+
+    async def parse_horoscopes(zodiac_sign, deadline=None):
+        service.parsed.append(zodiac_sign)
+        return await parse(zodiac_sign, deadline)
+
+    service.parse_horoscopes = parse_horoscopes
+    return service
+
+
+def test_single_variant_background():
+    """Без пачек (LLM_BATCH_SIZE=1) прогрев идет в фоновой очереди планировщика, а не в очереди пользователей"""
+    service = _counting_service(FakeGroq())
+    prewarmer = HoroscopePrewarmer(service, signs=["♌ Лев"], soul_numbers=(3, 7))
+    with config_override(LLM_BATCH_SIZE=1):
+        status = asyncio.run(prewarmer.run_once())
+    lanes = service.stats()["llm_scheduler"]["lanes"]
+    assert status["done"] == 2
+    assert lanes["background"]["granted"] == 2 and lanes["interactive"]["granted"] == 0
+    # Источники знака парсятся один раз на все его варианты
+    assert service.parsed == ["♌ Лев"]
+
+
+def test_without_groq():
+    """Без Groq прогреваются только знаки: гороскоп не зависит от числа души"""
+    service = _counting_service(None)
+    prewarmer = HoroscopePrewarmer(service, soul_numbers=range(1, 13))
+    status = asyncio.run(prewarmer.run_once())
+    assert status["total"] == 12 and status["done"] == 12
+    assert sorted(service.parsed) == sorted(ZODIAC_SIGNS)
+
+    seven = asyncio.run(service.get_daily_horoscope({"zodiac": "♌ Лев", "matrix": {"additional": [0, 7]}}))
+    assert seven == asyncio.run(service.get_daily_horoscope({"zodiac": "♌ Лев"}))
+    assert len(service.parsed) == 12
+
+
+def test_schedule():
+    """Следующий прогрев — вскоре после полуночи"""
+    assert seconds_until_next_run(datetime(2024, 3, 10, 23, 59, 0), 30) == 90
+    assert seconds_until_next_run(datetime(2024, 3, 10, 0, 0, 10), 30) == 24 * 3600 - 10 + 30
+
+
+if __name__ == "__main__":
+    test_run_once()
+    test_fallbacks_prepared()
+    test_soul_number_variants()
+    test_batched_variants()
+    test_single_variant_background()
+    test_without_groq()
+    test_schedule()
+    print("✅ Прогрев гороскопов работает корректно")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Тесты повторного использования AI-гороскопа при неизменных текстах источников
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+
+from cache import get_horoscope_cache
+from conftest import SOURCE_TEXT, FakeGroq, make_service
+from disk_cache import DiskCache
+from horoscope_service import content_key
+
+SIGN = "♌ Лев"
+USER = {"zodiac": SIGN, "matrix": {"additional": [0, 7]}}
+
+
+def test_content_key():
+    """Пробелы и порядок источников не важны, текст и персонализация — важны"""
+    key = content_key(SIGN, "soul7", {"Mail.ru": "Звезды  благоволят\nвам.", "Rambler": "День удачи."})
+    assert key == content_key(SIGN, "soul7", {"Rambler": " День удачи. ", "Mail.ru": "Звезды благоволят вам."})
+    assert key != content_key(SIGN, "soul7", {"Mail.ru": "Звезды благоволят вам.", "Rambler": "День удачи!"})
+    assert key != content_key(SIGN, "soul8", {"Mail.ru": "Звезды благоволят вам.", "Rambler": "День удачи."})
+    assert key != content_key("♍ Дева", "soul7", {"Mail.ru": "Звезды благоволят вам.", "Rambler": "День удачи."})
+
+
+def test_reuse_after_restart():
+    """После перезапуска те же тексты источников не отправляются модели повторно"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "horoscopes.sqlite3")
+
+        async def generate(sources, clear_day=False):
+            if clear_day:
+                # Готового гороскопа на сегодня нет — остается только кеш по текстам источников
+                conn = sqlite3.connect(path)
+                conn.execute("DELETE FROM horoscopes")
+                conn.commit()
+                conn.close()
+            disk = DiskCache(path)
+            # Новый сервис, как после перезапуска, с пустым кешем в памяти
+            service = make_service(FakeGroq(), sources, disk)
+            text = await service.get_daily_horoscope(USER)
+            await disk.flush()
+            disk.close()
+            return text, len(service.groq_client.requests), service.stats()["llm_today"]["reused"]
+
+        first, calls, _ = asyncio.run(generate({"Mail.ru": SOURCE_TEXT}))
+        assert calls == 1 and "РЕЙТИНГ ДНЯ: 8/10" in first
+
+        second, calls, reused = asyncio.run(generate({"Mail.ru": "  " + SOURCE_TEXT}, clear_day=True))
+        assert second == first and calls == 0 and reused == 1
+
+        _, calls, reused = asyncio.run(generate({"Mail.ru": SOURCE_TEXT + " Новое."}, clear_day=True))
+        assert calls == 1 and reused == 0
+
+
+def test_reuse_next_day():
+    """Вчерашний ответ по тем же текстам показывается с сегодняшней датой"""
+    service = make_service(FakeGroq())
+    first = asyncio.run(service.get_daily_horoscope(USER))
+    today = datetime.now()
+    yesterday = today - timedelta(days=1)
+
+    key = content_key(SIGN, service.personalization_key(USER), {"Mail.ru": SOURCE_TEXT})
+    date, text = service._generations.get(key)
+    assert text == first and today.strftime("%d.%m.%Y") in text
+    service._generations.set(key, (
+        yesterday.strftime("%Y-%m-%d"),
+        text.replace(today.strftime("%d.%m.%Y"), yesterday.strftime("%d.%m.%Y")),
+    ))
+    get_horoscope_cache().clear()
+
+    second = asyncio.run(service.get_daily_horoscope(USER))
+    assert second == first and len(service.groq_client.requests) == 1
+    # Повторно использованный ответ не считается вызовом модели
+    assert list(service.stats()["llm_calls"].values()) == [1]
+
+    service._generations.set(key, ((today - timedelta(days=30)).strftime("%Y-%m-%d"), text))
+    get_horoscope_cache().clear()
+    asyncio.run(service.get_daily_horoscope(USER))
+    assert len(service.groq_client.requests) == 2
+
+
+if __name__ == "__main__":
+    test_content_key()
+    test_reuse_after_restart()
+    test_reuse_next_day()
+    print("✅ Повторное использование AI-гороскопов работает корректно")
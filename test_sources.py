@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Тесты реестра источников гороскопов
+"""
+
+import asyncio
+
+from aiohttp import web
+
+from html_extract import Target
+from http_fetcher import HttpFetcher
+from sources import SOURCES, Source, SourceRegistry
+
+TEXT = "Сегодня звезды благоприятны для новых начинаний и смелых решений."
+
+
+def test_default_sources():
+    """Mail.ru и Rambler зарегистрированы, порядок — по весу"""
+    registry = SourceRegistry(http=HttpFetcher())
+    assert [s.name for s in registry.sources][:2] == ["Mail.ru", "Rambler"]
+    assert SOURCES["Mail.ru"].url("leo") == "https://horo.mail.ru/prediction/leo/today/"
+    page = f"<div data-mt-part='article'><p>{TEXT}</p><p>второй</p></div>"
+    assert SOURCES["Rambler"].extract(page) == TEXT
+
+
+def test_fetch_all():
+    """Все источники параллельно, под общим лимитом и в порядке веса"""
+    state = {"active": 0, "max_active": 0, "requests": 0}
+
+    async def page(request):
+        state["requests"] += 1
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        sign = request.match_info["sign"]
+        return web.Response(text=f"<article><p>{request.match_info['source']} {sign}: {TEXT}</p></article>",
+                            content_type="text/html")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/{source}/{sign}/", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        sources = {
+            name: Source(name, f"{base}/{name}/{{sign}}/", (Target("article"),), weight=weight, concurrency=1)
+            for name, weight in (("low", 0.1), ("high", 2.0), ("mid", 1.0), ("extra", 0.5))
+        }
+        registry = SourceRegistry(sources, HttpFetcher(), concurrency=2)
+        registry.cache.clear()
+        try:
+            texts = await registry.fetch_all("leo", deadline=5)
+            again = await registry.fetch_all("leo", deadline=5)
+        finally:
+            await registry.close()
+            await runner.cleanup()
+
+        assert list(texts) == ["high", "mid", "extra", "low"]
+        assert texts["mid"] == f"mid leo: {TEXT}"
+        assert state["max_active"] == 2
+        # Вовремя полученные тексты не кешируются: источники запрашиваются снова
+        assert again == texts and state["requests"] == 8
+
+    asyncio.run(scenario())
+
+
+def test_late_text_cached():
+    """Опоздавший к дедлайну текст используется следующим вызовом без нового запроса"""
+    requests = {"fast": 0, "slow": 0}
+
+    async def page(request):
+        source = request.match_info["source"]
+        requests[source] += 1
+        if source == "slow":
+            await asyncio.sleep(0.2)
+        return web.Response(text=f"<article><p>{source}: {TEXT}</p></article>", content_type="text/html")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/{source}/{sign}/", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        sources = {name: Source(name, f"{base}/{name}/{{sign}}/", (Target("article"),)) for name in requests}
+        registry = SourceRegistry(sources, HttpFetcher())
+        registry.cache.clear()
+        try:
+            first = await registry.fetch_all("leo", deadline=0.1)
+            await asyncio.sleep(0.3)
+            second = await registry.fetch_all("leo", deadline=0.1)
+        finally:
+            await registry.close()
+            await runner.cleanup()
+        assert list(first) == ["fast"]
+        assert list(second) == ["fast", "slow"]
+        assert requests == {"fast": 2, "slow": 1}
+
+    asyncio.run(scenario())
+
+
+def test_slow_source_does_not_block_others():
+    """Запросы к источнику, упершемуся в свой лимит, не занимают общие слоты"""
+    async def page(request):
+        if request.match_info["source"] == "slow":
+            await asyncio.sleep(0.3)
+        return web.Response(text=f"<article><p>{TEXT}</p></article>", content_type="text/html")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/{source}/{sign}/", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        slow = Source("slow", f"{base}/slow/{{sign}}/", (Target("article"),), concurrency=1)
+        fast = Source("fast", f"{base}/fast/{{sign}}/", (Target("article"),), concurrency=1)
+        registry = SourceRegistry({"slow": slow, "fast": fast}, HttpFetcher(), concurrency=2)
+        loop = asyncio.get_running_loop()
+        try:
+            slow_tasks = [asyncio.ensure_future(registry.fetch(slow, sign)) for sign in ("leo", "aries", "virgo")]
+            await asyncio.sleep(0.05)
+            started = loop.time()
+            assert await registry.fetch(fast, "leo") == TEXT
+            elapsed = loop.time() - started
+            await asyncio.gather(*slow_tasks)
+        finally:
+            await registry.close()
+            await runner.cleanup()
+        assert elapsed < 0.2
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_default_sources()
+    test_fetch_all()
+    test_late_text_cached()
+    test_slow_source_does_not_block_others()
+    print("✅ Реестр источников работает корректно")
@@ -6,6 +6,7 @@ import os
 import logging
 from aiohttp import web
 import asyncio
+from typing import Callable, Dict, Optional
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -28,17 +29,38 @@ async def root_handler(request):
     return web.Response(text="Mystic Numerology Bot is running! 🔮")
 
 
-def create_app():
+def create_app(
+    metrics: Optional[Callable[[], Dict]] = None,
+    prewarm: Optional[Callable[[], Dict]] = None,
+):
     """Создание aiohttp приложения"""
     app = web.Application()
     app.router.add_get('/health', health_check)
     app.router.add_get('/', root_handler)
+    
+    if metrics is not None:
+        async def metrics_handler(request):
+            """Метрики кешей и сервисов бота"""
+            return web.json_response(metrics())
+        
+        app.router.add_get('/metrics', metrics_handler)
+    
+    if prewarm is not None:
+        async def prewarm_handler(request):
+            """Прогресс прогрева гороскопов"""
+            return web.json_response(prewarm())
+        
+        app.router.add_get('/prewarm', prewarm_handler)
     return app
 
 
-async def start_web_server(port: int = 8080):
+async def start_web_server(
+    port: int = 8080,
+    metrics: Optional[Callable[[], Dict]] = None,
+    prewarm: Optional[Callable[[], Dict]] = None,
+):
     """Запуск веб-сервера"""
-    app = create_app()
+    app = create_app(metrics, prewarm)
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, '0.0.0.0', port)